@@ -0,0 +1,204 @@
+"""
+Offline benchmark suite of the library hot paths.
+
+    $ python benchmarks/run.py                       # run and compare against the baseline
+    $ python benchmarks/run.py --save                # store the results as the new baseline
+    $ python benchmarks/run.py -k builder -k merge   # run only the matching benchmarks
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connect.devops_testing import asserts  # noqa: E402
+from connect.devops_testing.request import Builder, Dispatcher  # noqa: E402
+from connect.devops_testing.standin import StandInClient  # noqa: E402
+from connect.devops_testing.utils import find_by_id, merge, request_parameters  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    def _register(setup: Callable[[], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return _register
+
+
+def _asset_request(params: int) -> dict:
+    return {
+        'id': 'PR-0000-0000-0000-001',
+        'type': 'purchase',
+        'status': 'approved',
+        'asset': {
+            'id': 'AS-0000-0000-0000',
+            'status': 'active',
+            'product': {'id': 'PRD-000-000-000'},
+            'params': [
+                {'id': f'PARAM_{n:05d}', 'type': 'text', 'value': f'value {n}', 'value_error': ''}
+                for n in range(params)
+            ],
+            'items': [{'id': f'ITEM_{n:05d}', 'mpn': f'MPN_{n:05d}', 'quantity': '1'} for n in range(params // 10)],
+        },
+    }
+
+
+SMALL = _asset_request(10)
+LARGE = _asset_request(5000)
+
+
+@benchmark('builder.small_chain')
+def _builder_small_chain():
+    def _run():
+        builder = Builder(SMALL).with_type('change').with_status('pending')
+        for n in range(5):
+            builder.with_asset_param(f'PARAM_{n:05d}', 'new value')
+        return builder.build()
+
+    return _run
+
+
+@benchmark('builder.large_chain')
+def _builder_large_chain():
+    def _run():
+        builder = Builder(LARGE).with_type('change').with_status('pending')
+        builder.with_asset_params([{'param_id': f'PARAM_{n:05d}', 'value': 'new'} for n in range(0, 5000, 50)])
+        return builder.build()
+
+    return _run
+
+
+@benchmark('utils.merge_large')
+def _merge_large():
+    override = {'asset': {'params': [{'id': 'PARAM_NEW', 'value': 'new'}]}}
+    return lambda: merge(LARGE, override)
+
+
+@benchmark('utils.find_by_id_large')
+def _find_by_id_large():
+    params = LARGE['asset']['params']
+    return lambda: find_by_id(params, 'PARAM_04999')
+
+
+@benchmark('utils.request_parameters_large')
+def _request_parameters_large():
+    params = LARGE['asset']['params']
+    return lambda: request_parameters(params)
+
+
+@benchmark('asserts.large_request')
+def _asserts_large_request():
+    def _run():
+        asserts.request_status(LARGE, 'approved')
+        asserts.asset_status(LARGE, 'active')
+        asserts.asset_param_value_equal(LARGE, 'PARAM_04999', 'value 4999')
+        asserts.asset_param_value_match(LARGE, 'PARAM_02500', r'^value \d+$')
+        asserts.asset_param_value_error_equal(LARGE, 'PARAM_01000', '')
+
+    return _run
+
+
+@benchmark('dispatcher.polling')
+def _dispatcher_polling():
+    dispatcher = Dispatcher(client=StandInClient(latency=0.001, pending_polls=3), timeout=0, max_attempts=10)
+    request = {key: value for key, value in SMALL.items() if key != 'id'}
+    request['status'] = 'pending'
+
+    def _run():
+        processed = dispatcher.provision_request(request)
+        assert processed['status'] == 'approved'
+        return processed
+
+    return _run
+
+
+def measure(operation: Callable[[], object], min_time: float = 0.5) -> dict:
+    """
+    Measures the throughput (repeating the operation at least ``min_time``
+    seconds) and the peak memory allocated by a single operation.
+    """
+    operation()
+
+    count, start = 0, time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        operation()
+        count += 1
+        elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'ops_per_sec': count / elapsed, 'memory_per_op': peak - baseline}
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if result['ops_per_sec'] < reference['ops_per_sec'] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:.1f} ops/sec is slower than baseline "
+                f"{reference['ops_per_sec']:.1f} ops/sec",
+            )
+        if result['memory_per_op'] > reference['memory_per_op'] * (1 + tolerance) + 1024:
+            regressions.append(
+                f"{name}: {result['memory_per_op']} bytes/op is more than baseline "
+                f"{reference['memory_per_op']} bytes/op",
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Runs the offline benchmark suite.')
+    parser.add_argument('-k', dest='patterns', action='append', default=[], help='Run only the matching benchmarks.')
+    parser.add_argument('--min-time', type=float, default=0.5, help='Min seconds each benchmark is repeated.')
+    parser.add_argument('--baseline', default=BASELINE, help='Baseline results file.')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed regression ratio.')
+    parser.add_argument('--save', action='store_true', help='Store the results as the new baseline.')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if args.patterns and not any(pattern in name for pattern in args.patterns):
+            continue
+        results[name] = measure(setup(), args.min_time)
+        reference = baseline.get(name, {}).get('ops_per_sec')
+        ratio = f'{results[name]["ops_per_sec"] / reference:6.2f}x' if reference else '     -'
+        print(
+            f'{name:<36} {results[name]["ops_per_sec"]:>12.1f} ops/sec '
+            f'{results[name]["memory_per_op"]:>12} bytes/op  {ratio}',
+        )
+
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump({**baseline, **results}, file, indent=2, sort_keys=True)
+            file.write('\n')
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
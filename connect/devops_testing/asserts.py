@@ -1,11 +1,28 @@
+"""
+Assert functions of the connect requests. The request given to any of them can
+be a dict or a ``models.Request``, the parameters of a Request are looked up by
+id through its index instead of a linear search.
+"""
 import operator
 import re
-from typing import Any, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple, TYPE_CHECKING, Union
 
+from connect.devops_testing import snapshot
+from connect.devops_testing.clock import Clock, SYSTEM_CLOCK
+from connect.devops_testing.models import Request
 from connect.devops_testing.utils import find_by_id
 
+if TYPE_CHECKING:  # pragma: no cover
+    from connect.devops_testing.request import Dispatcher
+
 ASSERT_FAIL = 'Assertion failed.'
 
+_TERMINAL_STATUSES = ('approved', 'failed', 'revoked')
+
+PATTERN_CACHE_SIZE = 512
+
 _MSG_PARAM_NOT_EQUAL = "{param_id} parameter value '{value}' is not equal to '{expected}'."
 _MSG_PARAM_IS_EQUAL = "{param_id} parameter value '{value}' is equal to '{expected}'."
 _MSG_PARAM_NOT_MATCH = "{param_id} parameter value '{value}' does not match expression '{expected}'."
@@ -15,11 +32,69 @@ _MSG_PARAM_ERROR_IS_EQUAL = "{param_id} parameter value error '{value}' is equal
 _MSG_PARAM_ERROR_NOT_MATCH = "{param_id} parameter value error '{value}' does not match '{expected}'."
 _MSG_PARAM_ERROR_NOT_CONTAIN = "{param_id} parameter value error '{value}' does not contain '{expected}'."
 
+_patterns: OrderedDict = OrderedDict()
+_registered_patterns: Dict[str, Pattern] = {}
+_patterns_lock = threading.Lock()
+
+
+def compile_pattern(pattern: Union[str, Pattern]) -> Pattern:
+    """
+    Provides the compiled regex of the given pattern from a bounded LRU cache
+    of PATTERN_CACHE_SIZE patterns, the registered patterns are never evicted.
+
+    :param pattern: Union[str, Pattern] The regex pattern.
+    :return: Pattern The compiled regex.
+    """
+    if not isinstance(pattern, str):
+        return pattern
+
+    compiled = _registered_patterns.get(pattern)
+    if compiled is not None:
+        return compiled
+
+    with _patterns_lock:
+        compiled = _patterns.get(pattern)
+        if compiled is not None:
+            _patterns.move_to_end(pattern)
+            return compiled
+
+    compiled = re.compile(pattern)
+    with _patterns_lock:
+        _patterns[pattern] = compiled
+        while len(_patterns) > PATTERN_CACHE_SIZE:
+            _patterns.popitem(last=False)
+    return compiled
+
+
+def register_patterns(patterns: Iterable[str]):
+    """
+    Compiles the given patterns ahead (for example at suite start) and keeps
+    them out of the LRU eviction, so the match asserts only cost the match.
+
+    :param patterns: Iterable[str] The regex patterns.
+    :return: None
+    """
+    compiled = {pattern: re.compile(pattern) for pattern in patterns}
+    with _patterns_lock:
+        _registered_patterns.update(compiled)
+
+
+def clear_patterns():
+    """
+    Removes all the cached and registered compiled patterns.
+
+    :return: None
+    """
+    with _patterns_lock:
+        _patterns.clear()
+        _registered_patterns.clear()
+
+
 __operators = {
     '==': operator.eq,
     '!=': operator.ne,
     'in': operator.contains,
-    'match': lambda value, pattern: re.search(pattern, value),
+    'match': lambda value, pattern: compile_pattern(pattern).search(value),
 }
 
 
@@ -236,3 +311,79 @@ def tier_configuration_param_value_error_contains(request: dict, param_id: str,
 
 def tier_configuration_param_value_error_match(request: dict, param_id: str, pattern: str):
     tier_configuration_param_value_error(request, param_id, 'match', pattern, _MSG_PARAM_ERROR_NOT_MATCH)
+
+
+def eventually(
+        assertion: Callable[..., None],
+        request: dict,
+        *args,
+        dispatcher: 'Dispatcher',
+        timeout: float = 60,
+        interval: float = 2,
+        clock: Optional[Clock] = None,
+        **kwargs,
+) -> dict:
+    """
+    Reloads the request through the dispatcher until the given assertion holds,
+    instead of waiting for the request to be processed. The last assertion error
+    is raised once the timeout expires or the request reaches a final status.
+
+    :param assertion: Callable The assert function, for example ``asset_param_value_equal``.
+    :param request: dict The request to evaluate (only id and type are required).
+    :param args: The assert function arguments after the request.
+    :param dispatcher: Dispatcher The request dispatcher used to reload the request.
+    :param timeout: float The max amount of seconds to wait for the assertion.
+    :param interval: float The amount of seconds between reloads.
+    :param clock: Optional[Clock] The clock used to wait, by default the clock of
+                  the dispatcher (or the system clock).
+    :param kwargs: The assert function keyword arguments.
+    :return: dict The reloaded request that satisfies the assertion.
+    """
+    if clock is None:
+        clock = getattr(dispatcher, 'clock', None)
+        clock = clock if isinstance(clock, Clock) else SYSTEM_CLOCK
+    deadline = clock.monotonic() + timeout
+
+    while True:
+        current = dispatcher.find_request(request, latest=True)
+        try:
+            assertion(current, *args, **kwargs)
+            return current
+        except AssertionError:
+            remaining = deadline - clock.monotonic()
+            if remaining <= 0 or current.get('status') in _TERMINAL_STATUSES:
+                raise
+
+        clock.sleep(min(interval, remaining))
+
+
+def request_snapshot(request: dict, golden: str, ignore: Optional[List[str]] = None, max_lines: int = 50):
+    """
+    Compares the request with the golden JSON file, the volatile paths given
+    as ignore rules (for example ``id``, ``**.created`` or
+    ``asset.params.*.value_error``) are removed from both sides. The golden
+    files are (re)written instead when CONNECT_UPDATE_SNAPSHOTS is enabled.
+
+    :param request: dict The request to compare.
+    :param golden: str The golden JSON file path.
+    :param ignore: Optional[List[str]] The ignore rules of the volatile paths.
+    :param max_lines: int Max amount of differences in the assertion message.
+    :return: None
+    """
+    rules = snapshot.compile_rules(ignore)
+    actual = snapshot.normalize(request.to_dict() if isinstance(request, Request) else request, rules)
+
+    if snapshot.should_update():
+        snapshot.write_golden(golden, actual)
+        return
+
+    expected = snapshot.read_golden(golden)
+    assert expected is not None, (
+        f"Golden file '{golden}' not found, run with {snapshot.UPDATE_SNAPSHOTS_ENV}=1 to create it."
+    )
+
+    differences = snapshot.diff(snapshot.normalize(expected, rules), actual)
+    assert not differences, '\n'.join([
+        f"Request does not match golden file '{golden}', {len(differences)} differences:",
+        *differences[:max_lines],
+    ])
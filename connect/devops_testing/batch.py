@@ -0,0 +1,176 @@
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from connect.devops_testing.asserts import compile_pattern
+from connect.devops_testing.utils import request_model
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    'in': operator.contains,
+    'match': lambda value, pattern: pattern.search(value),
+}
+
+
+class BatchResult:
+    def __init__(self, name: str, ids: List[str], passed: List[bool]):
+        """
+        Result of a predicate evaluated over a batch of requests.
+
+        :param name: str The description of the predicate.
+        :param ids: List[str] The ids of the batch requests.
+        :param passed: List[bool] The predicate result of each request.
+        """
+        self.name = name
+        self.total = len(passed)
+        self.passed = sum(passed)
+        self.failing_ids = [request_id for request_id, ok in zip(ids, passed) if not ok]
+
+    @property
+    def rate(self) -> float:
+        return self.passed / self.total if self.total else 1.0
+
+    def require(self, min_rate: float = 1.0, max_ids: int = 20):
+        """
+        Asserts that the pass rate is at least the given one.
+
+        :param min_rate: float The minimum pass rate between 0 and 1.
+        :param max_ids: int Max amount of failing ids in the assertion message.
+        :return: None
+        """
+        assert self.rate >= min_rate, (
+            f"{self.name}: pass rate {self.rate:.4%} is lower than {min_rate:.4%}, "
+            f"{len(self.failing_ids)} failing requests: {', '.join(self.failing_ids[:max_ids])}"
+        )
+
+    def __repr__(self):
+        return f'BatchResult({self.name!r}, passed={self.passed}, total={self.total})'
+
+
+class RequestBatch:
+    def __init__(self, requests: Iterable[dict]):
+        """
+        Columnar view of a batch of processed requests. The requests are
+        flattened once into columns (id, type, status, asset/configuration
+        status and the value and value error of each param by id) so the
+        predicates are evaluated across the whole batch without exceptions.
+        The params are the asset ones or the tier configuration request ones.
+
+        :param requests: Iterable[dict] The processed requests.
+        """
+        self.ids: List[str] = []
+        self._columns: Dict[str, List[Any]] = {'type': [], 'status': [], 'asset_status': []}
+        self._values: Dict[str, List[Any]] = {}
+        self._value_errors: Dict[str, List[Any]] = {}
+
+        for position, request in enumerate(requests):
+            self.ids.append(request.get('id'))
+            self._columns['type'].append(request.get('type'))
+            self._columns['status'].append(request.get('status'))
+
+            if request_model(request) == 'asset':
+                self._columns['asset_status'].append(request.get('asset', {}).get('status'))
+                params = request.get('asset', {}).get('params', [])
+            else:
+                # the tier configuration params are read from the request, as the request param asserts do.
+                self._columns['asset_status'].append(request.get('configuration', {}).get('status'))
+                params = request.get('params', [])
+
+            for param in params:
+                self._column(self._values, param['id'], position)[position] = _param_value(param)
+                self._column(self._value_errors, param['id'], position)[position] = param.get('value_error')
+
+        size = len(self.ids)
+        for column in [*self._values.values(), *self._value_errors.values()]:
+            column.extend([None] * (size - len(column)))
+
+    @staticmethod
+    def _column(columns: Dict[str, List[Any]], param_id: str, position: int) -> List[Any]:
+        column = columns.setdefault(param_id, [])
+        column.extend([None] * (position + 1 - len(column)))
+        return column
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def param_ids(self) -> List[str]:
+        return list(self._values)
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Provides the given request column: type, status or asset_status (the
+        tier configuration status for tier configuration requests).
+
+        :param name: str The column name.
+        :return: List[Any] The column values.
+        """
+        return self._columns[name]
+
+    def values(self, param_id: str) -> List[Any]:
+        return self._values.get(param_id, [None] * len(self))
+
+    def value_errors(self, param_id: str) -> List[Any]:
+        return self._value_errors.get(param_id, [None] * len(self))
+
+    def check(self, name: str, column: List[Any], predicate: Callable[[Any], bool]) -> BatchResult:
+        """
+        Evaluates the predicate over every value of the given column.
+
+        :param name: str The description of the predicate.
+        :param column: List[Any] The column values.
+        :param predicate: Callable[[Any], bool] The predicate.
+        :return: BatchResult The pass rate and failing ids.
+        """
+        return BatchResult(name, self.ids, [bool(predicate(value)) for value in column])
+
+    def status(self, expected: str) -> BatchResult:
+        return self.check(f'status == {expected}', self._columns['status'], lambda value: value == expected)
+
+    def asset_status(self, expected: str) -> BatchResult:
+        return self.check(f'asset status == {expected}', self._columns['asset_status'], lambda value: value == expected)
+
+    def param_not_empty(self, param_id: str) -> BatchResult:
+        return self.check(f'{param_id} is not empty', self.values(param_id), lambda value: value not in (None, '', []))
+
+    def param_value(self, param_id: str, operator_name: str, expected: Any) -> BatchResult:
+        """
+        Evaluates the given operator (``==``, ``!=``, ``in``, ``match``) over
+        the values of the given param. Checkbox params are compared as the list
+        of checked values against the ``|`` separated expected value.
+
+        :param param_id: str The param id.
+        :param operator_name: str The operator.
+        :param expected: Any The expected value.
+        :return: BatchResult The pass rate and failing ids.
+        """
+        fn = _OPERATORS[operator_name]
+        compared = compile_pattern(expected) if operator_name == 'match' else expected
+
+        def _predicate(value: Any) -> bool:
+            if isinstance(value, list) and isinstance(expected, str):
+                return fn(value, expected.split('|'))
+            try:
+                return fn('' if value is None else value, compared)
+            except TypeError:
+                return False
+
+        return self.check(f'{param_id} {operator_name} {expected}', self.values(param_id), _predicate)
+
+    def value_error_rates(self) -> Dict[str, float]:
+        """
+        Computes, for each param, the rate of requests with a value error.
+
+        :return: Dict[str, float] The value error rate by param id.
+        """
+        size = len(self) or 1
+        return {
+            param_id: sum(1 for value_error in column if value_error) / size
+            for param_id, column in self._value_errors.items()
+        }
+
+
+def _param_value(param: dict) -> Optional[Any]:
+    if param.get('type') == 'checkbox':
+        return [k for k, v in param.get('structured_value', {}).items() if v]
+    return param.get('value')
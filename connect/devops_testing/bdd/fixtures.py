@@ -1,9 +1,20 @@
-from typing import Any, Callable, Optional
+import logging
+from typing import Any, Callable, List, Optional, Union
 
 from behave import fixture
+from behave.model import Scenario
 from behave.runner import Context
 from connect.client import ConnectClient
+from connect.devops_testing.bdd.mappings import LayeredMapping, make_mapping, MappingSource
+from connect.devops_testing.bdd.profiling import StepProfiler
+from connect.devops_testing.bdd.store import RequestStore
+from connect.devops_testing.cache import RequestCache
+from connect.devops_testing.clock import Clock
+from connect.devops_testing.events import RequestEventListener
 from connect.devops_testing.fixtures import make_request_builder, make_request_dispatcher
+from faker import Faker
+
+_logger = logging.getLogger(__name__)
 
 
 @fixture
@@ -15,6 +26,11 @@ def use_connect_request_dispatcher(
         client: ConnectClient = None,
         timeout: Optional[int] = None,
         max_attempts: Optional[int] = None,
+        listener: Optional[RequestEventListener] = None,
+        cache: Optional[RequestCache] = None,
+        freshness: float = 0,
+        journal: Optional[str] = None,
+        clock: Optional[Clock] = None,
 ):
     """
     Provides a connect request provider into the behave Context object.
@@ -28,6 +44,16 @@ def use_connect_request_dispatcher(
                    instantiated
     :param timeout: int The timeout for waiting on each request refresh in seconds.
     :param max_attempts: int The max amount of time to refresh a request
+    :param listener: Optional[RequestEventListener] Optional started event
+                     listener to resolve processed requests on notification.
+    :param cache: Optional[RequestCache] Optional cache to reuse the processed
+                  result of identical new requests.
+    :param freshness: float The amount of seconds a found request is reused
+                      before calling again the Connect platform.
+    :param journal: Optional[str] Optional file path where the created
+                    requests are recorded for a later cleanup.
+    :param clock: Optional[Clock] Optional clock used to wait between request
+                  reloads, a VirtualClock never really sleeps.
     :return: None
     """
     context.connect = make_request_dispatcher(
@@ -37,53 +63,215 @@ def use_connect_request_dispatcher(
         client=client,
         timeout=timeout,
         max_attempts=max_attempts,
+        listener=listener,
+        cache=cache,
+        freshness=freshness,
+        journal=journal,
+        clock=clock,
     )
 
     use_connect_request_store(context)
 
 
 @fixture
-def use_connect_request_store(context: Context, store: Optional[dict] = None, reset: bool = False):
+def use_connect_request_store(
+        context: Context,
+        store: Optional[dict] = None,
+        reset: bool = False,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        keep_ids_only: bool = False,
+        spill: Optional[str] = None,
+):
     """
-    Provides a simple way initialize (or reset) the request store.
+    Provides a simple way initialize (or reset) the request store. The history
+    of the previous requests is only kept when a limit or ``keep_ids_only`` is
+    given. Resetting a RequestStore clears the current request but keeps that
+    history.
+
+    A given store is installed as is (the history options only apply to the
+    RequestStore created when no store is given), so pass a RequestStore to
+    keep a history of a provided initial state.
 
     :param context: Context
-    :param store: dict Provide the initial state of the store.
+    :param store: dict Provide the store itself, a dict or a RequestStore.
     :param reset: bool True to reset the request store.
+    :param max_entries: Optional[int] Max amount of previous requests kept in memory.
+    :param max_bytes: Optional[int] Max amount of bytes of the previous requests
+                      kept in memory.
+    :param keep_ids_only: bool True to keep only the ids of the previous requests.
+    :param spill: Optional[str] Directory where the evicted requests are written.
     :return: None
     """
-    if not hasattr(context, 'request') or reset:
-        context.request = {} if store is None else store
+    current = getattr(context, 'request', None)
+    if current is not None and not reset:
+        return
+
+    if store is None and isinstance(current, RequestStore):
+        current.reset()
+        return
+
+    if store is not None:
+        context.request = store
+        return
+
+    context.request = RequestStore(
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        keep_ids_only=keep_ids_only,
+        spill=spill,
+    )
 
 
 @fixture
 def use_connect_request_builder(
         context: Context,
-        parameters: Optional[dict] = None,
-        values: Optional[dict] = None,
-        shared: Optional[dict] = None,
+        parameters: Optional[Union[MappingSource, List[MappingSource]]] = None,
+        values: Optional[Union[MappingSource, List[MappingSource]]] = None,
+        shared: Optional[Union[MappingSource, List[MappingSource]]] = None,
 ):
     """
     Provides a connect request builder into the behave Context object.
 
     :param context: Context
-    :param parameters: Optional[dict] Key-Value dictionary with the key as
-                       param name and value as param id.
-    :param values: Optional[dict] Key-Value dictionary with replaces for the values.
-    :param shared: Optional[dict] Key-Value dictionary with replaces for the shared values.
+    :param parameters: Optional[Union[MappingSource, List[MappingSource]]] Key-Value
+                       dictionary (or mapping file path) with the key as param name
+                       and value as param id, a list of them is layered from base
+                       to most specific.
+    :param values: Optional[Union[MappingSource, List[MappingSource]]] Key-Value
+                   dictionary (or mapping file path) with replaces for the values.
+    :param shared: Optional[Union[MappingSource, List[MappingSource]]] Key-Value
+                   dictionary (or mapping file path) with replaces for the shared values.
     :return: None
     """
 
-    def _make_kv_repository(dictionary: Optional[dict]) -> Callable[[str], Any]:
-        dictionary = {} if dictionary is None else dictionary
-
+    def _make_kv_repository(mapping: LayeredMapping) -> Callable[[str], Any]:
         def _find_by_key(key: str) -> Any:
-            return dictionary.get(key, key)
+            return mapping.get(key, key)
 
         return _find_by_key
 
-    context.parameter = _make_kv_repository(parameters)
-    context.value = _make_kv_repository(values)
-    context.shared = _make_kv_repository(shared)
+    context.mappings = {
+        'parameters': make_mapping(parameters),
+        'values': make_mapping(values),
+        'shared': make_mapping(shared),
+    }
+
+    context.parameter = _make_kv_repository(context.mappings['parameters'])
+    context.value = _make_kv_repository(context.mappings['values'])
+    context.shared = _make_kv_repository(context.mappings['shared'])
 
     context.builder = make_request_builder()
+    context.background_snapshots = {}
+
+
+@fixture
+def use_connect_request_mappings(
+        context: Context,
+        parameters: Optional[MappingSource] = None,
+        values: Optional[MappingSource] = None,
+        shared: Optional[MappingSource] = None,
+):
+    """
+    Adds override layers to the mappings of the request builder (for example
+    on the before_feature hook), the layers are removed once the current
+    behave layer (feature or scenario) ends.
+
+    :param context: Context
+    :param parameters: Optional[MappingSource] The parameters override layer.
+    :param values: Optional[MappingSource] The values override layer.
+    :param shared: Optional[MappingSource] The shared values override layer.
+    :return: None
+    """
+    overrides = {'parameters': parameters, 'values': values, 'shared': shared}
+    overrides = {name: layer for name, layer in overrides.items() if layer is not None}
+
+    for name, layer in overrides.items():
+        context.mappings[name].push(layer)
+
+    yield
+
+    for name in overrides:
+        context.mappings[name].pop()
+
+
+def _steps_text(steps: list) -> str:
+    lines = []
+    for step in steps:
+        lines.append(f'{step.step_type.capitalize()} {step.name}')
+        if step.text is not None:
+            lines.extend(['"""', *str(step.text).splitlines(), '"""'])
+        if step.table is not None:
+            for cells in [step.table.headings, *[row.cells for row in step.table]]:
+                lines.append('| ' + ' | '.join(cell.replace('|', '\\|') for cell in cells) + ' |')
+    return '\n'.join(lines)
+
+
+@fixture
+def use_connect_request_background(context: Context, scenario: Scenario, seed: Optional[int] = None):
+    """
+    Runs the Background steps of the feature only once, snapshots the request
+    builder state and restores it on each scenario instead of running again the
+    Background steps. Must be used on the before_scenario hook, the Background
+    must only contain request building steps. Requires behave 1.3 or newer.
+
+    :param context: Context
+    :param scenario: Scenario The scenario about to run.
+    :param seed: Optional[int] Seed of the random data generated by the Background
+                 steps, so the snapshot is reproducible.
+    :return: None
+    """
+    background = scenario.background
+    if background is None or not background.steps:
+        return
+
+    if not hasattr(scenario, 'use_background'):
+        raise RuntimeError('Running the Background once requires behave 1.3 or newer.')
+
+    if not hasattr(context, 'background_snapshots'):
+        context.background_snapshots = {}
+
+    key = (background.filename, background.line)
+    if key not in context.background_snapshots:
+        if seed is not None:
+            Faker.seed(seed)
+        context.execute_steps(_steps_text(background.steps))
+        context.background_snapshots[key] = context.builder.copy()
+
+    context.builder = context.background_snapshots[key].copy()
+    scenario.use_background = False
+
+
+@fixture
+def use_step_profiler(
+        context: Context,
+        output: Optional[str] = None,
+        profile_steps: Optional[List[str]] = None,
+        memory: bool = False,
+        limit: Optional[int] = None,
+):
+    """
+    Provides a step profiler into the behave Context object as
+    ``context.step_profiler``. Its ``before_step``, ``after_step`` and
+    ``after_scenario`` methods must be called from the same behave hooks,
+    the reports are written (and logged) once the current behave layer ends.
+    The asserts module is restored even if the layer ends with an error.
+
+    :param context: Context
+    :param output: Optional[str] Directory of the timing reports and step profiles.
+    :param profile_steps: Optional[List[str]] Regex expressions of the step names
+                          to run under cProfile.
+    :param memory: bool True to also trace the memory of the profiled steps.
+    :param limit: Optional[int] Max amount of steps and scenarios in the reports.
+    :return: None
+    """
+    context.step_profiler = StepProfiler(output=output, profile_steps=profile_steps, memory=memory)
+    context.step_profiler.install(context)
+
+    try:
+        yield context.step_profiler
+    finally:
+        context.step_profiler.uninstall()
+
+    context.step_profiler.write_reports(limit)
+    _logger.info('Step timing report:\n%s', context.step_profiler.format_text(limit or 20))
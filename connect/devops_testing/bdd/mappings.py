@@ -0,0 +1,165 @@
+import csv
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from connect.devops_testing import serialization
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+
+def _load_json(path: str) -> dict:
+    with open(path, encoding='utf-8') as file:
+        return serialization.load(file)
+
+
+def _load_yaml(path: str) -> dict:
+    if yaml is None:  # pragma: no cover
+        raise ImportError('PyYAML is required to load YAML mapping files, install the yaml extra.')
+
+    with open(path, encoding='utf-8') as file:
+        return yaml.safe_load(file) or {}
+
+
+def _load_csv(path: str) -> dict:
+    with open(path, encoding='utf-8', newline='') as file:
+        return {row[0]: row[1] for row in csv.reader(file) if len(row) >= 2 and not row[0].startswith('#')}
+
+
+def _load_env(path: str) -> dict:
+    mapping = {}
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            key = key[len('export '):] if key.startswith('export ') else key
+            mapping[key.strip()] = value.strip().strip('\'"')
+    return mapping
+
+
+_LOADERS: Dict[str, Callable[[str], dict]] = {
+    '.json': _load_json,
+    '.yaml': _load_yaml,
+    '.yml': _load_yaml,
+    '.csv': _load_csv,
+    '.env': _load_env,
+}
+
+
+class FileMapping:
+    def __init__(self, path: str, check_interval: float = 1):
+        """
+        Key-Value mapping backed by a JSON, YAML, CSV (key, value rows) or
+        env file. The file is only loaded on the first lookup and reloaded
+        when its modification time changes.
+
+        :param path: str The mapping file path.
+        :param check_interval: float Minimum amount of seconds between two
+                               checks of the file modification time.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in _LOADERS and not os.path.basename(path).startswith('.env'):
+            raise ValueError(f'Unsupported mapping file {path}.')
+
+        self._path = path
+        self._loader = _LOADERS.get(extension, _load_env)
+        self._check_interval = check_interval
+        self._mapping: Optional[dict] = None
+        self._mtime: Optional[float] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def loaded(self) -> bool:
+        return self._mapping is not None
+
+    def _current(self) -> dict:
+        now = time.monotonic()
+        if self._mapping is not None and now - self._checked < self._check_interval:
+            return self._mapping
+
+        with self._lock:
+            mtime = os.stat(self._path).st_mtime
+            if self._mapping is None or mtime != self._mtime:
+                self._mapping = self._loader(self._path)
+                self._mtime = mtime
+            self._checked = now
+            return self._mapping
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._current().get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._current()
+
+
+MappingSource = Union[dict, str, FileMapping]
+
+
+class LayeredMapping:
+    def __init__(self, *layers: MappingSource):
+        """
+        Key-Value mapping composed by several layers (for example
+        base -> environment -> feature), the last layer containing a key
+        overrides the previous ones. File paths are loaded lazily.
+
+        :param layers: MappingSource The dictionaries, file paths or file mappings.
+        """
+        self._layers: List[Any] = [_make_layer(layer) for layer in layers]
+
+    def push(self, layer: MappingSource):
+        """
+        Adds a new override layer.
+
+        :param layer: MappingSource The dictionary, file path or file mapping.
+        :return: None
+        """
+        self._layers.append(_make_layer(layer))
+
+    def pop(self):
+        """
+        Removes the last override layer.
+
+        :return: None
+        """
+        self._layers.pop()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        for layer in reversed(self._layers):
+            if key in layer:
+                return layer.get(key)
+        return default
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in layer for layer in self._layers)
+
+
+def _make_layer(source: MappingSource) -> Union[dict, FileMapping]:
+    return FileMapping(source) if isinstance(source, str) else source
+
+
+def make_mapping(source: Optional[Union[MappingSource, List[MappingSource]]]) -> LayeredMapping:
+    """
+    Creates a layered mapping from a dictionary, a file path, a file mapping
+    or a list of them ordered from the base to the most specific layer.
+
+    :param source: Optional[Union[MappingSource, List[MappingSource]]] The mapping sources.
+    :return: LayeredMapping The layered mapping.
+    """
+    if isinstance(source, LayeredMapping):
+        return source
+    if source is None:
+        return LayeredMapping()
+    if isinstance(source, (list, tuple)):
+        return LayeredMapping(*source)
+    return LayeredMapping(source)
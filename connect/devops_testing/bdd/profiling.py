@@ -0,0 +1,266 @@
+import cProfile
+import functools
+import os
+import re
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from behave.model import Scenario, Step
+from behave.runner import Context
+from connect.devops_testing import asserts, serialization
+
+CATEGORIES = ('builder', 'dispatcher', 'asserts')
+
+
+class _StepRecord:
+    def __init__(self, step: Step, scenario: Optional[Scenario]):
+        self.name = f'{step.step_type.capitalize()} {step.name}'
+        self.location = f'{step.filename}:{step.line}'
+        self.scenario = scenario.name if scenario is not None else None
+        self.status = None
+        self.total = 0.0
+        self.categories = dict.fromkeys(CATEGORIES, 0.0)
+        self.memory = None
+
+    def to_dict(self) -> dict:
+        record = {
+            'step': self.name,
+            'location': self.location,
+            'scenario': self.scenario,
+            'status': self.status,
+            'total': self.total,
+            **self.categories,
+            'other': max(0.0, self.total - sum(self.categories.values())),
+        }
+        if self.memory is not None:
+            record['memory'] = self.memory
+        return record
+
+
+class _TimedProxy:
+    def __init__(self, target: Any, category: str, profiler: 'StepProfiler'):
+        self._target = target
+        self._category = category
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def _timed(*args, **kwargs):
+            result = self._profiler.timed(self._category, attribute, *args, **kwargs)
+            return self if result is self._target else result
+
+        return _timed
+
+
+class StepProfiler:
+    def __init__(
+            self,
+            output: Optional[str] = None,
+            profile_steps: Optional[List[str]] = None,
+            memory: bool = False,
+    ):
+        """
+        Records the wall time of each behave step, split into the time spent
+        in the request builder, in the request dispatcher (including the wait
+        for the processed request) and in the asserts.
+
+        :param output: Optional[str] Directory where the reports and the step
+                       profiles are written.
+        :param profile_steps: Optional[List[str]] Regex expressions of the step
+                              names to run under cProfile.
+        :param memory: bool True to also trace the memory allocated by the
+                       profiled steps with tracemalloc.
+        """
+        self._output = output
+        self._profile_steps = [re.compile(pattern) for pattern in profile_steps or []]
+        self._memory = memory
+        self._records: List[_StepRecord] = []
+        self._scenarios: List[dict] = []
+        self._current: Optional[_StepRecord] = None
+        self._active: Optional[str] = None
+        self._started = 0.0
+        self._profile: Optional[cProfile.Profile] = None
+        self._patched: Dict[str, Callable] = {}
+        self._tracing = False
+        self._scenario_offset = 0
+
+    @property
+    def records(self) -> List[dict]:
+        return [record.to_dict() for record in self._records]
+
+    def timed(self, category: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Calls the given function accounting its wall time into the given
+        category of the current step. Nested calls are accounted once.
+
+        :param category: str The category (builder, dispatcher or asserts).
+        :param func: Callable The function to call.
+        :return: Any The function result.
+        """
+        if self._current is None or self._active is not None:
+            return func(*args, **kwargs)
+
+        self._active = category
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._current.categories[category] += time.perf_counter() - start
+            self._active = None
+
+    def install(self, context: Context):
+        """
+        Instruments the asserts module and the builder and dispatcher of the
+        given behave context. The asserts module is patched process-wide until
+        ``uninstall`` is called.
+
+        :param context: Context
+        :return: None
+        """
+        try:
+            for name, func in list(vars(asserts).items()):
+                if name.startswith('_') or not callable(func) or getattr(func, '__module__', None) != asserts.__name__:
+                    continue
+                self._patched[name] = func
+                setattr(asserts, name, functools.partial(self.timed, 'asserts', func))
+            self._wrap(context)
+        except Exception:
+            self.uninstall()
+            raise
+
+    def uninstall(self):
+        """
+        Restores the original asserts module functions and stops the memory
+        tracing started by the profiler.
+
+        :return: None
+        """
+        for name, func in self._patched.items():
+            setattr(asserts, name, func)
+        self._patched = {}
+
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def _wrap(self, context: Context):
+        for attribute, category in (('builder', 'builder'), ('connect', 'dispatcher')):
+            target = getattr(context, attribute, None)
+            if target is not None and not isinstance(target, _TimedProxy):
+                setattr(context, attribute, _TimedProxy(target, category, self))
+
+    def _should_profile(self, record: _StepRecord) -> bool:
+        return any(pattern.search(record.name) for pattern in self._profile_steps)
+
+    def before_step(self, context: Context, step: Step):
+        self._wrap(context)
+        self._current = _StepRecord(step, getattr(context, 'scenario', None))
+
+        if self._should_profile(self._current):
+            if self._memory:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._tracing = True
+                tracemalloc.clear_traces()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        self._started = time.perf_counter()
+
+    def after_step(self, context: Context, step: Step):
+        if self._current is None:
+            return
+
+        record = self._current
+        record.total = time.perf_counter() - self._started
+        record.status = step.status.name if hasattr(step.status, 'name') else str(step.status)
+
+        if self._profile is not None:
+            self._profile.disable()
+            self._dump_profile(record)
+            self._profile = None
+
+        self._records.append(record)
+        self._current = None
+
+    def after_scenario(self, context: Context, scenario: Scenario):
+        records = self._records[self._scenario_offset:]
+        self._scenario_offset = len(self._records)
+        self._scenarios.append({
+            'scenario': scenario.name,
+            'location': f'{scenario.filename}:{scenario.line}',
+            'total': sum(record.total for record in records),
+            **{category: sum(record.categories[category] for record in records) for category in CATEGORIES},
+        })
+
+    def _dump_profile(self, record: _StepRecord):
+        if self._memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            record.memory = {'current': current, 'peak': peak}
+
+        if self._output is None:
+            return
+
+        os.makedirs(self._output, exist_ok=True)
+        name = re.sub(r'[^\w.-]+', '_', record.location)
+        self._profile.dump_stats(os.path.join(self._output, f'{name}.prof'))
+
+        if self._memory and tracemalloc.is_tracing():
+            statistics = tracemalloc.take_snapshot().statistics('lineno')[:25]
+            with open(os.path.join(self._output, f'{name}.memory.txt'), 'w', encoding='utf-8') as file:
+                file.writelines(f'{statistic}\n' for statistic in statistics)
+
+    def report(self, limit: Optional[int] = None) -> dict:
+        """
+        Builds the report of the slowest steps and scenarios.
+
+        :param limit: Optional[int] Max amount of steps and scenarios.
+        :return: dict The report with the sorted steps and scenarios.
+        """
+        steps = sorted(self.records, key=lambda record: record['total'], reverse=True)
+        scenarios = sorted(self._scenarios, key=lambda scenario: scenario['total'], reverse=True)
+        return {'steps': steps[:limit], 'scenarios': scenarios[:limit]}
+
+    def format_text(self, limit: int = 20) -> str:
+        """
+        Formats the report of the slowest steps and scenarios as text.
+
+        :param limit: int Max amount of steps and scenarios.
+        :return: str The text report.
+        """
+        report = self.report(limit)
+        header = f"{'total':>9} {'builder':>9} {'dispatch':>9} {'asserts':>9} {'other':>9}  step"
+        lines = [f'Slowest {len(report["steps"])} steps:', header]
+        for step in report['steps']:
+            lines.append(
+                f"{step['total']:9.3f} {step['builder']:9.3f} {step['dispatcher']:9.3f} "
+                f"{step['asserts']:9.3f} {step['other']:9.3f}  {step['step']} ({step['location']})",
+            )
+
+        lines.extend(['', f'Slowest {len(report["scenarios"])} scenarios:'])
+        for scenario in report['scenarios']:
+            lines.append(f"{scenario['total']:9.3f}  {scenario['scenario']} ({scenario['location']})")
+
+        return '\n'.join(lines)
+
+    def write_reports(self, limit: Optional[int] = None):
+        """
+        Writes the step-timing.json and step-timing.txt reports into the
+        output directory.
+
+        :param limit: Optional[int] Max amount of steps and scenarios.
+        :return: None
+        """
+        if self._output is None:
+            return
+
+        os.makedirs(self._output, exist_ok=True)
+        with open(os.path.join(self._output, 'step-timing.json'), 'w', encoding='utf-8') as file:
+            serialization.dump(self.report(limit), file, indent=True)
+        with open(os.path.join(self._output, 'step-timing.txt'), 'w', encoding='utf-8') as file:
+            file.write(self.format_text(limit or 20) + '\n')
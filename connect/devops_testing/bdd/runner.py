@@ -0,0 +1,210 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from connect.devops_testing import serialization
+
+_SCENARIO_KEYWORDS = ('Scenario:', 'Scenario Outline:', 'Scenario Template:', 'Example:')
+_JUNIT_COUNTERS = (('errors', 'error'), ('failures', 'failure'), ('skipped', 'skipped'))
+_WORKER_ENV = 'CONNECT_DEVOPS_WORKER'
+
+
+def discover_features(paths: List[str]) -> List[str]:
+    """
+    Finds all the feature files in the given paths.
+
+    :param paths: List[str] The feature files or directories.
+    :return: List[str] The sorted list of feature files.
+    """
+    features = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            features.extend(str(feature) for feature in sorted(path.rglob('*.feature')))
+        else:
+            features.append(str(path))
+    return features
+
+
+def discover_scenarios(feature: str) -> List[str]:
+    """
+    Finds all the scenarios of the given feature file as behave
+    ``path:line`` locations.
+
+    :param feature: str The feature file.
+    :return: List[str] The scenario locations.
+    """
+    with open(feature, encoding='utf-8') as file:
+        return [
+            f'{feature}:{number}'
+            for number, line in enumerate(file, start=1)
+            if line.strip().startswith(_SCENARIO_KEYWORDS)
+        ]
+
+
+def shard(units: List[str], workers: int) -> List[List[str]]:
+    """
+    Splits the features (or scenarios) across the given amount of workers.
+
+    :param units: List[str] The features or scenario locations.
+    :param workers: int The amount of workers.
+    :return: List[List[str]] The non-empty shards.
+    """
+    shards = [units[worker::workers] for worker in range(max(1, workers))]
+    return [units for units in shards if units]
+
+
+def _pick_executed(candidates: list, is_skipped) -> list:
+    """
+    Picks, position by position, the element executed by some worker over
+    the copies the other workers reported as skipped.
+    """
+    picked = list(candidates[0])
+    for elements in candidates[1:]:
+        for position, element in enumerate(elements[:len(picked)]):
+            if is_skipped(picked[position]) and not is_skipped(element):
+                picked[position] = element
+    return picked
+
+
+def merge_json_reports(reports: List[str]) -> list:
+    """
+    Merges the behave json reports of all the workers. Features reported
+    by several workers are merged keeping the executed scenarios.
+
+    :param reports: List[str] The json report files.
+    :return: list The merged list of features.
+    """
+    features: Dict[str, List[dict]] = {}
+    for report in reports:
+        if os.path.exists(report) and os.path.getsize(report) > 0:
+            with open(report, encoding='utf-8') as file:
+                for feature in serialization.load(file):
+                    features.setdefault(feature.get('location'), []).append(feature)
+
+    merged = []
+    for copies in features.values():
+        feature = copies[0]
+        feature['elements'] = _pick_executed(
+            [copy.get('elements', []) for copy in copies],
+            lambda element: element.get('status') == 'skipped',
+        )
+        statuses = {element.get('status') for element in feature['elements']}
+        feature['status'] = next((s for s in ('failed', 'error', 'passed') if s in statuses), feature.get('status'))
+        merged.append(feature)
+
+    return merged
+
+
+def merge_junit_reports(directories: List[str], output: str):
+    """
+    Merges the behave junit reports of all the workers into the output
+    directory. Test suites of the same feature reported by several workers
+    are merged keeping the executed test cases.
+
+    :param directories: List[str] The junit directories of each worker.
+    :param output: str The output directory.
+    :return: None
+    """
+    suites: Dict[str, List[ElementTree.Element]] = {}
+    for directory in directories:
+        for report in sorted(Path(directory).glob('*.xml')):
+            suites.setdefault(report.name, []).append(ElementTree.parse(report).getroot())
+
+    os.makedirs(output, exist_ok=True)
+    for name, copies in suites.items():
+        suite = copies[0]
+        cases = _pick_executed(
+            [list(copy.iter('testcase')) for copy in copies],
+            lambda case: case.find('skipped') is not None,
+        )
+        for case in list(suite):
+            suite.remove(case)
+        suite.extend(cases)
+
+        suite.set('tests', str(len(cases)))
+        for counter, tag in _JUNIT_COUNTERS:
+            suite.set(counter, str(sum(1 for case in cases if case.find(tag) is not None)))
+        suite.set('time', str(sum(float(case.get('time', 0)) for case in cases)))
+
+        ElementTree.ElementTree(suite).write(os.path.join(output, name), encoding='utf-8', xml_declaration=True)
+
+
+def _run_worker(worker: int, units: List[str], workdir: str, behave_args: List[str]) -> subprocess.CompletedProcess:
+    command = [
+        sys.executable, '-m', 'behave', *units,
+        '--junit', '--junit-directory', os.path.join(workdir, f'junit-{worker}'),
+        '--format', 'json', '--outfile', os.path.join(workdir, f'report-{worker}.json'),
+        '--format', 'progress',
+        *behave_args,
+    ]
+    return subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+        env={**os.environ, _WORKER_ENV: str(worker)},
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the behave features sharded across several worker processes. Each
+    worker runs its own ``features/environment.py`` so the connect request
+    fixtures are isolated per worker, the worker number is available in
+    the CONNECT_DEVOPS_WORKER environment variable.
+
+    :param argv: Optional[List[str]] The command line arguments, the ones after
+                 ``--`` are passed to each behave worker.
+    :return: int The exit code, 0 if all the workers succeed.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    behave_args = argv[argv.index('--') + 1:] if '--' in argv else []
+    argv = argv[:argv.index('--')] if '--' in argv else argv
+
+    parser = argparse.ArgumentParser(
+        prog='connect-devops-behave',
+        description='Runs behave features in parallel worker processes.',
+    )
+    parser.add_argument('paths', nargs='*', default=['features'], help='Feature files or directories.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Amount of worker processes.')
+    parser.add_argument('--shard-by', choices=['feature', 'scenario'], default='feature', help='Sharding unit.')
+    parser.add_argument('--junit-directory', default=None, help='Directory of the merged junit reports.')
+    parser.add_argument('--json-output', default=None, help='File of the merged json report.')
+    args = parser.parse_args(argv)
+
+    units = discover_features(args.paths)
+    if args.shard_by == 'scenario':
+        units = [scenario for feature in units for scenario in discover_scenarios(feature)]
+
+    shards = shard(units, args.workers)
+    if not shards:
+        print('No features found.')
+        return 1
+
+    with tempfile.TemporaryDirectory() as workdir:
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            results = list(executor.map(
+                lambda worker: _run_worker(worker, shards[worker], workdir, behave_args),
+                range(len(shards)),
+            ))
+
+        for worker, result in enumerate(results):
+            print(f'--- worker {worker} ({len(shards[worker])} {args.shard_by}s) exit code {result.returncode}')
+            print(result.stdout)
+
+        if args.json_output is not None:
+            reports = [os.path.join(workdir, f'report-{worker}.json') for worker in range(len(shards))]
+            with open(args.json_output, 'w', encoding='utf-8') as file:
+                serialization.dump(merge_json_reports(reports), file, indent=True)
+
+        if args.junit_directory is not None:
+            directories = [os.path.join(workdir, f'junit-{worker}') for worker in range(len(shards))]
+            merge_junit_reports(directories, args.junit_directory)
+
+    return max(result.returncode for result in results)
@@ -2,8 +2,10 @@ from behave import step
 from behave.runner import Context
 
 from collections.abc import Callable
+from concurrent.futures import Future, wait
+from copy import deepcopy
 
-from connect.devops_testing import asserts
+from connect.devops_testing import asserts, serialization
 from connect.devops_testing.utils import request_model
 
 
@@ -20,18 +22,48 @@ def _get_request_handler(asset: Callable, tier_config: Callable, request_type: s
     return strategies.get(request_type)
 
 
-def _request_is_process(context: Context):
+def _await_request(context: Context):
+    if isinstance(context.request, Future):
+        context.request = context.request.result()
+        print(f"Processed request id: {context.request.get('id')}")
+
+
+def _build_request(context: Context):
+    _await_request(context)
     if isinstance(context.request, dict) and context.request.get('id') is not None:
         context.builder.with_id(context.request.get('id'))
 
     context.request.update(context.builder.build())
+
+
+def _request_is_process(context: Context):
+    _build_request(context)
     context.request.update(context.connect.provision_request(
         request=context.request,
     ))
     print(f"Processed request id: {context.request.get('id')}")
 
 
+def _request_is_submitted(context: Context):
+    _build_request(context)
+    store = context.request
+    deferred = Future()
+
+    def _resolve(submitted: Future):
+        try:
+            store.update(submitted.result())
+            deferred.set_result(store)
+        except Exception as e:
+            deferred.set_exception(e)
+
+    context.connect.submit_request(request=deepcopy(dict(store))).add_done_callback(_resolve)
+    context.request = deferred
+    # a submission nobody awaited must not update the store during the next scenario.
+    context.add_cleanup(wait, [deferred])
+
+
 def _request_schedule(context: Context):
+    _await_request(context)
     context.request.update(context.connect.schedule_request(
         request=context.request,
     ))
@@ -39,6 +71,7 @@ def _request_schedule(context: Context):
 
 
 def _request_revoke(context: Context):
+    _await_request(context)
     context.request.update(context.connect.revoke_request(
         request=context.request,
     ))
@@ -69,6 +102,32 @@ def _with_parameter_without_value(context: Context, parameter: str):
     handler(param_id=context.parameter(parameter))
 
 
+def _parameter_row_value(context: Context, row) -> dict:
+    value = (row.get('value') or '').strip()
+    value_error = (row.get('value_error') or '').strip()
+    value_type = (row.get('type') or '').strip() or 'text'
+    checked = (row.get('checked') or '').strip().lower()
+
+    if checked:
+        value_type = 'checkbox'
+
+    if not value:
+        value = None
+    elif value_type == 'checkbox':
+        value = {context.value(v): checked not in ('false', 'no', '0') for v in value.split('|')}
+    elif value.startswith(('{', '[')):
+        value = serialization.loads(value)
+    else:
+        value = context.value(value)
+
+    return {
+        'param_id': context.parameter(row['id'].strip()),
+        'value': value,
+        'value_error': context.value(value_error) if value_error else None,
+        'value_type': value_type,
+    }
+
+
 def _with_item(context: Context, item_id: str, item_mpn: str, quantity: str):
     context.builder.with_asset_item(
         item_id=context.shared(item_id),
@@ -82,6 +141,21 @@ def request_is_processed(context: Context):
     _request_is_process(context)
 
 
+@step('request is submitted')
+def request_is_submitted(context: Context):
+    _request_is_submitted(context)
+
+
+@step('subscription request is submitted')
+def subscription_request_is_submitted(context: Context):
+    _request_is_submitted(context)
+
+
+@step('tier configuration request is submitted')
+def tier_configuration_request_is_submitted(context: Context):
+    _request_is_submitted(context)
+
+
 @step('subscription request is being scheduled')
 def request_is_being_scheduled(context: Context):
     _request_schedule(context)
@@ -280,6 +354,17 @@ def with_parameter_without_value_error(context: Context, parameter: str):
     _with_parameter_without_value(context, parameter)
 
 
+@step('request with parameters')
+def with_parameters(context: Context):
+    handler = _get_request_handler(
+        asset=context.builder.with_asset_params,
+        tier_config=context.builder.with_tier_configuration_params,
+        request_type=context.builder.request_type(),
+    )
+
+    handler([_parameter_row_value(context, row) for row in context.table])
+
+
 @step('request with item "{item_id}" with mpn "{item_mpn}" x{quantity}')
 def with_item_quantity(context: Context, item_id: str, item_mpn: str, quantity: str):
     _with_item(context, item_id, item_mpn, quantity)
@@ -293,6 +378,7 @@ def with_items(context: Context):
 
 @step('request parameter "{parameter}" value is "{value}"')
 def parameter_value_is(context: Context, parameter: str, value: str):
+    _await_request(context)
     handler = _get_request_handler(
         asset=asserts.asset_param_value_equal,
         tier_config=asserts.request_param_value_equal,
@@ -308,6 +394,7 @@ def parameter_value_is(context: Context, parameter: str, value: str):
 
 @step('request parameter "{parameter}" value contains "{value}"')
 def parameter_value_contains(context: Context, parameter: str, value: str):
+    _await_request(context)
     handler = _get_request_handler(
         asset=asserts.asset_param_value_contains,
         tier_config=asserts.request_param_value_contains,
@@ -323,6 +410,7 @@ def parameter_value_contains(context: Context, parameter: str, value: str):
 
 @step('request parameter "{parameter}" value match "{pattern}"')
 def parameter_value_match(context: Context, parameter: str, pattern: str):
+    _await_request(context)
     handler = _get_request_handler(
         asset=asserts.asset_param_value_match,
         tier_config=asserts.request_param_value_match,
@@ -338,6 +426,7 @@ def parameter_value_match(context: Context, parameter: str, pattern: str):
 
 @step('request parameter "{parameter}" value error is "{value_error}"')
 def parameter_value_error_is(context: Context, parameter: str, value_error: str):
+    _await_request(context)
     handler = _get_request_handler(
         asset=asserts.asset_param_value_error_equal,
         tier_config=asserts.request_param_value_error_equal,
@@ -353,6 +442,7 @@ def parameter_value_error_is(context: Context, parameter: str, value_error: str)
 
 @step('request parameter "{parameter}" value error contains "{value_error}"')
 def parameter_value_error_contains(context: Context, parameter: str, value_error: str):
+    _await_request(context)
     handler = _get_request_handler(
         asset=asserts.asset_param_value_error_contains,
         tier_config=asserts.request_param_value_error_contains,
@@ -368,6 +458,7 @@ def parameter_value_error_contains(context: Context, parameter: str, value_error
 
 @step('request parameter "{parameter}" value error match "{pattern}"')
 def parameter_value_error_match(context: Context, parameter: str, pattern: str):
+    _await_request(context)
     handler = _get_request_handler(
         asset=asserts.asset_param_value_error_match,
         tier_config=asserts.request_param_value_error_match,
@@ -383,14 +474,17 @@ def parameter_value_error_match(context: Context, parameter: str, pattern: str):
 
 @step('request status is "{request_status}"')
 def request_status_is(context: Context, request_status):
+    _await_request(context)
     asserts.request_status(context.request, request_status)
 
 
 @step('request reason is "{reason}"')
 def request_reason_is(context: Context, reason: str):
+    _await_request(context)
     asserts.request_reason(context.request, context.value(reason))
 
 
 @step('request note is "{note}"')
 def request_note_is(context: Context, note: str):
+    _await_request(context)
     asserts.request_note(context.request, context.value(note))
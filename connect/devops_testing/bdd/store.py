@@ -0,0 +1,158 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from connect.devops_testing import serialization
+
+
+class RequestStore(dict):
+    def __init__(
+            self,
+            *args,
+            max_entries: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            keep_ids_only: bool = False,
+            spill: Optional[str] = None,
+            **kwargs,
+    ):
+        """
+        Request store of the behave context. The store itself is the current
+        request. Optionally, every change of a request with id (through
+        ``update`` or item assignment) is also recorded into a bounded history
+        of the previous requests, so the previous requests remain available to
+        later steps on long runs. The history is off unless a limit is given
+        or ``keep_ids_only`` is enabled, then the store is a plain dict. A copy
+        of the store gets its own lock.
+
+        :param max_entries: Optional[int] Max amount of requests kept in memory,
+                            the least recently updated ones are evicted first.
+        :param max_bytes: Optional[int] Max amount of bytes of the serialized
+                          requests kept in memory.
+        :param keep_ids_only: bool True to keep only the ids of the previous
+                              requests, not their payload (at most ``max_entries``
+                              ids when given).
+        :param spill: Optional[str] Directory where the evicted requests are
+                      written so they can be recalled later.
+        """
+        super().__init__(*args, **kwargs)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._keep_ids_only = keep_ids_only
+        self._keep_payloads = not keep_ids_only and (max_entries is not None or max_bytes is not None)
+        self._spill = spill
+        self._ids: OrderedDict = OrderedDict()
+        self._history: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        return type(self), (dict(self),), self.__getstate__()
+
+    def __getstate__(self) -> dict:
+        with self._lock:
+            state = {key: value for key, value in vars(self).items() if key != '_lock'}
+            state['_ids'] = OrderedDict(self._ids)
+            state['_history'] = OrderedDict(self._history)
+        return state
+
+    def __setstate__(self, state: dict):
+        vars(self).update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._record()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._record()
+
+    def reset(self):
+        """
+        Clears the current request keeping the history of previous requests.
+
+        :return: None
+        """
+        self.clear()
+
+    def ids(self) -> List[str]:
+        """
+        Lists the ids of all the recorded requests, from the oldest to the
+        most recently updated.
+
+        :return: List[str] The recorded request ids.
+        """
+        with self._lock:
+            return list(self._ids)
+
+    def recall(self, request_id: str) -> Optional[dict]:
+        """
+        Recalls a previously recorded request by id, from memory or from the
+        spill directory.
+
+        :param request_id: str The request id.
+        :return: Optional[dict] The request or None if it is not available.
+        """
+        with self._lock:
+            serialized = self._history.get(request_id)
+
+        if serialized is not None:
+            return serialization.loads(serialized)
+
+        path = self._spill_path(request_id)
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                return serialization.load(file)
+
+        return None
+
+    def _spill_path(self, request_id: str) -> Optional[str]:
+        if self._spill is None:
+            return None
+        return os.path.join(self._spill, re.sub(r'[^\w.-]+', '_', request_id) + '.json')
+
+    def _record(self):
+        request_id = self.get('id')
+        if request_id is None or not (self._keep_payloads or self._keep_ids_only):
+            return
+
+        serialized = serialization.dumps(dict(self), default=str) if self._keep_payloads else None
+
+        with self._lock:
+            self._ids.pop(request_id, None)
+            self._ids[request_id] = None
+            if self._keep_ids_only and self._max_entries is not None:
+                while len(self._ids) > self._max_entries:
+                    self._ids.popitem(last=False)
+
+            previous = self._history.pop(request_id, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            if serialized is not None:
+                self._history[request_id] = serialized
+                self._size += len(serialized)
+
+            self._evict()
+
+    def _is_over_limit(self) -> bool:
+        over_entries = self._max_entries is not None and len(self._history) > self._max_entries
+        over_bytes = self._max_bytes is not None and self._size > self._max_bytes
+        return over_entries or over_bytes
+
+    def _evict(self):
+        while self._history and self._is_over_limit():
+            request_id, serialized = self._history.popitem(last=False)
+            self._size -= len(serialized)
+
+            path = self._spill_path(request_id)
+            if path is not None:
+                os.makedirs(self._spill, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as file:
+                    file.write(serialized)
@@ -0,0 +1,109 @@
+import sqlite3
+import threading
+import time
+from abc import abstractmethod
+from copy import deepcopy
+from typing import Optional
+
+from connect.devops_testing import serialization
+
+
+class RequestCache:
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Stores processed requests by request fingerprint.
+
+        :param ttl: Optional[float] The amount of seconds an entry is valid,
+                    None to keep the entries forever.
+        """
+        self._ttl = ttl
+
+    def _is_expired(self, created: float) -> bool:
+        return self._ttl is not None and time.time() - created > self._ttl
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:  # pragma: no cover
+        """
+        Get the processed request stored for the given key.
+
+        :param key: str The request fingerprint.
+        :return: Optional[dict] The processed request or None if missing or expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, request: dict):  # pragma: no cover
+        """
+        Store the processed request for the given key.
+
+        :param key: str The request fingerprint.
+        :param request: dict The processed request.
+        :return: None
+        """
+
+
+class MemoryCache(RequestCache):
+    def __init__(self, ttl: Optional[float] = None):
+        super().__init__(ttl)
+        self._entries = {}
+
+    def get(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        created, request = entry
+        if self._is_expired(created):
+            self._entries.pop(key, None)
+            return None
+
+        return deepcopy(request)
+
+    def set(self, key: str, request: dict):
+        self._entries[key] = (time.time(), deepcopy(request))
+
+
+class SQLiteCache(RequestCache):
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Stores processed requests into a local SQLite file so they can be
+        reused across test runs.
+
+        :param path: str The SQLite database file path.
+        :param ttl: Optional[float] The amount of seconds an entry is valid.
+        """
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS requests (key TEXT PRIMARY KEY, created REAL, request TEXT)',
+            )
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT created, request FROM requests WHERE key = ?',
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        created, request = row
+        if self._is_expired(created):
+            with self._lock, self._connection:
+                self._connection.execute('DELETE FROM requests WHERE key = ?', (key,))
+            return None
+
+        return serialization.loads(request)
+
+    def set(self, key: str, request: dict):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO requests (key, created, request) VALUES (?, ?, ?)',
+                (key, time.time(), serialization.dumps(request)),
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,187 @@
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from connect.devops_testing import serialization
+from connect.devops_testing.fixtures import make_request_builder, make_request_dispatcher
+from connect.devops_testing.harness import HarnessReport
+from connect.devops_testing.journal import RequestJournal
+from connect.devops_testing.request import Builder, Dispatcher
+from connect.devops_testing.standin import StandInClient
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+
+def cleanup(argv: Optional[List[str]] = None) -> int:
+    """
+    Discards the requests recorded in the given journals (usually left by
+    crashed test runs), failing or revoking them depending on their status.
+
+    :param argv: Optional[List[str]] The command line arguments.
+    :return: int The exit code, 1 if some request could not be discarded.
+    """
+    parser = argparse.ArgumentParser(
+        prog='connect-devops-cleanup',
+        description='Discards the Connect requests recorded in the given request journals.',
+    )
+    parser.add_argument('journals', nargs='+', help='Request journal files.')
+    parser.add_argument('--max-workers', type=int, default=8, help='Max amount of requests discarded in parallel.')
+    parser.add_argument('--api-key', default=None, help='Connect API key, CONNECT_API_KEY by default.')
+    parser.add_argument('--api-url', default=None, help='Connect API url, CONNECT_API_URL by default.')
+    args = parser.parse_args(argv)
+
+    dispatcher = make_request_dispatcher(api_key=args.api_key, api_url=args.api_url, use_specs=False)
+
+    remaining = 0
+    for path in args.journals:
+        journal = RequestJournal(path)
+        entries = journal.entries()
+        results = dispatcher.discard_requests(entries, max_workers=args.max_workers)
+
+        for request_id, result in results.items():
+            print(f"{request_id}: {'error: ' if isinstance(result, Exception) else ''}{result}")
+
+        failed = [entry for entry in entries if isinstance(results.get(entry.get('id')), Exception)]
+        journal.rewrite(failed)
+        remaining += len(failed)
+
+    return 1 if remaining > 0 else 0
+
+
+def _load_rules(path: Optional[str]) -> dict:
+    if path is None:
+        return {}
+
+    with open(path, encoding='utf-8') as file:
+        if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+            if yaml is None:  # pragma: no cover
+                raise ImportError('PyYAML is required to load YAML variation rules.')
+            return yaml.safe_load(file) or {}
+        return serialization.load(file)
+
+
+def _vary(value: Any, number: int) -> Any:
+    if isinstance(value, list):
+        return _vary(value[number % len(value)], number) if value else None
+    if isinstance(value, str):
+        return value.replace('{n}', str(number))
+    return value
+
+
+def make_load_request(builder: Builder, rules: dict, number: int) -> dict:
+    """
+    Builds the request number ``n`` applying the variation rules, a list of
+    values is cycled and ``{n}`` is replaced by the request number:
+
+        {"type": ["purchase", "change"], "params": {"EMAIL": "customer{n}@example.com"}}
+
+    :param builder: Builder The template builder (already copied).
+    :param rules: dict The variation rules (type, status and params).
+    :param number: int The request number.
+    :return: dict The request.
+    """
+    if 'type' in rules:
+        builder.with_type(_vary(rules['type'], number))
+    if 'status' in rules:
+        builder.with_status(_vary(rules['status'], number))
+
+    params = [
+        {'param_id': param_id, 'value': _vary(value, number)}
+        for param_id, value in rules.get('params', {}).items()
+    ]
+    if params and builder.is_asset_request():
+        builder.with_asset_params(params)
+    elif params:
+        builder.with_tier_configuration_params(params)
+
+    return builder.without('id').build()
+
+
+def _fire(dispatcher: Dispatcher, request: dict, expected_status: str) -> Tuple[float, Optional[str]]:
+    start = time.perf_counter()
+    try:
+        status = dispatcher.provision_request(request, memoize=False).get('status')
+        return time.perf_counter() - start, None if status == expected_status else f'status:{status}'
+    except Exception as e:
+        return time.perf_counter() - start, type(e).__name__
+
+
+def load(argv: Optional[List[str]] = None) -> int:
+    """
+    Generates requests from a template and variation rules and pushes them
+    through the Dispatcher at a target rate with bounded concurrency, into
+    Connect or into the offline stand-in backend.
+
+    :param argv: Optional[List[str]] The command line arguments.
+    :return: int The exit code, 1 if some request was not processed as expected.
+    """
+    parser = argparse.ArgumentParser(
+        prog='connect-devops-load',
+        description='Fires requests built from a template at Connect (or a stand-in backend).',
+    )
+    parser.add_argument('template', help='Request template file.')
+    parser.add_argument('--rules', default=None, help='Variation rules file (JSON or YAML).')
+    parser.add_argument('--count', type=int, default=100, help='Amount of requests.')
+    parser.add_argument('--rate', type=float, default=0, help='Target requests per second, 0 for unlimited.')
+    parser.add_argument('--concurrency', type=int, default=8, help='Max amount of requests in flight.')
+    parser.add_argument('--timeout', type=float, default=None, help='Seconds between request reloads.')
+    parser.add_argument('--max-attempts', type=int, default=None, help='Max amount of request reloads.')
+    parser.add_argument('--expect-status', default='approved', help='Expected status of the processed requests.')
+    parser.add_argument('--stand-in', action='store_true', help='Use the offline stand-in backend.')
+    parser.add_argument('--stand-in-latency', type=float, default=0.05, help='Stand-in latency per call in seconds.')
+    parser.add_argument('--stand-in-polls', type=int, default=1, help='Reloads a stand-in request stays pending.')
+    parser.add_argument('--json-output', default=None, help='File of the JSON statistics.')
+    parser.add_argument('--api-key', default=None, help='Connect API key, CONNECT_API_KEY by default.')
+    parser.add_argument('--api-url', default=None, help='Connect API url, CONNECT_API_URL by default.')
+    args = parser.parse_args(argv)
+
+    rules = _load_rules(args.rules)
+    template = make_request_builder(args.template)
+    requests = [make_load_request(template.copy(), rules, number) for number in range(args.count)]
+
+    client, timeout = None, args.timeout
+    if args.stand_in:
+        client = StandInClient(latency=args.stand_in_latency, pending_polls=args.stand_in_polls)
+        timeout = 0 if timeout is None else timeout
+
+    dispatcher = make_request_dispatcher(
+        api_key=args.api_key,
+        api_url=args.api_url,
+        use_specs=False,
+        client=client,
+        timeout=timeout,
+        max_attempts=args.max_attempts,
+    )
+
+    slots = threading.Semaphore(args.concurrency)
+    outcomes: List[Tuple[float, Optional[str]]] = []
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency, thread_name_prefix='load') as executor:
+        for number, request in enumerate(requests):
+            if args.rate > 0:
+                time.sleep(max(0.0, start + number / args.rate - time.perf_counter()))
+            slots.acquire()
+            future = executor.submit(_fire, dispatcher, request, args.expect_status)
+            future.add_done_callback(lambda done: (outcomes.append(done.result()), slots.release()))
+    elapsed = time.perf_counter() - start
+
+    failures: Dict[str, int] = {}
+    for _, failure in outcomes:
+        if failure is not None:
+            failures[failure] = failures.get(failure, 0) + 1
+
+    report = HarnessReport([latency for latency, _ in outcomes], failures, elapsed)
+    print(report.format_text())
+
+    if args.json_output is not None:
+        with open(args.json_output, 'w', encoding='utf-8') as file:
+            serialization.dump(report.summary(), file, indent=True)
+
+    return 1 if report.failed > 0 else 0
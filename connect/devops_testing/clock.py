@@ -0,0 +1,64 @@
+import threading
+import time
+from typing import List
+
+
+class Clock:
+    """
+    Source of time of the Dispatcher, the default one uses the system
+    monotonic clock and really sleeps.
+    """
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    def __init__(self, start: float = 0.0):
+        """
+        Virtual time clock for tests, sleeping advances the virtual time
+        instantly so polling loops of many attempts run in milliseconds and
+        deterministically.
+
+        :param start: float The initial virtual time in seconds.
+        """
+        self._now = start
+        self._lock = threading.Lock()
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        with self._lock:
+            return self._now
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+        with self._lock:
+            self.sleeps.append(seconds)
+
+    def advance(self, seconds: float):
+        """
+        Moves the virtual time forward.
+
+        :param seconds: float The amount of seconds.
+        :return: None
+        """
+        if seconds < 0:
+            raise ValueError('The clock can not go backwards.')
+        with self._lock:
+            self._now += seconds
+
+    @property
+    def slept(self) -> float:
+        """
+        Total amount of virtual seconds slept.
+
+        :return: float The slept seconds.
+        """
+        with self._lock:
+            return sum(self.sleeps)
+
+
+SYSTEM_CLOCK = Clock()
@@ -0,0 +1,111 @@
+import gzip
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from connect.devops_testing import serialization
+from connect.devops_testing.request import Builder
+from connect.devops_testing.utils import request_model
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+def open_corpus(path: str, mode: str = 'r') -> IO[str]:
+    """
+    Opens a JSON Lines corpus file in text mode, ``.gz`` files are gzip
+    compressed and ``.zst`` files are zstd compressed (requires the
+    zstandard package).
+
+    :param path: str The corpus file path.
+    :param mode: str The open mode, ``r``, ``w`` or ``a``.
+    :return: IO[str] The text stream.
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, f'{mode}t', encoding='utf-8')
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError('The zstandard package is required to open zstd compressed corpora.')
+        return zstandard.open(path, f'{mode}t', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def read_corpus(
+        path: str,
+        types: Optional[Iterable[str]] = None,
+        models: Optional[Iterable[str]] = None,
+        builders: bool = False,
+) -> Iterator[Union[dict, Builder]]:
+    """
+    Streams the requests of a JSON Lines corpus one at a time, so the memory
+    stays constant whatever the corpus size.
+
+    :param path: str The corpus file path.
+    :param types: Optional[Iterable[str]] Only yield the requests of these types
+                  (purchase, change, setup...).
+    :param models: Optional[Iterable[str]] Only yield the requests of these
+                   models (asset or tier-config).
+    :param builders: bool True to yield a Builder of each request instead of the dict.
+    :return: Iterator[Union[dict, Builder]] The requests.
+    """
+    types = None if types is None else set(types)
+    models = None if models is None else set(models)
+
+    with open_corpus(path) as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                request = serialization.loads(line)
+            except ValueError as e:
+                raise ValueError(f'Invalid request in {path}:{number}: {e}') from e
+
+            if types is not None and request.get('type') not in types:
+                continue
+            if models is not None and request_model(request) not in models:
+                continue
+
+            yield Builder(request) if builders else request
+
+
+class CorpusWriter:
+    def __init__(self, path: str, append: bool = False):
+        """
+        Writes requests (or builders) into a JSON Lines corpus, compressed
+        depending on the file extension.
+
+        :param path: str The corpus file path.
+        :param append: bool True to append to an existing corpus.
+        """
+        self._file = open_corpus(path, 'a' if append else 'w')
+        self.count = 0
+
+    def write(self, request: Union[dict, Builder]):
+        request = request.build() if isinstance(request, Builder) else request
+        self._file.write(serialization.dumps(request, default=str) + '\n')
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> 'CorpusWriter':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def write_corpus(path: str, requests: Iterable[Union[dict, Builder]], append: bool = False) -> int:
+    """
+    Writes the given requests into a JSON Lines corpus.
+
+    :param path: str The corpus file path.
+    :param requests: Iterable[Union[dict, Builder]] The requests.
+    :param append: bool True to append to an existing corpus.
+    :return: int The amount of written requests.
+    """
+    with CorpusWriter(path, append) as writer:
+        for request in requests:
+            writer.write(request)
+        return writer.count
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+from connect.devops_testing import serialization
+
+
+def _event_request_ids(payload) -> List[str]:
+    """
+    Extract the request ids from a request-status notification.
+
+    Supports a bare request object (``{"id": ...}``), Connect event
+    envelopes (``{"object_id": ...}`` or ``{"request": {"id": ...}}``)
+    and lists of any of them.
+
+    :param payload: The decoded notification body.
+    :return: List[str] The list of request ids.
+    """
+    if isinstance(payload, list):
+        return [request_id for event in payload for request_id in _event_request_ids(event)]
+
+    if not isinstance(payload, dict):
+        return []
+
+    if isinstance(payload.get('request'), dict):
+        return _event_request_ids(payload.get('request'))
+
+    request_id = payload.get('object_id', payload.get('id'))
+    return [] if request_id is None else [request_id]
+
+
+class RequestEventListener:
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            fallback_timeout: int = 60,
+            max_pending: int = 1024,
+    ):
+        """
+        Local HTTP receiver of request-status notifications (webhooks or
+        events). Waiting requests are resolved as soon as a notification
+        for them arrives, polling is kept as fallback every ``fallback_timeout``.
+
+        A notification wakes up all the current waiters of the request. The
+        notifications nobody has waited for yet are kept (so a waiter arriving
+        late does not miss them) up to ``max_pending`` request ids, the oldest
+        ones are discarded first and their waiters fall back to polling.
+
+        :param host: str The interface to bind.
+        :param port: int The port to bind, 0 to pick a free one.
+        :param fallback_timeout: int The max amount of seconds to wait for a notification.
+        :param max_pending: int The max amount of pending notified request ids.
+        """
+        self._address = (host, port)
+        self._fallback_timeout = fallback_timeout
+        self._max_pending = max_pending
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        # the last notification and the last awaited notification sequence by request id.
+        self._notified: OrderedDict = OrderedDict()
+        self._sequence = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self) -> RequestEventListener:
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def fallback_timeout(self) -> int:
+        return self._fallback_timeout
+
+    @property
+    def url(self) -> Optional[str]:
+        if self._server is None:
+            return None
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def start(self) -> RequestEventListener:
+        """
+        Starts the HTTP receiver in a background thread.
+
+        :return: RequestEventListener
+        """
+        if self._server is not None:
+            return self
+
+        listener = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    payload = serialization.loads(self.rfile.read(length) or b'null')
+                except ValueError:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+
+                for request_id in _event_request_ids(payload):
+                    listener.notify(request_id)
+
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                """ silence the default stderr access log """
+
+        self._server = ThreadingHTTPServer(self._address, _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the HTTP receiver.
+
+        :return: None
+        """
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def notify(self, request_id: str):
+        """
+        Notifies that the given request has changed, waking up its waiters.
+        Can be used directly as a stand-in emitter in tests.
+
+        :param request_id: str The changed request id.
+        :return: None
+        """
+        with self._condition:
+            self._sequence += 1
+            _, awaited = self._notified.pop(request_id, (0, 0))
+            self._notified[request_id] = (self._sequence, awaited)
+            while len(self._notified) > self._max_pending:
+                self._notified.popitem(last=False)
+            self._condition.notify_all()
+
+    def wait(self, request_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until a notification for the given request arrives or the
+        timeout expires. A notification that arrived since the last awaited
+        one returns immediately.
+
+        :param request_id: str The request id to wait for.
+        :param timeout: float The max amount of seconds to wait.
+        :return: bool True if a notification was received, False on timeout.
+        """
+        with self._condition:
+            awaited = self._notified.get(request_id, (0, 0))[1]
+            notified = self._condition.wait_for(
+                lambda: self._notified.get(request_id, (0, 0))[0] > awaited,
+                timeout=self._fallback_timeout if timeout is None else timeout,
+            )
+            if notified:
+                sequence, _ = self._notified[request_id]
+                self._notified[request_id] = (sequence, sequence)
+            return notified
@@ -0,0 +1,157 @@
+import operator
+import os
+import re
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from connect.devops_testing import serialization
+from connect.devops_testing.asserts import _prepare_assert_argument, compile_pattern
+from connect.devops_testing.models import Request
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+_OPERATORS: Dict[str, Tuple[Callable[[Any, Any], Any], str]] = {
+    '==': (operator.eq, 'is not equal to'),
+    '!=': (operator.ne, 'is equal to'),
+    'in': (operator.contains, 'does not contain'),
+    'match': (lambda value, pattern: pattern.search(value), 'does not match'),
+}
+
+_MISSING = object()
+
+
+class _Check:
+    def __init__(self, path: str, operator_name: str, expected: Any):
+        if operator_name not in _OPERATORS:
+            raise ValueError(f"Unknown operator '{operator_name}' for '{path}'.")
+
+        self.path = path
+        self.segments = tuple(path.split('.'))
+        self.operator, self.message = _OPERATORS[operator_name]
+        self.expected = compile_pattern(expected) if operator_name == 'match' else expected
+        self.is_param_value = len(self.segments) >= 3 and self.segments[-3] == 'params' and self.segments[-1] == 'value'
+
+    def describe(self, value: Any) -> str:
+        expected = self.expected.pattern if isinstance(self.expected, re.Pattern) else self.expected
+        return f"{self.path} '{value}' {self.message} '{expected}'."
+
+
+class ExpectationSpec:
+    def __init__(self, spec: Dict[str, Union[Dict[str, Any], Any]]):
+        """
+        Compiled set of expectations over a request. The spec maps a dotted
+        path to a dictionary of operator (``==``, ``!=``, ``in``, ``match``)
+        to expected value, a plain value is a shortcut of ``==``. List
+        elements with id, like params, are addressed by id, for example
+        ``asset.params.PARAM_ID.value``. Checkbox param values are compared as
+        the list of checked values against the ``|`` separated expected value.
+
+        :param spec: Dict[str, Union[Dict[str, Any], Any]] The expectation spec.
+        """
+        self._checks: List[_Check] = []
+        for path, expectations in spec.items():
+            if not isinstance(expectations, dict):
+                expectations = {'==': expectations}
+            for operator_name, expected in expectations.items():
+                self._checks.append(_Check(path, operator_name, expected))
+
+    @classmethod
+    def from_file(cls, path: str) -> 'ExpectationSpec':
+        """
+        Compiles the expectation spec of the given JSON or YAML file.
+
+        :param path: str The spec file path.
+        :return: ExpectationSpec The compiled spec.
+        """
+        with open(path, encoding='utf-8') as file:
+            if os.path.splitext(path)[1].lower() in ('.yaml', '.yml'):
+                if yaml is None:  # pragma: no cover
+                    raise ImportError('PyYAML is required to load YAML expectation files, install the yaml extra.')
+                return cls(yaml.safe_load(file) or {})
+            return cls(serialization.load(file))
+
+    def __len__(self) -> int:
+        return len(self._checks)
+
+    def evaluate(self, request: Union[dict, Request]) -> List[str]:
+        """
+        Evaluates all the expectations against the given request in a single
+        pass, each list of elements with id is indexed only once.
+
+        :param request: Union[dict, Request] The request to evaluate.
+        :return: List[str] The failure messages, empty if all expectations hold.
+        """
+        if isinstance(request, Request):
+            request = request.to_dict()
+
+        indexes: Dict[int, Dict[str, Any]] = {}
+        failures = []
+
+        for check in self._checks:
+            value = self._resolve(request, check.segments, indexes)
+            expected = check.expected
+            if value is _MISSING:
+                value = ''
+            elif check.is_param_value:
+                param = self._resolve(request, check.segments[:-1], indexes)
+                if isinstance(param, dict) and param.get('type') == 'checkbox' and isinstance(expected, str):
+                    value, expected = _prepare_assert_argument(param, expected)
+
+            try:
+                holds = check.operator(value, expected)
+            except TypeError:
+                holds = False
+
+            if not holds:
+                failures.append(check.describe(value))
+
+        return failures
+
+    def check(self, request: Union[dict, Request]):
+        """
+        Asserts all the expectations against the given request, reporting
+        every failure together.
+
+        :param request: Union[dict, Request] The request to evaluate.
+        :return: None
+        """
+        failures = self.evaluate(request)
+        assert not failures, '\n'.join([f'{len(failures)} of {len(self)} expectations failed:', *failures])
+
+    @staticmethod
+    def _index(elements: list, indexes: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        index = indexes.get(id(elements))
+        if index is None:
+            index = indexes[id(elements)] = {}
+            for element in elements:
+                if isinstance(element, dict):
+                    index.setdefault(element.get('id'), element)
+        return index
+
+    def _resolve(self, node: Any, segments: Tuple[str, ...], indexes: Dict[int, Dict[str, Any]]) -> Any:
+        for segment in segments:
+            if isinstance(node, dict):
+                node = node.get(segment, _MISSING)
+            elif isinstance(node, list):
+                node = self._index(node, indexes).get(segment, _MISSING)
+            else:
+                return _MISSING
+
+            if node is _MISSING:
+                return _MISSING
+
+        return node
+
+
+def expect(request: Union[dict, Request], spec: Union[dict, ExpectationSpec]):
+    """
+    Asserts the given expectation spec (compiled or not) against the request,
+    reporting every failure together.
+
+    :param request: Union[dict, Request] The request to evaluate.
+    :param spec: Union[dict, ExpectationSpec] The expectation spec.
+    :return: None
+    """
+    (spec if isinstance(spec, ExpectationSpec) else ExpectationSpec(spec)).check(request)
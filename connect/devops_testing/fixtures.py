@@ -1,6 +1,10 @@
 from typing import Optional
 
 from connect.client import ConnectClient
+from connect.devops_testing.cache import RequestCache
+from connect.devops_testing.clock import Clock
+from connect.devops_testing.events import RequestEventListener
+from connect.devops_testing.journal import RequestJournal
 from connect.devops_testing.request import Builder, Dispatcher
 
 from os import getenv
@@ -9,6 +13,7 @@ _CONNECT_API_KEY = 'CONNECT_API_KEY'
 _CONNECT_API_URL = 'CONNECT_API_URL'
 _CONNECT_API_PULL_TIMEOUT = 'CONNECT_API_PULL_TIMEOUT'
 _CONNECT_API_PULL_MAX_ATTEMPTS = 'CONNECT_API_PULL_MAX_ATTEMPTS'
+_CONNECT_REQUEST_JOURNAL = 'CONNECT_REQUEST_JOURNAL'
 
 
 def make_request_dispatcher(
@@ -18,6 +23,11 @@ def make_request_dispatcher(
         client: ConnectClient = None,
         timeout: Optional[int] = None,
         max_attempts: Optional[int] = None,
+        listener: Optional[RequestEventListener] = None,
+        cache: Optional[RequestCache] = None,
+        freshness: float = 0,
+        journal: Optional[str] = None,
+        clock: Optional[Clock] = None,
 ) -> Dispatcher:
     """
     Initializes a Dispatcher service.
@@ -29,6 +39,7 @@ def make_request_dispatcher(
     The RequestDispatcher is initialized using the environment variables:
     - CONNECT_API_PULL_TIMEOUT
     - CONNECT_API_PULL_MAX_ATTEMPTS
+    - CONNECT_REQUEST_JOURNAL
 
     :return: Dispatcher
     :param api_key: Optional[str] The Connect API Key.
@@ -40,6 +51,17 @@ def make_request_dispatcher(
                       live connection
     :param timeout: int The timeout for waiting on each request refresh in seconds.
     :param max_attempts: int The max amount of time to refresh a request
+    :param listener: Optional[RequestEventListener] Optional started event
+                     listener to resolve processed requests on notification
+                     instead of polling.
+    :param cache: Optional[RequestCache] Optional cache to reuse the processed
+                  result of identical new requests.
+    :param freshness: float The amount of seconds a found request is reused
+                      before calling again the Connect platform.
+    :param journal: Optional[str] Optional file path where the created
+                    requests are recorded for a later cleanup.
+    :param clock: Optional[Clock] Optional clock used to wait between request
+                  reloads, a VirtualClock never really sleeps.
     :return: Dispatcher
     """
     if client is None:
@@ -54,11 +76,17 @@ def make_request_dispatcher(
 
     timeout = getenv(_CONNECT_API_PULL_TIMEOUT, 10) if timeout is None else timeout
     max_attempts = getenv(_CONNECT_API_PULL_MAX_ATTEMPTS, 20) if max_attempts is None else max_attempts
+    journal = getenv(_CONNECT_REQUEST_JOURNAL) if journal is None else journal
 
     return Dispatcher(
         client=client,
         timeout=timeout,
         max_attempts=max_attempts,
+        listener=listener,
+        cache=cache,
+        freshness=freshness,
+        journal=None if journal is None else RequestJournal(journal),
+        clock=clock,
     )
 
 
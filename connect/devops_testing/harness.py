@@ -0,0 +1,240 @@
+import asyncio
+import inspect
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from connect.devops_testing.request import Builder
+
+_PROCESSOR_METHODS = {
+    'purchase': 'process_asset_purchase_request',
+    'change': 'process_asset_change_request',
+    'suspend': 'process_asset_suspend_request',
+    'resume': 'process_asset_resume_request',
+    'cancel': 'process_asset_cancel_request',
+    'adjustment': 'process_asset_adjustment_request',
+    'setup': 'process_tier_config_setup_request',
+}
+
+_extensions = threading.local()
+
+
+def processor_method(request: dict) -> str:
+    """
+    Provides the extension method that processes the given request type.
+
+    :param request: dict The request.
+    :return: str The extension method name.
+    """
+    method = _PROCESSOR_METHODS.get(request.get('type'))
+    if method is None:
+        raise ValueError(f"No processor method for request type '{request.get('type')}'.")
+    return method
+
+
+def _get_extension(token: str, extension: type, args: tuple, kwargs: dict) -> Any:
+    instances = getattr(_extensions, 'instances', None)
+    if instances is None:
+        instances = _extensions.instances = {}
+    if token not in instances:
+        instances[token] = extension(*args, **kwargs)
+    return instances[token]
+
+
+def _process(
+        token: str,
+        extension: type,
+        args: tuple,
+        kwargs: dict,
+        method: Optional[str],
+        request: dict,
+        check: Optional[Callable[[dict, Any], None]],
+) -> Tuple[float, Optional[str]]:
+    start = time.perf_counter()
+    try:
+        processor = getattr(_get_extension(token, extension, args, kwargs), method or processor_method(request))
+        result = processor(request)
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+        latency = time.perf_counter() - start
+
+        if check is not None:
+            check(request, result)
+        return latency, None
+    except AssertionError:
+        return time.perf_counter() - start, 'AssertionError'
+    except Exception as e:
+        return time.perf_counter() - start, type(e).__name__
+
+
+class HarnessReport:
+    def __init__(self, latencies: List[float], failures: Dict[str, int], elapsed: float):
+        """
+        Outcome of a processor harness run.
+
+        :param latencies: List[float] The processing latency of each request in seconds.
+        :param failures: Dict[str, int] The amount of failed requests by failure type.
+        :param elapsed: float The wall time of the whole run in seconds.
+        """
+        self.latencies = sorted(latencies)
+        self.failures = failures
+        self.elapsed = elapsed
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def failed(self) -> int:
+        return sum(self.failures.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Provides the latency percentile (nearest rank).
+
+        :param percent: float The percentile between 0 and 100.
+        :return: float The latency in seconds.
+        """
+        if not self.latencies:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        return self.latencies[rank - 1]
+
+    def summary(self) -> dict:
+        return {
+            'count': self.count,
+            'failed': self.failed,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.latencies[-1] if self.latencies else 0.0,
+            'failures': dict(self.failures),
+        }
+
+    def format_text(self) -> str:
+        summary = self.summary()
+        lines = [
+            f"{summary['count']} requests in {summary['elapsed']:.3f}s, "
+            f"{summary['throughput']:.1f} requests/sec, {summary['failed']} failed",
+            f"latency p50 {summary['p50'] * 1000:.1f}ms, p90 {summary['p90'] * 1000:.1f}ms, "
+            f"p99 {summary['p99'] * 1000:.1f}ms, max {summary['max'] * 1000:.1f}ms",
+        ]
+        lines.extend(f'  {failure}: {count}' for failure, count in sorted(self.failures.items()))
+        return '\n'.join(lines)
+
+
+class ProcessorHarness:
+    def __init__(
+            self,
+            extension: type,
+            recipe: Callable[[Builder, int], Union[Builder, dict]],
+            template: Optional[Union[dict, str]] = None,
+            extension_args: tuple = (),
+            extension_kwargs: Optional[dict] = None,
+            method: Optional[str] = None,
+            check: Optional[Callable[[dict, Any], None]] = None,
+            mode: str = 'thread',
+            max_workers: int = 8,
+    ):
+        """
+        Load-tests an extension processor locally. The recipe builds each
+        request from a copy of the template builder, the requests are processed
+        concurrently by one extension instance per worker and the outcome is
+        checked with the given check function (usually using ``asserts``).
+
+        With the ``process`` mode the extension class, its arguments, the
+        requests and the check function must be picklable.
+
+        :param extension: type The extension class.
+        :param recipe: Callable[[Builder, int], Union[Builder, dict]] Builds the
+                       request number ``n`` from the given builder.
+        :param template: Optional[Union[dict, str]] The request template or file path.
+        :param extension_args: tuple The extension constructor arguments.
+        :param extension_kwargs: Optional[dict] The extension constructor keyword arguments.
+        :param method: Optional[str] The extension method, by default it depends
+                       on the request type.
+        :param check: Optional[Callable[[dict, Any], None]] Checks the request and
+                      the task result, raising AssertionError on failure.
+        :param mode: str The concurrency mode, ``thread`` or ``process``.
+        :param max_workers: int The amount of workers.
+        """
+        if mode not in ('thread', 'process'):
+            raise ValueError(f"Invalid harness mode '{mode}'.")
+
+        self._extension = extension
+        self._recipe = recipe
+        self._template = template
+        self._extension_args = extension_args
+        self._extension_kwargs = {} if extension_kwargs is None else extension_kwargs
+        self._method = method
+        self._check = check
+        self._mode = mode
+        self._max_workers = max_workers
+
+    def _builder(self) -> Builder:
+        if isinstance(self._template, str):
+            return Builder.from_file(self._template)
+        return Builder(self._template)
+
+    def generate(self, count: int) -> List[dict]:
+        """
+        Generates the given amount of requests with the recipe.
+
+        :param count: int The amount of requests.
+        :return: List[dict] The generated requests.
+        """
+        base = self._builder()
+        requests = []
+        for number in range(count):
+            request = self._recipe(base.copy(), number)
+            requests.append(request.build() if isinstance(request, Builder) else request)
+        return requests
+
+    def _executor(self) -> Executor:
+        if self._mode == 'process':
+            return ProcessPoolExecutor(max_workers=self._max_workers)
+        return ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='harness')
+
+    def run(self, count: int) -> HarnessReport:
+        """
+        Generates and processes the given amount of requests.
+
+        :param count: int The amount of requests.
+        :return: HarnessReport The latency, throughput and failures report.
+        """
+        requests = self.generate(count)
+        token = uuid.uuid4().hex
+
+        start = time.perf_counter()
+        with self._executor() as executor:
+            futures = [
+                executor.submit(
+                    _process,
+                    token,
+                    self._extension,
+                    self._extension_args,
+                    self._extension_kwargs,
+                    self._method,
+                    request,
+                    self._check,
+                )
+                for request in requests
+            ]
+            outcomes = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+
+        failures: Dict[str, int] = {}
+        for _, failure in outcomes:
+            if failure is not None:
+                failures[failure] = failures.get(failure, 0) + 1
+
+        return HarnessReport([latency for latency, _ in outcomes], failures, elapsed)
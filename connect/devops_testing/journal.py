@@ -0,0 +1,61 @@
+import os
+import threading
+from typing import List
+
+from connect.devops_testing import serialization
+
+
+class RequestJournal:
+    def __init__(self, path: str):
+        """
+        Append-only JSON Lines file of the requests created during a test
+        run, so they can be cleaned up even if the run crashes.
+
+        :param path: str The journal file path.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def record(self, request: dict):
+        """
+        Records the given created request (only its id and type).
+
+        :param request: dict The created request.
+        :return: None
+        """
+        entry = serialization.dumps({'id': request.get('id'), 'type': request.get('type')})
+        with self._lock, open(self._path, 'a') as file:
+            file.write(entry + '\n')
+
+    def entries(self) -> List[dict]:
+        """
+        Reads all the recorded requests.
+
+        :return: List[dict] The list of recorded requests (id and type).
+        """
+        if not os.path.exists(self._path):
+            return []
+
+        with self._lock, open(self._path) as file:
+            return [serialization.loads(line) for line in file if line.strip()]
+
+    def rewrite(self, entries: List[dict]):
+        """
+        Replaces the recorded requests with the given ones, removing the
+        journal file if there is nothing left.
+
+        :param entries: List[dict] The requests to keep.
+        :return: None
+        """
+        with self._lock:
+            if not entries:
+                if os.path.exists(self._path):
+                    os.remove(self._path)
+                return
+
+            with open(self._path, 'w') as file:
+                file.writelines(serialization.dumps(entry) + '\n' for entry in entries)
@@ -0,0 +1,289 @@
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+
+
+def _compact(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _compact(element) for key, element in value.items()}
+    if isinstance(value, list):
+        return [_compact(element) for element in value]
+    return value
+
+
+class _Model:
+    """
+    Compact typed view of a part of a request, the known fields are kept in
+    slots and the remaining keys in ``extra`` so the conversion back to a
+    dictionary is lossless (except the None values that are omitted). The
+    strings are interned, so the values repeated between requests (products,
+    marketplaces, parameter titles and descriptions...) are stored once.
+
+    The models also provide the read access of a dictionary (``get`` and
+    ``[]``) so they can be used wherever a request dictionary is read.
+    """
+
+    __slots__ = ('extra',)
+
+    _fields: Tuple[str, ...] = ()
+    _nested: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {}
+
+    def __init__(self, **fields):
+        for name in self._fields:
+            setattr(self, name, fields.pop(name, None))
+        self.extra = fields or None
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Creates the model from the given dictionary, the values that are not
+        models are copied with their strings interned.
+
+        :param data: dict The dictionary.
+        :return: The model.
+        """
+        model = cls.__new__(cls)
+        extra = dict(data)
+        for name in cls._fields:
+            value = extra.pop(name, None)
+            if value is not None:
+                value = cls._nested[name][0](value) if name in cls._nested else _compact(value)
+            setattr(model, name, value)
+        model.extra = _compact(extra) or None
+        return model
+
+    def to_dict(self) -> dict:
+        """
+        Provides the dictionary of the model.
+
+        :return: dict The dictionary.
+        """
+        data = {}
+        for name in self._fields:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = self._nested[name][1](value) if name in self._nested else value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._fields:
+            value = getattr(self, key)
+            return default if value is None else value
+        return default if self.extra is None else self.extra.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(id={self.get("id")!r})'
+
+
+def _model(cls: type) -> Tuple[Callable[[dict], Any], Callable[[Any], dict]]:
+    return cls.from_dict, lambda model: model.to_dict()
+
+
+def _model_list(cls: type) -> Tuple[Callable[[List[dict]], list], Callable[[list], List[dict]]]:
+    return (
+        lambda data: [cls.from_dict(element) for element in data],
+        lambda models: [model.to_dict() for model in models],
+    )
+
+
+def _model_dict(cls: type) -> Tuple[Callable[[dict], dict], Callable[[dict], dict]]:
+    return (
+        lambda data: {key: cls.from_dict(value) for key, value in data.items()},
+        lambda models: {key: model.to_dict() for key, model in models.items()},
+    )
+
+
+class Param(_Model):
+    __slots__ = (
+        'id',
+        'name',
+        'title',
+        'description',
+        'type',
+        'value',
+        'value_error',
+        'structured_value',
+        'value_choices',
+        'scope',
+        'phase',
+        'hint',
+        'constraints',
+    )
+    _fields = __slots__
+
+
+class Params:
+    __slots__ = ('_params', '_index')
+
+    def __init__(self, params: Optional[List[Param]] = None):
+        """
+        List of parameters indexed by id, the index is built on the first
+        lookup so finding a parameter costs a dictionary access.
+
+        :param params: Optional[List[Param]] The parameters.
+        """
+        self._params = [] if params is None else params
+        self._index: Optional[Dict[str, Param]] = None
+
+    @classmethod
+    def from_list(cls, data: List[dict]) -> 'Params':
+        return cls([Param.from_dict(param) for param in data])
+
+    def to_list(self) -> List[dict]:
+        return [param.to_dict() for param in self._params]
+
+    def find(self, param_id: str, default: Any = None) -> Any:
+        """
+        Provides the (first) parameter with the given id.
+
+        :param param_id: str The parameter id.
+        :param default: Any Default value to return if the parameter is not found.
+        :return: Any The parameter or default.
+        """
+        if self._index is None:
+            self._index = {param.id: param for param in reversed(self._params)}
+        return self._index.get(param_id, default)
+
+    def __getitem__(self, position: int) -> Param:
+        return self._params[position]
+
+    def __iter__(self) -> Iterator[Param]:
+        return iter(self._params)
+
+    def __len__(self) -> int:
+        return len(self._params)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Params):
+            return NotImplemented
+        return self._params == other._params
+
+    def __repr__(self) -> str:
+        return f'Params({[param.id for param in self._params]!r})'
+
+
+_PARAMS = (Params.from_list, lambda params: params.to_list())
+
+
+class Item(_Model):
+    __slots__ = (
+        'id',
+        'global_id',
+        'mpn',
+        'display_name',
+        'item_type',
+        'type',
+        'period',
+        'quantity',
+        'old_quantity',
+        'params',
+    )
+    _fields = __slots__
+    _nested = {'params': _PARAMS}
+
+
+class Tier(_Model):
+    __slots__ = ('id', 'name', 'external_id', 'external_uid', 'contact_info')
+    _fields = __slots__
+
+
+class Configuration(_Model):
+    __slots__ = ('params',)
+    _fields = __slots__
+    _nested = {'params': _PARAMS}
+
+
+class Asset(_Model):
+    __slots__ = (
+        'id',
+        'status',
+        'external_id',
+        'external_uid',
+        'product',
+        'connection',
+        'contract',
+        'marketplace',
+        'params',
+        'tiers',
+        'items',
+        'configuration',
+        'events',
+    )
+    _fields = __slots__
+    _nested = {
+        'params': _PARAMS,
+        'items': _model_list(Item),
+        'tiers': _model_dict(Tier),
+        'configuration': _model(Configuration),
+    }
+
+
+class TierConfiguration(_Model):
+    __slots__ = (
+        'id',
+        'name',
+        'status',
+        'tier_level',
+        'product',
+        'account',
+        'connection',
+        'contract',
+        'marketplace',
+        'template',
+        'params',
+        'configuration',
+        'events',
+    )
+    _fields = __slots__
+    _nested = {
+        'account': _model(Tier),
+        'params': _PARAMS,
+        'configuration': _model(Configuration),
+    }
+
+
+class Request(_Model):
+    __slots__ = (
+        'id',
+        'type',
+        'created',
+        'updated',
+        'effective_date',
+        'status',
+        'activation_key',
+        'reason',
+        'note',
+        'assignee',
+        'contract',
+        'marketplace',
+        'environment',
+        'template',
+        'params',
+        'asset',
+        'configuration',
+    )
+    _fields = __slots__
+    _nested = {
+        'params': _PARAMS,
+        'asset': _model(Asset),
+        'configuration': _model(TierConfiguration),
+    }
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import Optional, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from connect.devops_testing.request import Dispatcher
+
+
+class RequestPool:
+    def __init__(
+            self,
+            dispatcher: Dispatcher,
+            template: dict,
+            size: int = 1,
+            status: str = 'inquiring',
+            timeout: Optional[int] = None,
+            max_attempt: Optional[int] = None,
+    ):
+        """
+        Keeps ``size`` requests created from ``template`` provisioned in the
+        given ``status``, refilling the pool in background on each checkout.
+
+        :param dispatcher: Dispatcher The dispatcher used to provision the requests.
+        :param template: dict The request to create on each refill.
+        :param size: int The amount of requests to keep ready.
+        :param status: str The status the provisioned requests must reach.
+        :param timeout: int The amount of time in seconds to wait each pull.
+        :param max_attempt: int The max number of pull attempts.
+        """
+        if size < 1:
+            raise ValueError('Pool size must be greater than zero.')
+
+        self._dispatcher = dispatcher
+        self._template = deepcopy(template)
+        self._size = size
+        self._status = status
+        self._timeout = timeout
+        self._max_attempt = max_attempt
+        self._ready = queue.Queue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def available(self) -> int:
+        return self._ready.qsize()
+
+    def _provision(self):
+        try:
+            request = self._dispatcher.provision_request(
+                request=deepcopy(self._template),
+                timeout=self._timeout,
+                max_attempt=self._max_attempt,
+                memoize=False,
+            )
+            if request.get('status') != self._status:
+                raise RuntimeError(
+                    f"Pooled request {request.get('id')} reached status "
+                    f"'{request.get('status')}' instead of '{self._status}'.",
+                )
+            self._ready.put(request)
+        except Exception as e:
+            self._ready.put(e)
+
+    def _refill(self):
+        self._executor.submit(self._provision)
+
+    def start(self) -> RequestPool:
+        """
+        Starts provisioning the pooled requests in background.
+
+        :return: RequestPool
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._size, thread_name_prefix='request-pool')
+            for _ in range(self._size):
+                self._refill()
+        return self
+
+    def grow(self, size: int) -> RequestPool:
+        """
+        Raises the amount of requests kept ready to the given size, the
+        missing requests are provisioned in background if the pool is started.
+        A smaller size leaves the pool as is.
+
+        :param size: int The amount of requests to keep ready.
+        :return: RequestPool
+        """
+        added = size - self._size
+        if added > 0:
+            self._size = size
+            if self._executor is not None:
+                for _ in range(added):
+                    self._refill()
+        return self
+
+    def checkout(self, timeout: Optional[float] = None) -> dict:
+        """
+        Takes a provisioned request out of the pool, waiting for one if
+        none is ready yet, and schedules its replacement.
+
+        :param timeout: float The max amount of seconds to wait, None waits forever.
+        :return: dict The provisioned request.
+        """
+        self.start()
+        try:
+            request: Union[dict, Exception] = self._ready.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No pooled request in status '{self._status}' available.") from None
+
+        self._refill()
+        if isinstance(request, Exception):
+            raise request
+
+        return request
+
+    def close(self, wait: bool = True):
+        """
+        Stops refilling the pool.
+
+        :param wait: bool True to wait for the in-flight provisions.
+        :return: None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
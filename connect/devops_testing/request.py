@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-import json
-import time
+import threading
 from abc import abstractmethod
-from copy import deepcopy
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy, deepcopy
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from connect.client import ConnectClient
-from connect.devops_testing.utils import find_by_id, merge, request_model, request_parameters
+from connect.devops_testing import serialization
+from connect.devops_testing.cache import RequestCache
+from connect.devops_testing.clock import Clock, SYSTEM_CLOCK
+from connect.devops_testing.events import RequestEventListener
+from connect.devops_testing.journal import RequestJournal
+from connect.devops_testing.models import Request
+from connect.devops_testing.pool import RequestPool
+from connect.devops_testing.template import MappedObject, MappedTemplate
+from connect.devops_testing.utils import find_by_id, fingerprint, merge, request_model, request_parameters
 from faker import Faker
 
 _asset_template = {
@@ -77,18 +86,91 @@ def _param_members(
     return {key: new_value, 'value_error': value_error}
 
 
+def _request_param(param_id: str, value_type: str) -> dict:
+    return {
+        'id': param_id,
+        'name': param_id,
+        'title': f'Request parameter {param_id}',
+        'description': f'Request parameter description of {param_id}',
+        'type': value_type,
+    }
+
+
+def _asset_param(param_id: str, value_type: str) -> dict:
+    return {
+        'id': param_id,
+        'name': param_id,
+        'title': f'Asset parameter {param_id}',
+        'description': f'Asset parameter description of {param_id}',
+        'type': value_type,
+    }
+
+
+def _asset_configuration_param(param_id: str, value_type: str) -> dict:
+    return {
+        'id': param_id,
+        'name': param_id,
+        'title': f'Asset configuration parameter {param_id}',
+        'description': f'Asset parameter configuration description of {param_id}',
+        'type': value_type,
+    }
+
+
+def _tier_configuration_param(param_id: str, value_type: str) -> dict:
+    return {
+        'id': param_id,
+        'name': param_id,
+        'title': f'Configuration parameter {param_id}',
+        'description': f'Configuration parameter description of {param_id}',
+        'type': value_type,
+    }
+
+
+def _tier_configuration_configuration_param(param_id: str, value_type: str) -> dict:
+    return {
+        'id': param_id,
+        'title': f'Configuration parameter {param_id}',
+        'description': f'Configuration parameter description of {param_id}',
+        'type': value_type,
+    }
+
+
 class Builder:
-    def __init__(self, request: Optional[dict] = None):
+    def __init__(self, request: Optional[Union[dict, Request, MappedObject]] = None):
         if request is None:
             request = {}
-
-        if not isinstance(request, dict):
+        elif isinstance(request, Request):
+            request = request.to_dict()
+
+        if isinstance(request, MappedObject):
+            self._original = request
+            self._working = None
+        elif isinstance(request, dict):
+            self._original = deepcopy(request)
+            self._working = deepcopy(request)
+        else:
             raise ValueError('Request must be a dictionary.')
 
-        self._original = deepcopy(request)
-        self._request = deepcopy(request)
         self._fake = Faker(['en_US'])
 
+    @property
+    def _request(self) -> dict:
+        if self._working is None:
+            self._working = self._materialize()
+        return self._working
+
+    @_request.setter
+    def _request(self, request: dict):
+        self._working = request
+
+    def _is_lazy(self) -> bool:
+        return isinstance(self._original, MappedObject)
+
+    def _materialize(self) -> dict:
+        if self._is_lazy():
+            return self._original.materialize()
+        return deepcopy(self._original)
+
     def _make_tier(self, tier_type: str = 'customer') -> dict:
         return {
             "name": self._fake.company(),
@@ -117,9 +199,26 @@ class Builder:
         }
 
     @classmethod
-    def from_file(cls, path: str) -> Builder:
-        with open(path) as file:
-            return cls(request=json.load(file))
+    def from_file(cls, path: str, lazy: bool = False) -> Builder:
+        """
+        Creates a builder from a JSON request template file.
+
+        With ``lazy`` the file is memory-mapped and kept as the immutable
+        template instead of being loaded and copied twice, the request being
+        built is parsed from the mapped file when first needed (instead of
+        deep-copying the template after each build) and handed over by
+        ``build`` without copying it, useful for very large templates. Close
+        the builder (or use it as context manager) to release the mapping.
+
+        :param path: str The template file path.
+        :param lazy: bool True to memory-map the template.
+        :return: Builder The builder.
+        """
+        if lazy:
+            return cls(request=MappedTemplate(path))
+
+        with open(path, 'rb') as file:
+            return cls(request=serialization.load(file))
 
     @classmethod
     def from_default_asset(cls) -> Builder:
@@ -162,11 +261,40 @@ class Builder:
         self._request = merge(self._request, {'status': request_status})
         return self
 
-    def with_params(self, params: List[dict]) -> Builder:
-        for param in params:
-            self.with_param(**param)
+    def _upsert_params(
+            self,
+            path: Tuple[str, ...],
+            params: List[dict],
+            make_param: Callable[[str, str], dict],
+    ) -> Builder:
+        container = self._request
+        for key in path[:-1]:
+            if container.get(key) is None:
+                container[key] = {}
+            container = container[key]
+        if container.get(path[-1]) is None:
+            container[path[-1]] = []
+        collection = container[path[-1]]
+
+        index = {}
+        for param in collection:
+            index.setdefault(param['id'], param)
+
+        for update in params:
+            param_id = update['param_id']
+            param = index.get(param_id)
+            if param is None:
+                param = index[param_id] = make_param(param_id, update.get('value_type', 'text'))
+                collection.append(param)
+
+            members = _param_members(param, update.get('value'), update.get('value_error'))
+            param.update({k: v for k, v in members.items() if v is not None})
+
         return self
 
+    def with_params(self, params: List[dict]) -> Builder:
+        return self._upsert_params(('params',), params, _request_param)
+
     def with_param(
             self,
             param_id: str,
@@ -174,21 +302,12 @@ class Builder:
             value_error: Optional[str] = None,
             value_type: str = 'text',
     ) -> Builder:
-        param = find_by_id(self._request.get('params', []), param_id)
-
-        if param is None:
-            param = {
-                'id': param_id,
-                'name': param_id,
-                'title': f'Request parameter {param_id}',
-                'description': f'Request parameter description of {param_id}',
-                'type': value_type,
-            }
-            self._request = merge(self._request, {'params': [param]})
-
-        members = _param_members(param, value, value_error)
-        param.update({k: v for k, v in members.items() if v is not None})
-        return self
+        return self.with_params([{
+            'param_id': param_id,
+            'value': value,
+            'value_error': value_error,
+            'value_type': value_type,
+        }])
 
     def with_marketplace(self, marketplace_id: str, marketplace_name: str = None) -> Builder:
         marketplace = {'id': marketplace_id}
@@ -309,9 +428,7 @@ class Builder:
         return self.with_asset_tier('tier2', tier2_id)
 
     def with_asset_params(self, params: List[dict]) -> Builder:
-        for param in params:
-            self.with_asset_param(**param)
-        return self
+        return self._upsert_params(('asset', 'params'), params, _asset_param)
 
     def with_asset_param(
             self,
@@ -320,21 +437,12 @@ class Builder:
             value_error: Optional[str] = None,
             value_type: str = 'text',
     ) -> Builder:
-        param = find_by_id(self._request.get('asset', {}).get('params', []), param_id)
-
-        if param is None:
-            param = {
-                'id': param_id,
-                'name': param_id,
-                'title': f'Asset parameter {param_id}',
-                'description': f'Asset parameter description of {param_id}',
-                'type': value_type,
-            }
-            self._request = merge(self._request, {'asset': {'params': [param]}})
-
-        members = _param_members(param, value, value_error)
-        param.update({k: v for k, v in members.items() if v is not None})
-        return self
+        return self.with_asset_params([{
+            'param_id': param_id,
+            'value': value,
+            'value_error': value_error,
+            'value_type': value_type,
+        }])
 
     def with_asset_items(self, items: List[dict]) -> Builder:
         for item in items:
@@ -408,9 +516,7 @@ class Builder:
         return self
 
     def with_asset_configuration_params(self, params: List[dict]) -> Builder:
-        for param in params:
-            self.with_asset_configuration_param(**param)
-        return self
+        return self._upsert_params(('asset', 'configuration', 'params'), params, _asset_configuration_param)
 
     def with_asset_configuration_param(
             self,
@@ -419,21 +525,12 @@ class Builder:
             value_error: Optional[str] = None,
             value_type: str = 'text',
     ) -> Builder:
-        param = find_by_id(self._request.get('asset', {}).get('configuration', {}).get('params', []), param_id)
-
-        if param is None:
-            param = {
-                'id': param_id,
-                'name': param_id,
-                'title': f'Asset configuration parameter {param_id}',
-                'description': f'Asset parameter configuration description of {param_id}',
-                'type': value_type,
-            }
-            self._request = merge(self._request, {'asset': {'configuration': {'params': [param]}}})
-
-        members = _param_members(param, value, value_error)
-        param.update({k: v for k, v in members.items() if v is not None})
-        return self
+        return self.with_asset_configuration_params([{
+            'param_id': param_id,
+            'value': value,
+            'value_error': value_error,
+            'value_type': value_type,
+        }])
 
     def with_tier_configuration_id(self, tier_configuration_id: str) -> Builder:
         self._request = merge(self._request, {'configuration': {'id': tier_configuration_id}})
@@ -526,9 +623,8 @@ class Builder:
         return self
 
     def with_tier_configuration_params(self, params: List[dict]) -> Builder:
-        for param in params:
-            self.with_tier_configuration_param(**param)
-        return self
+        self._upsert_params(('configuration', 'params'), params, _tier_configuration_param)
+        return self.with_params(params)
 
     def with_tier_configuration_param(
             self,
@@ -537,21 +633,12 @@ class Builder:
             value_error: Optional[str] = None,
             value_type: str = 'text',
     ) -> Builder:
-        param = find_by_id(self._request.get('configuration', {}).get('params', []), param_id)
-        if param is None:
-            param = {
-                'id': param_id,
-                'name': param_id,
-                'title': f'Configuration parameter {param_id}',
-                'description': f'Configuration parameter description of {param_id}',
-                'type': value_type,
-            }
-            self._request = merge(self._request, {'configuration': {'params': [param]}})
-
-        members = _param_members(param, value, value_error)
-        param.update({k: v for k, v in members.items() if v is not None})
-
-        return self.with_param(param_id, value, value_error, value_type)
+        return self.with_tier_configuration_params([{
+            'param_id': param_id,
+            'value': value,
+            'value_error': value_error,
+            'value_type': value_type,
+        }])
 
     def with_tier_configuration_configuration_param(
             self,
@@ -560,46 +647,99 @@ class Builder:
             value_error: Optional[str] = None,
             value_type: str = 'text',
     ) -> Builder:
-        param = find_by_id(
-            self._request.get('configuration', {}).get('configuration', {}).get('params', []),
-            param_id,
+        return self._upsert_params(
+            ('configuration', 'configuration', 'params'),
+            [{'param_id': param_id, 'value': value, 'value_error': value_error, 'value_type': value_type}],
+            _tier_configuration_configuration_param,
         )
-        if param is None:
-            param = {
-                'id': param_id,
-                'title': f'Configuration parameter {param_id}',
-                'description': f'Configuration parameter description of {param_id}',
-                'type': value_type,
-            }
-            self._request = merge(self._request, {'configuration': {'configuration': {'params': [param]}}})
 
-        members = _param_members(param, value, value_error)
-        param.update({k: v for k, v in members.items() if v is not None})
+    def copy(self) -> Builder:
+        """
+        Provides an independent builder with the same state (template and
+        request being built), sharing the random data generator.
 
-        return self
+        :return: Builder The builder copy.
+        """
+        builder = copy(self)
+        builder._original = self._original if self._is_lazy() else deepcopy(self._original)
+        builder._working = None if self._working is None else deepcopy(self._working)
+        return builder
 
     def build(self) -> dict:
-        request = deepcopy(self._request)
-        self._request = deepcopy(self._original)
+        request = self._request if self._is_lazy() else deepcopy(self._request)
+        self._working = None
 
         return request
 
+    def close(self):
+        """
+        Releases the memory-mapped template of a lazy builder, the template is
+        shared with the builder copies so they can not build anymore either.
+
+        :return: None
+        """
+        if isinstance(self._original, MappedTemplate):
+            self._original.close()
+
+    def __enter__(self) -> Builder:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def build_model(self) -> Request:
+        """
+        Builds the request as a typed Request model.
+
+        :return: Request The request model.
+        """
+        return Request.from_dict(self.build())
+
 
 class Dispatcher:
-    def __init__(self, client: ConnectClient, timeout: int = 10, max_attempts: int = 20):
+    def __init__(
+            self,
+            client: ConnectClient,
+            timeout: int = 10,
+            max_attempts: int = 20,
+            listener: Optional[RequestEventListener] = None,
+            cache: Optional[RequestCache] = None,
+            freshness: float = 0,
+            journal: Optional[RequestJournal] = None,
+            clock: Optional[Clock] = None,
+    ):
+        self._clock = SYSTEM_CLOCK if clock is None else clock
         self._handlers = [
-            _AssetRequestRepository(client, 'asset'),
-            _TierConfigRequestRepository(client, 'tier-config'),
+            _AssetRequestRepository(client, 'asset', freshness, self._clock),
+            _TierConfigRequestRepository(client, 'tier-config', freshness, self._clock),
         ]
         self._timeout = timeout
         self._max_attempts = max_attempts
+        self._listener = listener
+        self._cache = cache
+        self._in_flight = {}
+        self._pools = {}
+        self._journal = journal
+        self._created = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
 
     def _get_request_handler(self, request: dict) -> Optional[_RequestRepository]:
         filtered = list(filter(lambda handler: handler.is_type_valid(request), self._handlers))
         return filtered[0] if filtered else None
 
+    def _track_request(self, request: dict):
+        entry = {'id': request.get('id'), 'type': request.get('type')}
+        with self._lock:
+            self._created.append(entry)
+        if self._journal is not None:
+            self._journal.record(entry)
+
     def _save_request(self, request) -> dict:
-        return self._get_request_handler(request).save(request)
+        saved = self._get_request_handler(request).save(request)
+        if request.get('id') is None:
+            self._track_request(saved)
+        return saved
 
     def _schedule_request(self, request) -> dict:
         return self._get_request_handler(request).schedule(request)
@@ -607,39 +747,122 @@ class Dispatcher:
     def _revoke_request(self, request) -> dict:
         return self._get_request_handler(request).revoke(request)
 
+    def _wait(self, request_id: str, timeout: int):
+        if self._listener is None:
+            self._clock.sleep(timeout)
+        else:
+            self._listener.wait(request_id, max(timeout, self._listener.fallback_timeout))
+
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
+    def find_request(self, request: dict, latest: bool = False) -> dict:
+        """
+        Reloads the given request from the Connect platform.
+
+        :param request: dict The request to reload (only id and type are required).
+        :param latest: bool True to skip the freshness window of the dispatcher.
+        :return: dict The current state of the request.
+        """
+        return self._get_request_handler(request).find(request.get('id'), latest=latest)
+
     def _fetch_processed_request(self, request: dict, timeout: int, max_attempt: int) -> dict:
         finder = self._get_request_handler(request)
 
         attempts = 0
-        request = finder.find(request.get('id'))
+        request = finder.find(request.get('id'), latest=True)
 
         while request['status'] in ['pending', 'revoking'] and attempts <= max_attempt:
             attempts += 1
-            time.sleep(timeout)
-            request = finder.find(request.get('id'))
+            self._wait(request.get('id'), timeout)
+            request = finder.find(request.get('id'), latest=True)
 
         return request
 
+    def _memoize(self, request: dict, provision: Callable[[], dict]) -> dict:
+        key = fingerprint(request)
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+
+        if not owner:
+            return deepcopy(future.result())
+
+        # the cache I/O runs outside the lock, the in-flight future already
+        # deduplicates the identical requests.
+        try:
+            processed = self._cache.get(key)
+            if processed is None:
+                processed = provision()
+                if processed.get('status') not in ['pending', 'revoking']:
+                    self._cache.set(key, processed)
+            future.set_result(processed)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+        return deepcopy(processed)
+
     def provision_request(
             self,
             request: dict,
             timeout: Optional[int] = None,
             max_attempt: Optional[int] = None,
+            memoize: bool = True,
     ) -> dict:
         """
         Provision the given request into the Connect platform and waits util
         the request is processed by some processor (can be manually processed)
 
+        If the dispatcher has a cache, a new request identical to an already
+        processed (or in-flight) one returns that result instead of creating
+        a duplicated request into the Connect platform.
+
         :param request: dict The request to be processed.
         :param timeout: int The amount of time in seconds to wait each pull.
         :param max_attempt: int The max number of pull attempts.
+        :param memoize: bool False to always create the request even if cached.
         :return: dict The processed request.
         """
-        return self._fetch_processed_request(
-            request=self._save_request(request),
-            timeout=self._timeout if timeout is None else timeout,
-            max_attempt=self._max_attempts if max_attempt is None else max_attempt,
-        )
+
+        def _provision() -> dict:
+            return self._fetch_processed_request(
+                request=self._save_request(request),
+                timeout=self._timeout if timeout is None else timeout,
+                max_attempt=self._max_attempts if max_attempt is None else max_attempt,
+            )
+
+        if self._cache is None or not memoize or request.get('id') is not None:
+            return _provision()
+
+        return self._memoize(request, _provision)
+
+    def submit_request(
+            self,
+            request: dict,
+            timeout: Optional[int] = None,
+            max_attempt: Optional[int] = None,
+    ) -> Future:
+        """
+        Provision the given request into the Connect platform in background,
+        the returned future is resolved once the request is processed.
+
+        :param request: dict The request to be processed.
+        :param timeout: int The amount of time in seconds to wait each pull.
+        :param max_attempt: int The max number of pull attempts.
+        :return: Future The future of the processed request.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix='dispatcher')
+
+            return self._executor.submit(self.provision_request, request, timeout, max_attempt)
 
     def schedule_request(
             self,
@@ -683,20 +906,183 @@ class Dispatcher:
             max_attempt=self._max_attempts if max_attempt is None else max_attempt,
         )
 
+    def warm_pool(
+            self,
+            template: dict,
+            size: int = 1,
+            status: str = 'inquiring',
+            timeout: Optional[int] = None,
+            max_attempt: Optional[int] = None,
+    ) -> RequestPool:
+        """
+        Provides a started pool that keeps ``size`` requests created from the
+        given template pre-provisioned in the given status. The same pool is
+        returned for the same template and status, grown to the given size if
+        it keeps fewer requests.
+
+        :param template: dict The request to create on each pool refill.
+        :param size: int The amount of requests to keep ready.
+        :param status: str The status the pooled requests must reach.
+        :param timeout: int The amount of time in seconds to wait each pull.
+        :param max_attempt: int The max number of pull attempts.
+        :return: RequestPool The request pool.
+        """
+        key = (fingerprint(template), status)
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = RequestPool(
+                    dispatcher=self,
+                    template=template,
+                    size=size,
+                    status=status,
+                    timeout=timeout,
+                    max_attempt=max_attempt,
+                ).start()
+
+            return self._pools[key].grow(size)
+
+    @property
+    def created_requests(self) -> List[dict]:
+        """
+        The requests (id and type) created by this dispatcher and not yet cleaned up.
+        """
+        with self._lock:
+            return list(self._created)
+
+    def discard_requests(self, requests: List[dict], max_workers: int = 8) -> Dict[str, Union[str, Exception]]:
+        """
+        Discards concurrently the given requests from the Connect platform: the
+        pending or inquiring ones are failed and the scheduled ones are revoked,
+        the others are left untouched.
+
+        :param requests: List[dict] The requests to discard (id and type are required).
+        :param max_workers: int The max amount of requests discarded in parallel.
+        :return: Dict[str, Union[str, Exception]] The resulting status (or error) by request id.
+        """
+        def _discard(request: dict) -> Union[str, Exception]:
+            try:
+                return self._get_request_handler(request).discard(request)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_discard, requests)
+            return {request.get('id'): result for request, result in zip(requests, results)}
+
+    def cleanup(self, max_workers: int = 8) -> Dict[str, Union[str, Exception]]:
+        """
+        Discards all the requests created by this dispatcher. The requests that
+        could not be discarded are kept for a later cleanup.
+
+        :param max_workers: int The max amount of requests discarded in parallel.
+        :return: Dict[str, Union[str, Exception]] The resulting status (or error) by request id.
+        """
+        with self._lock:
+            created, self._created = self._created, []
+
+        results = self.discard_requests(created, max_workers)
+        remaining = [entry for entry in created if isinstance(results.get(entry.get('id')), Exception)]
+
+        with self._lock:
+            self._created = remaining + self._created
+        if self._journal is not None:
+            discarded = {entry.get('id') for entry in created} - {entry.get('id') for entry in remaining}
+            self._journal.rewrite([e for e in self._journal.entries() if e.get('id') not in discarded])
+
+        return results
+
+    def close(self):
+        """
+        Stops all the background work (request pools and submitted requests)
+        of the dispatcher.
+
+        :return: None
+        """
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+            executor, self._executor = self._executor, None
+
+        for pool in pools:
+            pool.close()
+
+        if executor is not None:
+            executor.shutdown()
+
 
 class _RequestRepository:
-    def __init__(self, client: ConnectClient, model: str):
+    def __init__(self, client: ConnectClient, model: str, freshness: float = 0, clock: Optional[Clock] = None):
         self._client = client
         self._model = model
+        self._freshness = freshness
+        self._clock = SYSTEM_CLOCK if clock is None else clock
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._fetched: OrderedDict = OrderedDict()
 
     def is_type_valid(self, request: dict) -> bool:
         return request_model(request) == self._model
 
-    @abstractmethod
-    def find(self, request_id: str) -> dict:  # pragma: no cover
+    def _is_fresh(self, request_id: str) -> bool:
+        fetched = self._fetched.get(request_id)
+        return fetched is not None and self._clock.monotonic() - fetched[0] <= self._freshness
+
+    def _forget(self, request_id: Optional[str]):
+        with self._lock:
+            self._fetched.pop(request_id, None)
+
+    def _remember(self, request_id: str, request: dict):
+        now = self._clock.monotonic()
+        self._fetched.pop(request_id, None)
+        self._fetched[request_id] = (now, request)
+        while now - next(iter(self._fetched.values()))[0] > self._freshness:
+            self._fetched.popitem(last=False)
+
+    def find(self, request_id: str, latest: bool = False) -> dict:
         """
         Find a request by id.
 
+        Concurrent finds of the same request id share a single call to the
+        Connect platform, and the response is reused during the freshness
+        window unless the latest state is requested.
+
+        :param request_id: str The request id
+        :param latest: bool True to skip the freshness window, used when
+                       polling the request until it changes.
+        :return: dict The request dictionary
+        """
+        with self._lock:
+            if not latest and self._is_fresh(request_id):
+                return deepcopy(self._fetched[request_id][1])
+
+            future = self._in_flight.get(request_id)
+            owner = future is None
+            if owner:
+                future = self._in_flight[request_id] = Future()
+
+        if not owner:
+            return deepcopy(future.result())
+
+        try:
+            request = self._get(request_id)
+        except Exception as e:
+            with self._lock:
+                self._in_flight.pop(request_id, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._in_flight.pop(request_id, None)
+            if self._freshness > 0:
+                self._remember(request_id, request)
+        future.set_result(request)
+
+        return deepcopy(request)
+
+    @abstractmethod
+    def _get(self, request_id: str) -> dict:  # pragma: no cover
+        """
+        Get a request by id from the Connect Platform.
+
         :param request_id: str The request id
         :return: dict The request dictionary
         """
@@ -728,9 +1114,19 @@ class _RequestRepository:
         :return: dict The request dictionary
         """
 
+    @abstractmethod
+    def discard(self, request: dict) -> str:  # pragma: no cover
+        """
+        Discards the request from the Connect Platform (fail or revoke
+        depending on its current status).
+
+        :param request: dict The request to discard.
+        :return: str The resulting request status.
+        """
+
 
 class _AssetRequestRepository(_RequestRepository):
-    def find(self, request_id: str) -> dict:
+    def _get(self, request_id: str) -> dict:
         return self._client.requests[request_id].get()
 
     def save(self, request: dict) -> dict:
@@ -741,7 +1137,7 @@ class _AssetRequestRepository(_RequestRepository):
             )
 
         else:
-            current = self.find(request.get('id'))
+            current = self.find(request.get('id'), latest=True)
             params = zip(
                 request_parameters(current.get('asset', {}).get('params', [])),
                 request_parameters(request.get('asset', {}).get('params', [])),
@@ -757,20 +1153,42 @@ class _AssetRequestRepository(_RequestRepository):
                         'asset': {'params': difference},
                     },
                 )
+                self._forget(request.get('id'))
 
         return request
 
     def revoke(self, request: dict) -> dict:
         shortcut = self._client.requests
-        current = self.find(request.get('id'))
+        current = self.find(request.get('id'), latest=True)
         if current.get('status') == 'scheduled':
             shortcut[request.get('id')].action('revoke').post(
                 payload={
                     'reason': 'Revoked from E2E tests',
                 },
             )
+            self._forget(request.get('id'))
         return request
 
+    def discard(self, request: dict) -> str:
+        shortcut = self._client.requests
+        status = self.find(request.get('id'), latest=True).get('status')
+        if status in ['pending', 'inquiring']:
+            shortcut[request.get('id')].action('fail').post(
+                payload={
+                    'reason': 'Discarded from E2E tests',
+                },
+            )
+            status = 'failed'
+        elif status == 'scheduled':
+            shortcut[request.get('id')].action('revoke').post(
+                payload={
+                    'reason': 'Discarded from E2E tests',
+                },
+            )
+            status = 'revoking'
+        self._forget(request.get('id'))
+        return status
+
     def schedule(self, request: dict) -> dict:
         shortcut = self._client.requests
         req_current = shortcut[request.get('id')].get()
@@ -780,11 +1198,12 @@ class _AssetRequestRepository(_RequestRepository):
                     'planned_date': (datetime.now() + timedelta(days=10)).isoformat(),
                 },
             )
+            self._forget(request.get('id'))
         return request
 
 
 class _TierConfigRequestRepository(_RequestRepository):
-    def find(self, request_id: str) -> dict:
+    def _get(self, request_id: str) -> dict:
         return self._client.ns('tier').config_requests[request_id].get()
 
     def save(self, request: dict) -> dict:
@@ -795,7 +1214,7 @@ class _TierConfigRequestRepository(_RequestRepository):
             )
 
         else:
-            current = self.find(request.get('id'))
+            current = self.find(request.get('id'), latest=True)
             params = zip(
                 request_parameters(current.get('params', [])),
                 request_parameters(request.get('params', [])),
@@ -811,9 +1230,23 @@ class _TierConfigRequestRepository(_RequestRepository):
                         'params': difference,
                     },
                 )
+                self._forget(request.get('id'))
 
         return request
 
+    def discard(self, request: dict) -> str:
+        shortcut = self._client.ns('tier').config_requests
+        status = self.find(request.get('id'), latest=True).get('status')
+        if status in ['pending', 'inquiring']:
+            shortcut[request.get('id')].action('fail').post(
+                payload={
+                    'reason': 'Discarded from E2E tests',
+                },
+            )
+            status = 'failed'
+        self._forget(request.get('id'))
+        return status
+
     def schedule(self, request: dict) -> dict:
         """ not applicable """
 
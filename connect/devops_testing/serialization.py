@@ -0,0 +1,143 @@
+import json
+import os
+from typing import Any, Callable, IO, Optional, Tuple, Union
+
+JSON_BACKEND_ENV = 'CONNECT_JSON_BACKEND'
+
+BACKENDS = ('orjson', 'ujson', 'msgspec', 'json')
+
+Loads = Callable[[Union[str, bytes]], Any]
+Dumps = Callable[[Any, bool, bool, Optional[Callable[[Any], Any]]], str]
+
+
+def _json() -> Tuple[Loads, Dumps]:
+    def _dumps(value: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]) -> str:
+        return json.dumps(
+            value,
+            indent=2 if indent else None,
+            separators=(',', ': ') if indent else (',', ':'),
+            sort_keys=sort_keys,
+            default=default,
+            ensure_ascii=False,
+        )
+
+    return json.loads, _dumps
+
+
+def _orjson() -> Tuple[Loads, Dumps]:
+    import orjson
+
+    def _dumps(value: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, default=default, option=option).decode('utf-8')
+
+    return orjson.loads, _dumps
+
+
+def _ujson() -> Tuple[Loads, Dumps]:
+    import ujson
+
+    def _dumps(value: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]) -> str:
+        return ujson.dumps(
+            value,
+            indent=2 if indent else 0,
+            sort_keys=sort_keys,
+            default=default,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+        )
+
+    return ujson.loads, _dumps
+
+
+def _msgspec() -> Tuple[Loads, Dumps]:
+    import msgspec
+
+    def _loads(data: Union[str, bytes]) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def _dumps(value: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]) -> str:
+        encoded = msgspec.json.encode(value, enc_hook=default, order='sorted' if sort_keys else None)
+        if indent:
+            encoded = msgspec.json.format(encoded, indent=2)
+        return encoded.decode('utf-8')
+
+    return _loads, _dumps
+
+
+_FACTORIES = {'orjson': _orjson, 'ujson': _ujson, 'msgspec': _msgspec, 'json': _json}
+
+
+def select_backend(name: Optional[str] = None) -> Tuple[str, Loads, Dumps]:
+    """
+    Selects the JSON backend, the given one or else the fastest installed
+    one (orjson, ujson, msgspec and the standard json module as fallback).
+
+    :param name: Optional[str] The backend name.
+    :return: Tuple[str, Loads, Dumps] The backend name and its functions.
+    """
+    if name is not None:
+        if name not in _FACTORIES:
+            raise ValueError(f"Unknown JSON backend '{name}', use one of {', '.join(BACKENDS)}.")
+        return (name, *_FACTORIES[name]())
+
+    for backend in BACKENDS:
+        try:
+            return (backend, *_FACTORIES[backend]())
+        except ImportError:
+            continue
+    raise ImportError('No JSON backend available.')  # pragma: no cover
+
+
+BACKEND, _loads, _dumps = select_backend(os.environ.get(JSON_BACKEND_ENV) or None)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses the given JSON document with the selected backend.
+
+    :param data: Union[str, bytes] The JSON document.
+    :return: Any The parsed value.
+    :raises ValueError: If the document is not valid JSON.
+    """
+    return _loads(data)
+
+
+def dumps(
+        value: Any,
+        indent: bool = False,
+        sort_keys: bool = False,
+        default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Serializes the given value with the selected backend, compact or indented
+    with two spaces, the non-ASCII characters are not escaped.
+
+    :param value: Any The value to serialize.
+    :param indent: bool True to indent the document.
+    :param sort_keys: bool True to sort the object keys.
+    :param default: Optional[Callable[[Any], Any]] Converts the unsupported values.
+    :return: str The JSON document.
+    """
+    return _dumps(value, indent, sort_keys, default)
+
+
+def load(file: IO) -> Any:
+    return loads(file.read())
+
+
+def dump(
+        value: Any,
+        file: IO[str],
+        indent: bool = False,
+        sort_keys: bool = False,
+        default: Optional[Callable[[Any], Any]] = None,
+):
+    file.write(dumps(value, indent, sort_keys, default))
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from connect.devops_testing import serialization
+
+UPDATE_SNAPSHOTS_ENV = 'CONNECT_UPDATE_SNAPSHOTS'
+
+_Path = Tuple[str, ...]
+
+
+def compile_rules(ignore: Optional[Iterable[str]]) -> List[_Path]:
+    """
+    Compiles the ignore rules, dotted paths where each segment is a glob
+    (``*`` matches any key, element id or index) and ``**`` matches any
+    amount of segments, for example ``id``, ``asset.tiers.*.id`` or
+    ``**.created``.
+
+    :param ignore: Optional[Iterable[str]] The ignore rules.
+    :return: List[Tuple[str, ...]] The compiled rules.
+    """
+    return [tuple(rule.split('.')) for rule in ignore or []]
+
+
+def _matches(path: _Path, rule: _Path) -> bool:
+    if not rule:
+        return not path
+    if rule[0] == '**':
+        return any(_matches(path[position:], rule[1:]) for position in range(len(path) + 1))
+    return bool(path) and fnmatchcase(path[0], rule[0]) and _matches(path[1:], rule[1:])
+
+
+def _is_ignored(path: _Path, rules: List[_Path]) -> bool:
+    return any(_matches(path, rule) for rule in rules)
+
+
+def _children(node: Any) -> List[Tuple[str, Any]]:
+    if isinstance(node, dict):
+        return [(str(key), value) for key, value in node.items()]
+    return [
+        (str(element['id']) if isinstance(element, dict) and 'id' in element else str(position), element)
+        for position, element in enumerate(node)
+    ]
+
+
+def normalize(node: Any, rules: List[_Path], path: _Path = ()) -> Any:
+    """
+    Removes the ignored paths from the given request (or subtree).
+
+    :param node: Any The request or subtree.
+    :param rules: List[Tuple[str, ...]] The compiled ignore rules.
+    :param path: Tuple[str, ...] The path of the subtree.
+    :return: Any The normalized copy.
+    """
+    if not rules or not isinstance(node, (dict, list)):
+        return node
+
+    kept = [
+        (segment, normalize(child, rules, path + (segment,)))
+        for segment, child in _children(node)
+        if not _is_ignored(path + (segment,), rules)
+    ]
+    if isinstance(node, dict):
+        return dict(kept)
+    return [value for _, value in kept]
+
+
+class _Hasher:
+    def __init__(self):
+        self._digests: Dict[int, bytes] = {}
+
+    def digest(self, node: Any) -> bytes:
+        key = id(node)
+        digest = self._digests.get(key)
+        if digest is not None:
+            return digest
+
+        hasher = hashlib.blake2b(digest_size=16)
+        if isinstance(node, (dict, list)):
+            hasher.update(b'{' if isinstance(node, dict) else b'[')
+            children = _children(node)
+            if isinstance(node, dict):
+                children.sort(key=lambda child: child[0])
+            for segment, child in children:
+                hasher.update(segment.encode('utf-8'))
+                hasher.update(self.digest(child))
+        else:
+            hasher.update(json.dumps(node, default=str).encode('utf-8'))
+
+        digest = self._digests[key] = hasher.digest()
+        return digest
+
+
+def _format(value: Any) -> str:
+    return json.dumps(value, default=str, sort_keys=True)
+
+
+def _is_container_pair(expected: Any, actual: Any) -> bool:
+    return (
+        (isinstance(expected, dict) and isinstance(actual, dict))
+        or (isinstance(expected, list) and isinstance(actual, list))
+    )
+
+
+def _join(path: str, segment: str) -> str:
+    return f'{path}.{segment}' if path else segment
+
+
+class _Differ:
+    def __init__(self):
+        self._expected = _Hasher()
+        self._actual = _Hasher()
+        self.differences: List[str] = []
+
+    def compare(self, expected: Any, actual: Any, path: str = ''):
+        if self._expected.digest(expected) == self._actual.digest(actual):
+            return
+
+        if not _is_container_pair(expected, actual):
+            self.differences.append(f'~ {path or "."}: {_format(expected)} -> {_format(actual)}')
+            return
+
+        expected_children = dict(_children(expected))
+        actual_children = dict(_children(actual))
+        for segment, child in expected_children.items():
+            if segment in actual_children:
+                self.compare(child, actual_children[segment], _join(path, segment))
+            else:
+                self.differences.append(f'- {_join(path, segment)}: {_format(child)}')
+
+        for segment, child in actual_children.items():
+            if segment not in expected_children:
+                self.differences.append(f'+ {_join(path, segment)}: {_format(child)}')
+
+
+def diff(expected: Any, actual: Any) -> List[str]:
+    """
+    Compares two requests hashing their subtrees, only the subtrees with
+    different hashes are visited. List elements with id are matched by id.
+
+    :param expected: Any The golden request.
+    :param actual: Any The actual request.
+    :return: List[str] The path-level differences (``-`` missing, ``+``
+             unexpected and ``~`` changed paths).
+    """
+    differ = _Differ()
+    differ.compare(expected, actual)
+    return differ.differences
+
+
+def should_update() -> bool:
+    return os.getenv(UPDATE_SNAPSHOTS_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def write_golden(path: str, request: dict):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        serialization.dump(request, file, indent=True, sort_keys=True, default=str)
+        file.write('\n')
+
+
+def read_golden(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as file:
+        return serialization.load(file)
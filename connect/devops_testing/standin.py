@@ -0,0 +1,170 @@
+import itertools
+import random
+import threading
+import time
+from copy import deepcopy
+from typing import Callable, Dict, Optional, Union
+
+Latency = Union[float, Callable[[], float]]
+
+
+def approve(request: dict) -> dict:
+    """
+    Default stand-in processor, approves the request and activates its
+    asset (or tier configuration).
+
+    :param request: dict The pending request.
+    :return: dict The processed request.
+    """
+    request['status'] = 'approved'
+    for key in ('asset', 'configuration'):
+        if isinstance(request.get(key), dict):
+            request[key]['status'] = 'active'
+    return request
+
+
+def jitter(mean: float, deviation: float) -> Callable[[], float]:
+    """
+    Provides a normally distributed latency (never negative).
+
+    :param mean: float The mean latency in seconds.
+    :param deviation: float The standard deviation in seconds.
+    :return: Callable[[], float] The latency provider.
+    """
+    return lambda: max(0.0, random.gauss(mean, deviation))
+
+
+class StandInBackend:
+    def __init__(
+            self,
+            latency: Latency = 0.0,
+            processor: Callable[[dict], dict] = approve,
+            pending_polls: int = 1,
+    ):
+        """
+        In-memory stand-in of the Connect requests API, the pending requests
+        are processed by the given processor after ``pending_polls`` reloads.
+
+        :param latency: Latency The seconds (or latency provider) slept on each call.
+        :param processor: Callable[[dict], dict] The processor of the pending requests.
+        :param pending_polls: int The amount of reloads a request stays pending.
+        """
+        self._latency = latency
+        self._processor = processor
+        self._pending_polls = pending_polls
+        self._requests: Dict[str, dict] = {}
+        self._polls: Dict[str, int] = {}
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def _sleep(self):
+        with self._lock:
+            self.calls += 1
+        latency = self._latency() if callable(self._latency) else self._latency
+        if latency > 0:
+            time.sleep(latency)
+
+    def create(self, prefix: str, payload: dict) -> dict:
+        self._sleep()
+        request = deepcopy(payload)
+        with self._lock:
+            request['id'] = f'{prefix}-{next(self._sequence):012d}'
+            request.setdefault('status', 'pending')
+            self._requests[request['id']] = request
+            self._polls[request['id']] = 0
+            return deepcopy(request)
+
+    def get(self, request_id: str) -> dict:
+        self._sleep()
+        with self._lock:
+            request = self._requests[request_id]
+            if request.get('status') == 'pending':
+                self._polls[request_id] += 1
+                if self._polls[request_id] > self._pending_polls:
+                    request = self._requests[request_id] = self._processor(request)
+            return deepcopy(request)
+
+    def update(self, request_id: str, payload: dict) -> dict:
+        self._sleep()
+        with self._lock:
+            request = self._requests[request_id]
+            container = request.get('asset', {}) if 'asset' in payload else request
+            for param in payload.get('asset', payload).get('params', []):
+                current = next((p for p in container.get('params', []) if p.get('id') == param.get('id')), None)
+                if current is not None:
+                    current.update(param)
+            return deepcopy(request)
+
+    def action(self, request_id: str, name: str, payload: Optional[dict] = None) -> dict:
+        self._sleep()
+        statuses = {'pend': 'pending', 'fail': 'failed', 'revoke': 'revoking', 'schedule': 'scheduled'}
+        with self._lock:
+            request = self._requests[request_id]
+            request['status'] = statuses.get(name, request.get('status'))
+            if name == 'pend':
+                self._polls[request_id] = 0
+            if payload is not None and 'reason' in payload:
+                request['reason'] = payload['reason']
+            return deepcopy(request)
+
+
+class _Action:
+    def __init__(self, backend: StandInBackend, request_id: str, name: str):
+        self._backend = backend
+        self._request_id = request_id
+        self._name = name
+
+    def post(self, payload: Optional[dict] = None) -> dict:
+        return self._backend.action(self._request_id, self._name, payload)
+
+
+class _Resource:
+    def __init__(self, backend: StandInBackend, request_id: str):
+        self._backend = backend
+        self._request_id = request_id
+
+    def get(self) -> dict:
+        return self._backend.get(self._request_id)
+
+    def update(self, payload: dict) -> dict:
+        return self._backend.update(self._request_id, payload)
+
+    def action(self, name: str) -> _Action:
+        return _Action(self._backend, self._request_id, name)
+
+
+class _Collection:
+    def __init__(self, backend: StandInBackend, prefix: str):
+        self._backend = backend
+        self._prefix = prefix
+
+    def create(self, payload: dict) -> dict:
+        return self._backend.create(self._prefix, payload)
+
+    def __getitem__(self, request_id: str) -> _Resource:
+        return _Resource(self._backend, request_id)
+
+
+class _Namespace:
+    def __init__(self, backend: StandInBackend):
+        self.config_requests = _Collection(backend, 'TCR')
+
+
+class StandInClient:
+    def __init__(self, backend: Optional[StandInBackend] = None, **kwargs):
+        """
+        Offline stand-in of the ConnectClient for the requests used by the
+        Dispatcher, useful for benchmarks and load tests. The keyword arguments
+        are passed to the StandInBackend if no backend is given.
+
+        :param backend: Optional[StandInBackend] The in-memory backend.
+        """
+        self.backend = StandInBackend(**kwargs) if backend is None else backend
+        self.requests = _Collection(self.backend, 'PR')
+        self._tier = _Namespace(self.backend)
+
+    def ns(self, name: str) -> _Namespace:
+        if name != 'tier':
+            raise ValueError(f'Unsupported namespace {name}.')
+        return self._tier
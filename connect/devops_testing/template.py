@@ -0,0 +1,135 @@
+import mmap
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from connect.devops_testing import serialization
+
+_TOKENS = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\],:]', re.DOTALL)
+_WHITESPACE = b' \t\r\n'
+
+_Spans = Dict[str, Tuple[int, int]]
+
+
+class _Index:
+    def __init__(self, buffer: mmap.mmap):
+        """
+        Key spans of every object of a mapped JSON document by object offset,
+        built in a single pass the first time any object view needs its keys
+        and shared by all the views of the same buffer.
+
+        :param buffer: mmap.mmap The mapped file.
+        """
+        self.buffer = buffer
+        self._objects: Optional[Dict[int, _Spans]] = None
+
+    def spans(self, start: int) -> _Spans:
+        if self._objects is None:
+            self._objects = self._scan()
+        return self._objects[start]
+
+    def _scan(self) -> Dict[int, _Spans]:
+        objects: Dict[int, _Spans] = {}
+        # each frame is [spans, key, value start] for objects and None for arrays.
+        stack: List[Optional[list]] = []
+        for token in _TOKENS.finditer(self.buffer):
+            symbol = token.group()
+            frame = stack[-1] if stack else None
+            if symbol == b'{':
+                objects[token.start()] = {}
+                stack.append([objects[token.start()], None, None])
+            elif symbol == b'[':
+                stack.append(None)
+            elif symbol in (b'}', b']'):
+                if frame is not None and frame[1] is not None:
+                    frame[0][frame[1]] = (frame[2], token.start())
+                stack.pop()
+            elif frame is None:
+                continue
+            elif symbol == b':':
+                frame[2] = token.end()
+            elif symbol == b',':
+                frame[0][frame[1]] = (frame[2], token.start())
+                frame[1] = None
+            elif frame[1] is None:
+                frame[1] = serialization.loads(symbol)
+        return objects
+
+
+class MappedObject(Mapping):
+    def __init__(self, index: _Index, start: int, end: int):
+        """
+        Read-only view of a JSON object of a memory-mapped file. Each value is
+        parsed from the mapped bytes when accessed, nested objects are provided
+        as views too so only the accessed subtrees are materialized. Each access
+        provides a new copy, the mapped source is never modified.
+
+        :param index: _Index The key spans of the mapped file.
+        :param start: int The offset of the opening brace.
+        :param end: int The offset after the closing brace.
+        """
+        self._index = index
+        self._start = start
+        self._end = end
+
+    def __getitem__(self, key: str) -> Any:
+        buffer = self._index.buffer
+        start, end = self._index.spans(self._start)[key]
+        while buffer[start] in _WHITESPACE:
+            start += 1
+        if buffer[start] == ord('{'):
+            return MappedObject(self._index, start, end)
+        return serialization.loads(buffer[start:end])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.spans(self._start))
+
+    def __len__(self) -> int:
+        return len(self._index.spans(self._start))
+
+    def __deepcopy__(self, memo: dict) -> 'MappedObject':
+        return self
+
+    def materialize(self) -> dict:
+        """
+        Parses the whole object into a new dictionary, without indexing it.
+
+        :return: dict The parsed object.
+        """
+        return serialization.loads(self._index.buffer[self._start:self._end])
+
+
+class MappedTemplate(MappedObject):
+    def __init__(self, path: str):
+        """
+        Memory-mapped request template, the file content is paged in by the
+        operating system instead of being loaded into the process memory.
+        The mapping is released by ``close`` (or leaving the ``with`` block).
+
+        :param path: str The JSON file path.
+        """
+        with open(path, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        start = 0
+        while start < len(buffer) and buffer[start] in _WHITESPACE:
+            start += 1
+        if start == len(buffer) or buffer[start] != ord('{'):
+            buffer.close()
+            raise ValueError('Request must be a dictionary.')
+
+        super().__init__(_Index(buffer), start, len(buffer))
+        self.path = path
+
+    @property
+    def closed(self) -> bool:
+        return self._index.buffer.closed
+
+    def close(self):
+        self._index.buffer.close()
+
+    def __enter__(self) -> 'MappedTemplate':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,6 +1,10 @@
+import hashlib
+import json
 from copy import deepcopy
 from typing import List, Optional
 
+from connect.devops_testing.models import Params
+
 
 def find_by_id(collection: List, element_id: str, default: Optional[dict] = None) -> Optional[dict]:
     """
@@ -11,6 +15,9 @@ def find_by_id(collection: List, element_id: str, default: Optional[dict] = None
     :param default: Default value to return if item is not found.
     :return: The parameter/list, or ``default`` if it was not found.
     """
+    if isinstance(collection, Params):
+        return collection.find(element_id, default)
+
     filtered = list(filter(lambda element: element['id'] == element_id, collection))
     return filtered[0] if filtered else default
 
@@ -77,3 +84,15 @@ def request_parameters(params: List[dict]) -> List[dict]:
         }
 
     return list(map(_map, params))
+
+
+def fingerprint(request: dict) -> str:
+    """
+    Computes a canonical hash of the given request, two requests with
+    the same content have the same fingerprint regardless of key order.
+
+    :param request: dict The request.
+    :return: str The hex digest of the request.
+    """
+    canonical = json.dumps(request, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
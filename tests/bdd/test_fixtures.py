@@ -1,4 +1,18 @@
-from connect.devops_testing.bdd.fixtures import use_connect_request_dispatcher, use_connect_request_builder
+import subprocess
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from behave.model import Table
+from behave.runner import Context
+
+from connect.devops_testing.bdd.fixtures import (
+    use_connect_request_background,
+    use_connect_request_builder,
+    use_connect_request_dispatcher,
+    use_connect_request_mappings,
+)
 from connect.devops_testing.request import Builder, Dispatcher
 
 
@@ -13,3 +27,134 @@ def test_should_successfully_initialize_request_dispatcher_in_behave_context(beh
 
     assert isinstance(behave_context.connect, Dispatcher)
     assert behave_context.request == {}
+
+
+BACKGROUND_ENVIRONMENT = '''
+from behave import use_fixture
+from connect.devops_testing.bdd.fixtures import use_connect_request_background, use_connect_request_builder
+
+
+def before_all(context):
+    use_fixture(use_connect_request_builder, context)
+
+
+def before_scenario(context, scenario):
+    use_fixture(use_connect_request_background, context, scenario, seed=42)
+'''
+
+BACKGROUND_STEPS = '''
+from behave import step
+from connect.devops_testing.bdd import steps  # noqa: F401
+
+RUNS = []
+
+
+@step('background runs are counted')
+def count_background_runs(context):
+    RUNS.append(context.table[0]['run'])
+
+
+@step('background ran once with product "{product_id}"')
+def background_ran_once(context, product_id):
+    request = context.builder.build()
+    assert RUNS == ['1'], RUNS
+    assert request['asset']['product']['id'] == product_id
+    assert request['asset']['params'] == []
+'''
+
+BACKGROUND_FEATURE = """Feature: Background memoization
+
+  Background:
+    Given asset request
+    And request with product "PRD-000-000-001"
+    And background runs are counted
+      | run |
+      | 1   |
+
+  Scenario: First
+    Then background ran once with product "PRD-000-000-001"
+    And request with parameter "PARAM_A" with value "A"
+
+  Scenario: Second
+    Then background ran once with product "PRD-000-000-001"
+"""
+
+
+def test_should_run_the_background_steps_once_per_feature(tmp_path):
+    features = tmp_path / 'features'
+    (features / 'steps').mkdir(parents=True)
+    (features / 'environment.py').write_text(BACKGROUND_ENVIRONMENT)
+    (features / 'steps' / 'steps.py').write_text(BACKGROUND_STEPS)
+    (features / 'background.feature').write_text(BACKGROUND_FEATURE)
+
+    result = subprocess.run(
+        [sys.executable, '-m', 'behave', str(features), '--format', 'plain'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+
+    assert result.returncode == 0, result.stdout
+    assert '2 scenarios passed' in result.stdout
+
+
+def test_should_skip_background_memoization_without_background(behave_context):
+    scenario = Mock(background=None)
+
+    use_connect_request_background(behave_context, scenario)
+
+    assert not hasattr(behave_context, 'background_snapshots')
+
+
+def test_should_fail_background_memoization_on_old_behave(behave_context):
+    background = Mock(filename='background.feature', line=3, steps=[Mock()])
+    scenario = Mock(spec=['background'], background=background)
+
+    with pytest.raises(RuntimeError):
+        use_connect_request_background(behave_context, scenario)
+
+
+def test_should_restore_the_background_snapshot_on_each_scenario(behave_context, mocker):
+    use_connect_request_builder(behave_context)
+
+    step = Mock(step_type='given', text='some text', table=Table(['id', 'value'], rows=[['PARAM_A', 'a|b']]))
+    step.name = 'request with id "PR-000"'
+    background = Mock(filename='background.feature', line=3, steps=[step])
+
+    executed = []
+
+    def _execute_steps(text):
+        executed.append(text)
+        behave_context.builder.with_id('PR-000')
+
+    mocker.patch.object(Context, 'execute_steps', side_effect=_execute_steps)
+
+    for _ in range(2):
+        scenario = Mock(background=background)
+        use_connect_request_background(behave_context, scenario, seed=42)
+
+        assert scenario.use_background is False
+        assert behave_context.builder.with_note('changed').build()['id'] == 'PR-000'
+
+    assert executed == ['Given request with id "PR-000"\n"""\nsome text\n"""\n| id | value |\n| PARAM_A | a\\|b |']
+
+
+def test_should_layer_the_request_builder_mappings(behave_context, tmp_path):
+    path = tmp_path / 'parameters.csv'
+    path.write_text('Email,PARAM_EMAIL\nName,PARAM_NAME\n')
+
+    use_connect_request_builder(behave_context, parameters=[str(path)], values={'Vincent': 'Vincent Vega'})
+
+    assert behave_context.parameter('Email') == 'PARAM_EMAIL'
+    assert behave_context.value('Vincent') == 'Vincent Vega'
+    assert behave_context.shared('Unknown') == 'Unknown'
+
+    layer = use_connect_request_mappings(behave_context, parameters={'Email': 'PARAM_FEATURE_EMAIL'})
+    next(layer)
+
+    assert behave_context.parameter('Email') == 'PARAM_FEATURE_EMAIL'
+    assert behave_context.parameter('Name') == 'PARAM_NAME'
+
+    next(layer, None)
+
+    assert behave_context.parameter('Email') == 'PARAM_EMAIL'
@@ -0,0 +1,63 @@
+import json
+import os
+
+import pytest
+
+from connect.devops_testing.bdd.mappings import FileMapping, LayeredMapping, make_mapping
+
+
+def test_file_mapping_should_load_lazily_and_reload_on_change(tmp_path):
+    path = tmp_path / 'parameters.json'
+    path.write_text(json.dumps({'Email': 'PARAM_EMAIL'}))
+
+    mapping = FileMapping(str(path), check_interval=0)
+
+    assert not mapping.loaded
+    assert mapping.get('Email') == 'PARAM_EMAIL'
+    assert mapping.loaded
+
+    path.write_text(json.dumps({'Email': 'PARAM_EMAIL_ADDRESS'}))
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert mapping.get('Email') == 'PARAM_EMAIL_ADDRESS'
+
+
+@pytest.mark.parametrize('name, content', [
+    ('values.yaml', 'Email: vincent.vega@gmail.com\n'),
+    ('values.csv', '# key,value\nEmail,vincent.vega@gmail.com\n'),
+    ('values.env', '# comment\nexport Email="vincent.vega@gmail.com"\n'),
+    ('.env', 'Email=vincent.vega@gmail.com\n'),
+])
+def test_file_mapping_should_load_supported_formats(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+
+    mapping = FileMapping(str(path))
+
+    assert mapping.get('Email') == 'vincent.vega@gmail.com'
+    assert 'Missing' not in mapping
+
+
+def test_file_mapping_should_reject_unsupported_formats(tmp_path):
+    with pytest.raises(ValueError):
+        FileMapping(str(tmp_path / 'values.xml'))
+
+
+def test_layered_mapping_should_resolve_the_most_specific_layer(tmp_path):
+    path = tmp_path / 'environment.json'
+    path.write_text(json.dumps({'Email': 'environment@example.com'}))
+
+    mapping = make_mapping([{'Email': 'base@example.com', 'Name': 'Vincent'}, str(path)])
+
+    assert mapping.get('Email') == 'environment@example.com'
+    assert mapping.get('Name') == 'Vincent'
+
+    mapping.push({'Name': 'Jules'})
+    assert mapping.get('Name') == 'Jules'
+
+    mapping.pop()
+    assert mapping.get('Name') == 'Vincent'
+    assert mapping.get('Missing', 'default') == 'default'
+    assert make_mapping(mapping) is mapping
+    assert isinstance(make_mapping(None), LayeredMapping)
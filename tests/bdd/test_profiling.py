@@ -0,0 +1,123 @@
+import functools
+import json
+import logging
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from connect.devops_testing import asserts
+from connect.devops_testing.bdd.fixtures import use_connect_request_builder, use_step_profiler
+from connect.devops_testing.bdd.profiling import StepProfiler
+from connect.devops_testing.bdd.steps import asset_request, request_status_is, with_status
+
+
+def _make_step(name: str, line: int) -> Mock:
+    step = Mock(step_type='given', filename='features/purchase.feature', line=line)
+    step.name = name
+    step.status.name = 'passed'
+    return step
+
+
+def _make_scenario(name: str, line: int) -> Mock:
+    scenario = Mock(filename='features/purchase.feature', line=line)
+    scenario.name = name
+    return scenario
+
+
+def test_step_profiler_should_split_the_step_time_by_category(behave_context):
+    use_connect_request_builder(behave_context)
+    behave_context.connect = Mock()
+    behave_context.connect.provision_request.side_effect = lambda **kwargs: time.sleep(0.02) or {}
+    behave_context.scenario = _make_scenario('Purchase', 3)
+
+    profiler = StepProfiler()
+    profiler.install(behave_context)
+    try:
+        step = _make_step('asset request', 4)
+        profiler.before_step(behave_context, step)
+        asset_request(behave_context)
+        with_status(behave_context, 'approved')
+        profiler.after_step(behave_context, step)
+
+        step = _make_step('request is processed', 5)
+        profiler.before_step(behave_context, step)
+        behave_context.connect.provision_request(request={})
+        profiler.after_step(behave_context, step)
+
+        step = _make_step('request status is "approved"', 6)
+        profiler.before_step(behave_context, step)
+        behave_context.request = behave_context.builder.build()
+        request_status_is(behave_context, 'approved')
+        profiler.after_step(behave_context, step)
+
+        profiler.after_scenario(behave_context, behave_context.scenario)
+    finally:
+        profiler.uninstall()
+
+    records = profiler.records
+
+    assert records[0]['builder'] > 0
+    assert records[1]['dispatcher'] >= 0.02
+    assert records[2]['asserts'] > 0
+    assert all(record['status'] == 'passed' for record in records)
+
+    report = profiler.report(limit=1)
+
+    assert report['steps'][0]['step'] == 'Given request is processed'
+    assert report['scenarios'][0]['location'] == 'features/purchase.feature:3'
+    assert 'Given request is processed' in profiler.format_text()
+    assert not isinstance(asserts.request_status, functools.partial)
+
+
+def test_step_profiler_should_profile_the_selected_steps(behave_context, tmp_path):
+    use_connect_request_builder(behave_context)
+    behave_context.scenario = _make_scenario('Purchase', 3)
+
+    layer = use_step_profiler(behave_context, output=str(tmp_path), profile_steps=['^Given asset'], memory=True)
+    profiler = next(layer)
+
+    for line, name in ((4, 'asset request'), (5, 'request with status "approved"')):
+        step = _make_step(name, line)
+        profiler.before_step(behave_context, step)
+        asset_request(behave_context)
+        profiler.after_step(behave_context, step)
+    profiler.after_scenario(behave_context, behave_context.scenario)
+
+    next(layer, None)
+
+    assert (tmp_path / 'features_purchase.feature_4.prof').exists()
+    assert (tmp_path / 'features_purchase.feature_4.memory.txt').exists()
+    assert not (tmp_path / 'features_purchase.feature_5.prof').exists()
+    assert 'memory' in profiler.records[0]
+
+    report = json.loads((tmp_path / 'step-timing.json').read_text())
+
+    assert len(report['steps']) == 2
+    assert (tmp_path / 'step-timing.txt').exists()
+
+
+def test_step_profiler_should_restore_the_asserts_when_the_layer_fails(behave_context):
+    use_connect_request_builder(behave_context)
+
+    layer = use_step_profiler(behave_context)
+    next(layer)
+
+    assert isinstance(asserts.request_status, functools.partial)
+
+    with pytest.raises(AssertionError):
+        layer.throw(AssertionError('failed scenario'))
+
+    assert not isinstance(asserts.request_status, functools.partial)
+
+
+def test_step_profiler_should_log_the_report(behave_context, caplog):
+    use_connect_request_builder(behave_context)
+
+    layer = use_step_profiler(behave_context)
+    next(layer)
+
+    with caplog.at_level(logging.INFO, logger='connect.devops_testing.bdd.fixtures'):
+        next(layer, None)
+
+    assert 'Slowest 0 steps:' in caplog.text
@@ -0,0 +1,72 @@
+import json
+
+from connect.devops_testing.bdd import runner
+
+STEPS = '''
+from behave import step
+
+
+@step('it works')
+def it_works(context):
+    pass
+
+
+@step('it fails')
+def it_fails(context):
+    assert False
+'''
+
+
+def _make_features(tmp_path, scenarios):
+    features = tmp_path / 'features'
+    (features / 'steps').mkdir(parents=True)
+    (features / 'steps' / 'steps.py').write_text(STEPS)
+    for index, steps in enumerate(scenarios):
+        body = ''.join(f'\n  Scenario: S{n}\n    Given {step}\n' for n, step in enumerate(steps))
+        (features / f'f{index}.feature').write_text(f'Feature: F{index}\n{body}')
+    return features
+
+
+def test_runner_should_shard_units_across_workers():
+    assert runner.shard(['a', 'b', 'c'], 2) == [['a', 'c'], ['b']]
+    assert runner.shard(['a'], 4) == [['a']]
+    assert runner.shard([], 4) == []
+
+
+def test_runner_should_discover_features_and_scenarios(tmp_path):
+    features = _make_features(tmp_path, [['it works', 'it works']])
+
+    discovered = runner.discover_features([str(features)])
+
+    assert discovered == [str(features / 'f0.feature')]
+    assert runner.discover_scenarios(discovered[0]) == [f'{discovered[0]}:3', f'{discovered[0]}:6']
+
+
+def test_runner_should_run_scenarios_in_parallel_and_merge_reports(tmp_path):
+    features = _make_features(tmp_path, [['it works', 'it works'], ['it works']])
+    output = tmp_path / 'report.json'
+    junit = tmp_path / 'junit'
+
+    exit_code = runner.main([
+        str(features), '--workers', '2', '--shard-by', 'scenario',
+        '--json-output', str(output), '--junit-directory', str(junit),
+    ])
+
+    report = json.loads(output.read_text())
+
+    assert exit_code == 0
+    assert [[scenario['status'] for scenario in feature['elements']] for feature in report] == [
+        ['passed', 'passed'],
+        ['passed'],
+    ]
+    assert 'tests="2" errors="0" failures="0" skipped="0"' in (junit / 'TESTS-f0.xml').read_text()
+
+
+def test_runner_should_fail_if_some_worker_fails(tmp_path):
+    features = _make_features(tmp_path, [['it works'], ['it fails']])
+
+    assert runner.main([str(features), '--workers', '2', '--', '--no-capture']) != 0
+
+
+def test_runner_should_fail_without_features(tmp_path):
+    assert runner.main([str(tmp_path)]) == 1
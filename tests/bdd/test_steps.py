@@ -1,6 +1,14 @@
+import threading
+from concurrent.futures import Future
+from unittest.mock import Mock
+
 import pytest
 
-from connect.devops_testing.bdd.fixtures import use_connect_request_builder, use_connect_request_dispatcher
+from connect.devops_testing.bdd.fixtures import (
+    use_connect_request_builder,
+    use_connect_request_dispatcher,
+    use_connect_request_store,
+)
 from connect.devops_testing.bdd.steps import (
     tier_config_request, asset_request, with_tier_config_account, with_id, with_product_id,
     with_marketplace_id, with_reseller_level, with_parameter_with_value,
@@ -18,7 +26,10 @@ from connect.devops_testing.bdd.steps import (
     with_asset_tier_from_country,
     with_asset_external_id, with_asset_external_uid, with_tier_config_id, with_asset_id, with_type,
     request_is_being_scheduled, request_is_being_revoked,
+    request_is_submitted, subscription_request_is_submitted, tier_configuration_request_is_submitted,
+    with_parameters,
 )
+from connect.devops_testing.bdd.store import RequestStore
 
 PARAM_ID_A = 'PARAM_ID_A'
 PARAM_ID_A_VALUE = 'Some value A'
@@ -347,3 +358,119 @@ def test_step_should_successfully_process_the_request(sync_client_factory, respo
         assert behave_context.request['type'] == 'purchase'
         assert behave_context.request['status'] == 'approved'
 
+
+def test_step_should_defer_the_processed_request_until_assertion(sync_client_factory, response_factory, behave_context):
+    submit_steps = [
+        request_is_submitted,
+        subscription_request_is_submitted,
+        tier_configuration_request_is_submitted,
+    ]
+
+    use_connect_request_store(behave_context)
+    behave_context.request.update({'id': 'PR-000-000-000-000'})
+
+    for submit_step in submit_steps:
+        use_connect_request_builder(context=behave_context)
+
+        asset_request(behave_context)
+        with_status(behave_context, 'pending')
+
+        mocked_client = sync_client_factory([
+            response_factory(value={'id': 'PR-000-000-000-000', 'type': 'purchase', 'status': 'pending'}),
+            response_factory(value={'id': 'PR-000-000-000-000', 'type': 'purchase', 'status': 'approved'}),
+        ])
+
+        use_connect_request_dispatcher(context=behave_context, client=mocked_client)
+
+        submit_step(behave_context)
+
+        assert isinstance(behave_context.request, Future)
+
+        request_status_is(behave_context, 'approved')
+
+        assert behave_context.request['id'] == 'PR-000-000-000-000'
+        assert behave_context.request['type'] == 'purchase'
+        assert isinstance(behave_context.request, RequestStore)
+        assert isinstance(behave_context.request, RequestStore)
+
+        behave_context.connect.close()
+
+
+def test_step_should_await_the_pending_submission_at_scenario_end(behave_context):
+    use_connect_request_builder(context=behave_context)
+    asset_request(behave_context)
+
+    use_connect_request_store(behave_context)
+    store = behave_context.request
+    submitted = Future()
+    behave_context.connect = Mock()
+    behave_context.connect.submit_request.return_value = submitted
+
+    request_is_submitted(behave_context)
+    threading.Timer(0.05, submitted.set_result, args=({'id': 'PR-000', 'status': 'approved'},)).start()
+
+    behave_context._do_cleanups()
+
+    assert behave_context.request.done()
+    assert isinstance(store, RequestStore)
+    assert store['id'] == 'PR-000'
+    assert store['status'] == 'approved'
+
+
+def test_step_should_raise_the_deferred_processing_error_on_assertion(behave_context):
+    use_connect_request_builder(context=behave_context)
+    asset_request(behave_context)
+
+    use_connect_request_store(behave_context)
+    behave_context.connect = Mock()
+    failed = Future()
+    failed.set_exception(RuntimeError('processing failed'))
+    behave_context.connect.submit_request.return_value = failed
+
+    request_is_submitted(behave_context)
+
+    with pytest.raises(RuntimeError):
+        request_status_is(behave_context, 'approved')
+
+
+def test_step_should_set_asset_parameters_from_table(behave_context):
+    use_connect_request_builder(context=behave_context)
+
+    asset_request(behave_context)
+    with_parameter_with_value(behave_context, PARAM_ID_A, 'Old value')
+
+    behave_context.table = [
+        {'id': PARAM_ID_A, 'value': PARAM_ID_A_VALUE, 'value_error': PARAM_ID_A_VALUE_ERROR, 'type': '', 'checked': ''},
+        {'id': PARAM_ID_CHECK, 'value': PARAM_ID_CHECK_VALUE, 'value_error': '', 'type': '', 'checked': 'true'},
+        {'id': 'PARAM_ID_JSON', 'value': '{"name": "Vincent"}', 'value_error': '', 'type': 'object', 'checked': ''},
+        {'id': PARAM_ID_NO_VALUE, 'value': '', 'value_error': '', 'type': '', 'checked': ''},
+    ]
+    with_parameters(behave_context)
+
+    params = {param['id']: param for param in behave_context.builder.build()['asset']['params']}
+
+    assert params[PARAM_ID_A]['value'] == PARAM_ID_A_VALUE
+    assert params[PARAM_ID_A]['value_error'] == PARAM_ID_A_VALUE_ERROR
+    assert params[PARAM_ID_CHECK]['type'] == 'checkbox'
+    assert params[PARAM_ID_CHECK]['structured_value'] == {'a': True, 'b': True, 'c': True}
+    assert params['PARAM_ID_JSON']['structured_value'] == {'name': 'Vincent'}
+    assert params[PARAM_ID_NO_VALUE]['type'] == 'text'
+
+
+def test_step_should_set_tier_configuration_parameters_from_table(behave_context):
+    use_connect_request_builder(context=behave_context)
+
+    tier_config_request(behave_context)
+    behave_context.table = [
+        {'id': PARAM_ID_A, 'value': PARAM_ID_A_VALUE},
+        {'id': PARAM_ID_CHECK, 'value': PARAM_ID_CHECK_VALUE_NOT, 'checked': 'false'},
+    ]
+    with_parameters(behave_context)
+
+    request = behave_context.builder.build()
+    configuration = {param['id']: param for param in request['configuration']['params']}
+    params = {param['id']: param for param in request['params']}
+
+    assert configuration[PARAM_ID_A]['value'] == PARAM_ID_A_VALUE
+    assert params[PARAM_ID_A]['value'] == PARAM_ID_A_VALUE
+    assert params[PARAM_ID_CHECK]['structured_value'] == {'a': False}
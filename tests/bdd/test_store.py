@@ -0,0 +1,133 @@
+import pickle
+from copy import deepcopy
+from unittest.mock import Mock
+
+from connect.devops_testing.bdd.fixtures import use_connect_request_dispatcher, use_connect_request_store
+from connect.devops_testing.bdd.store import RequestStore
+
+
+def _request(request_id: str, size: int = 10) -> dict:
+    return {'id': request_id, 'status': 'approved', 'note': 'x' * size}
+
+
+def test_request_store_should_evict_the_least_recently_updated_requests():
+    store = RequestStore(max_entries=2)
+
+    for request_id in ('PR-001', 'PR-002', 'PR-003'):
+        store.update(_request(request_id))
+
+    assert store['id'] == 'PR-003'
+    assert store.ids() == ['PR-001', 'PR-002', 'PR-003']
+    assert store.recall('PR-001') is None
+    assert store.recall('PR-002')['id'] == 'PR-002'
+
+
+def test_request_store_should_cap_the_size_in_bytes():
+    store = RequestStore(max_entries=None, max_bytes=250)
+
+    for request_id in ('PR-001', 'PR-002', 'PR-003'):
+        store.update(_request(request_id, size=100))
+
+    assert store.size <= 250
+    assert store.recall('PR-001') is None
+    assert store.recall('PR-003')['note'] == 'x' * 100
+
+    store.update({'note': ''})
+
+    assert store.recall('PR-003')['note'] == ''
+
+
+def test_request_store_should_keep_only_ids():
+    store = RequestStore(keep_ids_only=True)
+    store.update(_request('PR-001'))
+
+    assert store.ids() == ['PR-001']
+    assert store.recall('PR-001') is None
+    assert store.size == 0
+
+
+def test_request_store_should_spill_evicted_requests_to_disk(tmp_path):
+    store = RequestStore(max_entries=1, spill=str(tmp_path))
+    store.update(_request('PR-001'))
+    store.update(_request('PR-002'))
+
+    assert (tmp_path / 'PR-001.json').exists()
+    assert store.recall('PR-001')['id'] == 'PR-001'
+    assert store.recall('PR-999') is None
+
+
+def test_should_keep_the_request_store_history_on_reset(behave_context):
+    use_connect_request_store(behave_context, max_entries=10)
+    store = behave_context.request
+    store.update(_request('PR-001'))
+
+    use_connect_request_store(behave_context)
+    assert behave_context.request['id'] == 'PR-001'
+
+    use_connect_request_store(behave_context, reset=True)
+
+    assert behave_context.request is store
+    assert behave_context.request == {}
+    assert store.ids() == ['PR-001']
+
+    use_connect_request_store(behave_context, store=RequestStore(), reset=True)
+
+    assert behave_context.request is not store
+
+
+def test_request_store_should_not_record_history_by_default():
+    store = RequestStore()
+    store.update(_request('PR-001'))
+    store['id'] = 'PR-002'
+
+    assert store.ids() == []
+    assert store.recall('PR-001') is None
+    assert store.size == 0
+
+
+def test_request_store_should_record_item_assignments():
+    store = RequestStore(max_entries=10)
+    store['status'] = 'pending'
+    store['id'] = 'PR-001'
+    store['status'] = 'approved'
+
+    assert store.ids() == ['PR-001']
+    assert store.recall('PR-001') == {'id': 'PR-001', 'status': 'approved'}
+
+
+def test_should_install_the_given_store_as_is(behave_context):
+    store = {'id': 'PR-001'}
+
+    use_connect_request_store(behave_context, store=store, reset=True)
+
+    assert behave_context.request is store
+
+
+def test_request_store_should_bound_the_ids_kept_only():
+    store = RequestStore(max_entries=2, keep_ids_only=True)
+
+    for request_id in ('PR-001', 'PR-002', 'PR-003'):
+        store.update(_request(request_id))
+
+    assert store.ids() == ['PR-002', 'PR-003']
+
+
+def test_request_store_of_the_dispatcher_fixture_should_be_copied(behave_context):
+    use_connect_request_dispatcher(behave_context, client=Mock())
+    behave_context.request.update(_request('PR-001'))
+
+    copied = deepcopy(behave_context.request)
+
+    assert isinstance(copied, RequestStore)
+    assert copied == behave_context.request
+
+    use_connect_request_store(behave_context, store=RequestStore(max_entries=10), reset=True)
+    behave_context.request.update(_request('PR-002'))
+
+    copied = deepcopy(behave_context.request)
+    copied['status'] = 'revoked'
+
+    assert copied.ids() == ['PR-002']
+    assert copied.recall('PR-002')['status'] == 'revoked'
+    assert behave_context.request.recall('PR-002')['status'] == 'approved'
+    assert pickle.loads(pickle.dumps(behave_context.request)) == behave_context.request
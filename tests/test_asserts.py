@@ -1,4 +1,9 @@
+from unittest.mock import Mock
+
+import pytest
+
 from connect.devops_testing import asserts
+from connect.devops_testing.models import Request
 
 asset_request = {
     'id': 'PR-0000-0000-0000-000',
@@ -176,3 +181,98 @@ def test_should_assert_tier_configuration_param_value_error_contains():
 
 def test_should_assert_tier_configuration_param_value_error_match():
     asserts.tier_configuration_param_value_error_match(config_request, 'ID', r'^s[\s\w]*r$')
+
+
+def _inquiring(value: str) -> dict:
+    return {
+        'id': 'PR-0000-0000-0000-000',
+        'type': 'purchase',
+        'status': 'inquiring',
+        'asset': {'params': [{'id': 'ID', 'type': 'text', 'value': value}]},
+    }
+
+
+def test_eventually_should_reload_the_request_until_the_assertion_holds():
+    dispatcher = Mock()
+    dispatcher.find_request.side_effect = [_inquiring(''), _inquiring(''), _inquiring('value')]
+
+    request = asserts.eventually(
+        asserts.asset_param_value_equal,
+        {'id': 'PR-0000-0000-0000-000', 'type': 'purchase'},
+        'ID',
+        'value',
+        dispatcher=dispatcher,
+        timeout=5,
+        interval=0,
+    )
+
+    assert request['asset']['params'][0]['value'] == 'value'
+    assert dispatcher.find_request.call_count == 3
+
+
+def test_eventually_should_raise_the_last_assertion_error_on_timeout():
+    dispatcher = Mock()
+    dispatcher.find_request.return_value = _inquiring('')
+
+    with pytest.raises(AssertionError, match="ID parameter value '' is not equal to 'value'"):
+        asserts.eventually(asserts.asset_param_value_equal, {}, 'ID', 'value', dispatcher=dispatcher, timeout=0)
+
+
+def test_eventually_should_stop_waiting_on_final_status():
+    dispatcher = Mock()
+    dispatcher.find_request.return_value = {**_inquiring(''), 'status': 'failed'}
+
+    with pytest.raises(AssertionError):
+        asserts.eventually(asserts.asset_param_value_equal, {}, 'ID', 'value', dispatcher=dispatcher, timeout=60)
+
+    dispatcher.find_request.assert_called_once()
+
+
+def test_compile_pattern_should_cache_a_bounded_amount_of_patterns(mocker):
+    mocker.patch.object(asserts, 'PATTERN_CACHE_SIZE', 2)
+    asserts.clear_patterns()
+
+    first = asserts.compile_pattern(r'^a$')
+
+    assert asserts.compile_pattern(r'^a$') is first
+
+    asserts.compile_pattern(r'^b$')
+    asserts.compile_pattern(r'^c$')
+
+    assert list(asserts._patterns) == [r'^b$', r'^c$']
+    assert asserts.compile_pattern(first) is first
+
+    asserts.clear_patterns()
+
+
+def test_register_patterns_should_keep_patterns_out_of_eviction(mocker):
+    mocker.patch.object(asserts, 'PATTERN_CACHE_SIZE', 1)
+    asserts.clear_patterns()
+    asserts.register_patterns([r'^v\w+$'])
+
+    registered = asserts.compile_pattern(r'^v\w+$')
+    asserts.compile_pattern(r'^b$')
+    asserts.compile_pattern(r'^c$')
+
+    assert asserts.compile_pattern(r'^v\w+$') is registered
+    assert list(asserts._patterns) == [r'^c$']
+    asserts.asset_param_value_match(asset_request, 'ID', r'^v\w+$')
+
+    asserts.clear_patterns()
+
+
+def test_should_assert_request_models():
+    asset_model = Request.from_dict(asset_request)
+    config_model = Request.from_dict(config_request)
+
+    asserts.request_status(asset_model, 'approved')
+    asserts.asset_status(asset_model, 'active')
+    asserts.asset_param_value_equal(asset_model, 'ID_2', '42')
+    asserts.asset_param_value_equal(asset_model, 'ID_3', 'a|c')
+    asserts.asset_param_value_error_match(asset_model, 'ID', '^some')
+    asserts.request_param_value_equal(config_model, 'ID_3', 'b|c')
+    asserts.tier_configuration_status(config_model, 'active')
+    asserts.tier_configuration_param_value_error_equal(config_model, 'ID', 'some error')
+
+    with pytest.raises(AssertionError):
+        asserts.asset_param_value_equal(asset_model, 'MISSING', 'value')
@@ -0,0 +1,70 @@
+import pytest
+
+from connect.devops_testing.batch import RequestBatch
+
+
+def _request(request_id: str, status: str = 'approved', value: str = 'ID:1', value_error: str = '') -> dict:
+    return {
+        'id': request_id,
+        'type': 'purchase',
+        'status': status,
+        'asset': {
+            'status': 'active' if status == 'approved' else 'processing',
+            'params': [
+                {'id': 'subscription_id', 'type': 'text', 'value': value, 'value_error': value_error},
+                {'id': 'features', 'type': 'checkbox', 'structured_value': {'a': True, 'b': False}},
+            ],
+        },
+    }
+
+
+@pytest.fixture
+def batch():
+    return RequestBatch([
+        _request('PR-001'),
+        _request('PR-002'),
+        _request('PR-003', status='failed', value='', value_error='Invalid'),
+        {
+            'id': 'TCR-001',
+            'type': 'setup',
+            'status': 'approved',
+            'configuration': {'status': 'active', 'params': [{'id': 'tier_id', 'value': 'other'}]},
+            'params': [{'id': 'tier_id', 'value': 'T1'}],
+        },
+    ])
+
+
+def test_request_batch_should_flatten_requests_into_columns(batch):
+    assert len(batch) == 4
+    assert batch.column('status') == ['approved', 'approved', 'failed', 'approved']
+    assert batch.column('asset_status') == ['active', 'active', 'processing', 'active']
+    assert batch.values('subscription_id') == ['ID:1', 'ID:1', '', None]
+    assert batch.values('tier_id') == [None, None, None, 'T1']
+    assert batch.values('unknown') == [None] * 4
+    assert batch.param_ids == ['subscription_id', 'features', 'tier_id']
+
+
+def test_request_batch_should_evaluate_predicates_over_the_batch(batch):
+    status = batch.status('approved')
+
+    assert status.rate == 0.75
+    assert status.failing_ids == ['PR-003']
+    status.require(0.75)
+
+    with pytest.raises(AssertionError, match='failing requests: PR-003'):
+        status.require(0.999)
+
+    assert batch.asset_status('active').passed == 3
+    assert batch.param_not_empty('subscription_id').failing_ids == ['PR-003', 'TCR-001']
+    assert batch.param_value('subscription_id', 'match', r'^ID:\d+$').failing_ids == ['PR-003', 'TCR-001']
+    assert batch.param_value('subscription_id', 'in', 'ID').passed == 2
+    assert batch.param_value('features', '==', 'a').passed == 3
+    assert batch.param_value('tier_id', '!=', 'T1').failing_ids == ['TCR-001']
+    assert batch.value_error_rates() == {'subscription_id': 0.25, 'features': 0.0, 'tier_id': 0.0}
+
+
+def test_request_batch_should_pass_on_empty_batch():
+    batch = RequestBatch([])
+
+    batch.status('approved').require()
+    assert batch.value_error_rates() == {}
@@ -0,0 +1,100 @@
+import threading
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+
+from connect.devops_testing.cache import MemoryCache, SQLiteCache
+from connect.devops_testing.request import Dispatcher
+
+TO_CREATE = {'type': 'purchase', 'asset': {'params': [{'id': 'PARAM_A', 'value': 'a'}]}}
+
+
+@pytest.mark.parametrize('cache_factory', [
+    lambda tmp_path: MemoryCache(),
+    lambda tmp_path: SQLiteCache(str(tmp_path / 'cache.db')),
+])
+def test_request_cache_should_store_and_return_requests(tmp_path, cache_factory):
+    cache = cache_factory(tmp_path)
+
+    assert cache.get('key') is None
+    cache.set('key', {'id': 'PR-000'})
+
+    assert cache.get('key') == {'id': 'PR-000'}
+
+
+@pytest.mark.parametrize('cache_factory', [
+    lambda tmp_path: MemoryCache(ttl=10),
+    lambda tmp_path: SQLiteCache(str(tmp_path / 'cache.db'), ttl=10),
+])
+def test_request_cache_should_expire_requests(tmp_path, cache_factory):
+    cache = cache_factory(tmp_path)
+
+    with patch('connect.devops_testing.cache.time.time', return_value=1000):
+        cache.set('key', {'id': 'PR-000'})
+
+    with patch('connect.devops_testing.cache.time.time', return_value=1011):
+        assert cache.get('key') is None
+
+
+def test_sqlite_cache_should_persist_between_instances(tmp_path):
+    SQLiteCache(str(tmp_path / 'cache.db')).set('key', {'id': 'PR-000'})
+
+    cache = SQLiteCache(str(tmp_path / 'cache.db'))
+
+    assert cache.get('key') == {'id': 'PR-000'}
+    cache.close()
+
+
+def test_request_dispatcher_should_reuse_processed_identical_request(sync_client_factory, response_factory):
+    connect_client = sync_client_factory([
+        response_factory(value={'id': 'PR-000', 'type': 'purchase', 'status': 'pending'}),
+        response_factory(value={'id': 'PR-000', 'type': 'purchase', 'status': 'approved'}),
+    ])
+
+    dispatcher = Dispatcher(client=connect_client, cache=MemoryCache())
+
+    first = dispatcher.provision_request(request=dict(TO_CREATE), timeout=0, max_attempt=1)
+    second = dispatcher.provision_request(request=dict(TO_CREATE), timeout=0, max_attempt=1)
+
+    assert first == second
+    assert first is not second
+    assert second['status'] == 'approved'
+
+
+def test_request_dispatcher_should_attach_to_in_flight_identical_request():
+    started, release, attached = threading.Event(), threading.Event(), threading.Semaphore(0)
+    cache = MemoryCache()
+    dispatcher = Dispatcher(client=None, cache=cache)
+    calls = []
+
+    def _provision():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {'id': 'PR-000', 'status': 'approved'}
+
+    def _result(future, timeout=None):
+        attached.release()
+        return original_result(future, timeout)
+
+    results = []
+    original_result = Future.result
+    workers = [
+        threading.Thread(target=lambda: results.append(dispatcher._memoize(TO_CREATE, _provision)))
+        for _ in range(3)
+    ]
+    with patch.object(cache, 'get', wraps=cache.get) as cache_get, patch.object(Future, 'result', _result):
+        workers[0].start()
+        assert started.wait(5)
+        for worker in workers[1:]:
+            worker.start()
+        for _ in workers[1:]:
+            assert attached.acquire(timeout=5)
+        release.set()
+        for worker in workers:
+            worker.join()
+
+    assert len(calls) == 1
+    assert cache_get.call_count == 1
+    assert results == [{'id': 'PR-000', 'status': 'approved'}] * 3
@@ -0,0 +1,38 @@
+import json
+
+from connect.devops_testing import cli
+from connect.devops_testing.request import Builder
+
+
+def test_make_load_request_should_apply_the_variation_rules():
+    rules = {'type': ['purchase', 'change'], 'status': 'pending', 'params': {'EMAIL': 'customer{n}@example.com'}}
+
+    request = cli.make_load_request(Builder({'id': 'PR-001', 'asset': {'params': []}}), rules, 3)
+
+    assert 'id' not in request
+    assert request['type'] == 'change'
+    assert request['status'] == 'pending'
+    assert request['asset']['params'][0]['value'] == 'customer3@example.com'
+
+    request = cli.make_load_request(Builder({'type': 'setup', 'configuration': {}}), {'params': {'TIER': [1]}}, 0)
+
+    assert request['configuration']['params'][0]['value'] == 1
+
+
+def test_cli_load_should_fire_requests_at_the_stand_in_backend(tmp_path, capsys):
+    template = tmp_path / 'request.json'
+    template.write_text(json.dumps({'type': 'purchase', 'asset': {'params': []}}))
+    rules = tmp_path / 'rules.yaml'
+    rules.write_text('params:\n  EMAIL: customer{n}@example.com\n')
+    output = tmp_path / 'stats.json'
+
+    code = cli.load([
+        str(template), '--rules', str(rules), '--count', '20', '--rate', '1000', '--concurrency', '4',
+        '--stand-in', '--stand-in-latency', '0', '--json-output', str(output),
+    ])
+
+    assert code == 0
+    assert '20 requests in' in capsys.readouterr().out
+    assert json.loads(output.read_text())['count'] == 20
+
+    assert cli.load([str(template), '--count', '2', '--stand-in', '--expect-status', 'failed']) == 1
@@ -0,0 +1,100 @@
+import pytest
+
+from connect.devops_testing import asserts
+from connect.devops_testing.clock import VirtualClock
+from connect.devops_testing.request import Dispatcher
+from connect.devops_testing.standin import StandInClient
+
+
+def test_virtual_clock_should_advance_on_sleep():
+    clock = VirtualClock(start=100)
+
+    clock.sleep(10)
+    clock.advance(5)
+
+    assert clock.monotonic() == 115
+    assert clock.sleeps == [10]
+    assert clock.slept == 10
+
+    with pytest.raises(ValueError):
+        clock.advance(-1)
+
+
+def test_dispatcher_should_poll_on_virtual_time():
+    clock = VirtualClock()
+    dispatcher = Dispatcher(client=StandInClient(pending_polls=20), timeout=10, max_attempts=20, clock=clock)
+
+    request = dispatcher.provision_request({'type': 'purchase', 'asset': {}})
+
+    assert request['status'] == 'approved'
+    assert clock.sleeps == [10] * 20
+    assert dispatcher.clock is clock
+
+
+def test_dispatcher_should_reuse_fresh_requests_on_virtual_time():
+    clock = VirtualClock()
+    client = StandInClient(pending_polls=100)
+    dispatcher = Dispatcher(client=client, freshness=5, clock=clock)
+    request = client.requests.create(payload={'type': 'purchase'})
+
+    dispatcher.find_request(request)
+    dispatcher.find_request(request)
+    assert client.backend.calls == 2
+
+    clock.advance(6)
+    dispatcher.find_request(request)
+    assert client.backend.calls == 3
+
+
+def test_dispatcher_should_poll_the_latest_request_within_the_freshness_window():
+    clock = VirtualClock()
+    client = StandInClient(pending_polls=3)
+    dispatcher = Dispatcher(client=client, timeout=0, max_attempts=5, freshness=30, clock=clock)
+
+    request = dispatcher.provision_request({'type': 'purchase', 'asset': {}})
+
+    assert request['status'] == 'approved'
+    assert dispatcher.discard_requests([request]) == {request['id']: 'approved'}
+
+
+def test_request_repository_should_prune_the_expired_requests():
+    clock = VirtualClock()
+    client = StandInClient()
+    dispatcher = Dispatcher(client=client, freshness=5, clock=clock)
+    requests = [client.requests.create(payload={'type': 'purchase'}) for _ in range(3)]
+
+    for request in requests[:2]:
+        dispatcher.find_request(request)
+    clock.advance(6)
+    dispatcher.find_request(requests[2])
+
+    assert list(dispatcher._handlers[0]._fetched) == [requests[2]['id']]
+
+
+def test_eventually_should_wait_on_virtual_time():
+    clock = VirtualClock()
+    client = StandInClient(pending_polls=40)
+    dispatcher = Dispatcher(client=client, clock=clock)
+    request = client.requests.create(payload={'type': 'purchase'})
+
+    with pytest.raises(AssertionError):
+        asserts.eventually(asserts.request_status, request, 'approved', dispatcher=dispatcher, timeout=60, clock=clock)
+
+    assert clock.monotonic() == 60
+    assert asserts.eventually(
+        asserts.request_status, request, 'approved', dispatcher=dispatcher, timeout=60, clock=clock,
+    )['status'] == 'approved'
+
+
+def test_eventually_should_wait_on_the_dispatcher_clock(mocker):
+    sleep = mocker.patch('time.sleep')
+    clock = VirtualClock()
+    client = StandInClient(pending_polls=5)
+    dispatcher = Dispatcher(client=client, clock=clock)
+    request = client.requests.create(payload={'type': 'purchase'})
+
+    processed = asserts.eventually(asserts.request_status, request, 'approved', dispatcher=dispatcher, interval=2)
+
+    assert processed['status'] == 'approved'
+    assert clock.sleeps == [2] * 5
+    sleep.assert_not_called()
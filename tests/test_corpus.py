@@ -0,0 +1,45 @@
+import pytest
+
+from connect.devops_testing import corpus
+from connect.devops_testing.corpus import CorpusWriter, read_corpus, write_corpus
+from connect.devops_testing.request import Builder
+
+
+def _requests():
+    yield {'id': 'PR-001', 'type': 'purchase'}
+    yield Builder({'id': 'PR-002', 'type': 'change'})
+    yield {'id': 'TCR-001', 'type': 'setup'}
+
+
+@pytest.mark.parametrize('name', ['corpus.jsonl', 'corpus.jsonl.gz'])
+def test_corpus_should_be_written_and_streamed_back(tmp_path, name):
+    path = str(tmp_path / name)
+
+    assert write_corpus(path, _requests()) == 3
+
+    with CorpusWriter(path, append=True) as writer:
+        writer.write({'id': 'PR-003', 'type': 'purchase'})
+
+    assert [r['id'] for r in read_corpus(path)] == ['PR-001', 'PR-002', 'TCR-001', 'PR-003']
+    assert [r['id'] for r in read_corpus(path, types=['purchase'])] == ['PR-001', 'PR-003']
+    assert [r['id'] for r in read_corpus(path, models=['tier-config'])] == ['TCR-001']
+
+    builders = list(read_corpus(path, types=['change'], builders=True))
+
+    assert isinstance(builders[0], Builder)
+    assert builders[0].build()['id'] == 'PR-002'
+
+
+def test_corpus_should_report_invalid_lines(tmp_path):
+    path = tmp_path / 'corpus.jsonl'
+    path.write_text('{"id": "PR-001"}\n\n{invalid\n')
+
+    with pytest.raises(ValueError, match='corpus.jsonl:3'):
+        list(read_corpus(str(path)))
+
+
+def test_corpus_should_require_zstandard_for_zst_files(tmp_path, mocker):
+    mocker.patch.object(corpus, 'zstandard', None)
+
+    with pytest.raises(ImportError):
+        corpus.open_corpus(str(tmp_path / 'corpus.jsonl.zst'), 'w')
@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from connect.devops_testing.events import RequestEventListener
+from connect.devops_testing.request import Dispatcher
+
+
+def _post(url, payload):
+    request = Request(url, data=json.dumps(payload).encode(), method='POST')
+    with urlopen(request) as response:
+        return response.status
+
+
+def test_event_listener_should_resolve_waiter_on_notify():
+    listener = RequestEventListener()
+
+    threading.Timer(0.05, listener.notify, args=('PR-000',)).start()
+
+    assert listener.wait('PR-000', timeout=5)
+
+
+def test_event_listener_should_timeout_without_notification():
+    listener = RequestEventListener()
+
+    assert not listener.wait('PR-000', timeout=0.01)
+
+
+def test_event_listener_should_bound_the_pending_notifications():
+    listener = RequestEventListener(max_pending=2)
+
+    for request_id in ('PR-001', 'PR-002', 'PR-003', 'PR-002'):
+        listener.notify(request_id)
+
+    assert not listener.wait('PR-001', timeout=0)
+    assert listener.wait('PR-003', timeout=0)
+    assert listener.wait('PR-002', timeout=0)
+
+
+def test_event_listener_should_wake_up_all_the_waiters_of_a_request():
+    listener = RequestEventListener()
+    results = []
+    waiters = [
+        threading.Thread(target=lambda: results.append(listener.wait('PR-001', timeout=5)))
+        for _ in range(3)
+    ]
+    for waiter in waiters:
+        waiter.start()
+    while len(listener._condition._waiters) < 3:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    listener.notify('PR-001')
+    for waiter in waiters:
+        waiter.join()
+
+    assert results == [True] * 3
+    assert time.monotonic() - started < 1
+    assert not listener.wait('PR-001', timeout=0)
+
+
+def test_event_listener_should_resolve_waiter_on_webhook_notification():
+    with RequestEventListener() as listener:
+        assert _post(listener.url, [{'object_id': 'PR-001'}, {'request': {'id': 'PR-002'}}]) == 204
+
+        assert listener.wait('PR-001', timeout=0)
+        assert listener.wait('PR-002', timeout=0)
+
+    assert listener.url is None
+
+
+def test_request_dispatcher_should_not_sleep_when_notified(sync_client_factory, response_factory):
+    listener = RequestEventListener(fallback_timeout=60)
+    listener.notify('PR-000')
+
+    connect_client = sync_client_factory([
+        response_factory(value={'id': 'PR-000', 'type': 'purchase', 'status': 'pending'}),
+        response_factory(value={'id': 'PR-000', 'type': 'purchase', 'status': 'pending'}),
+        response_factory(value={'id': 'PR-000', 'type': 'purchase', 'status': 'approved'}),
+    ])
+
+    started = time.monotonic()
+    request = (Dispatcher(client=connect_client, listener=listener)
+               .provision_request(request={'id': 'PR-000', 'type': 'purchase'}, timeout=1, max_attempt=1))
+
+    assert request['status'] == 'approved'
+    assert time.monotonic() - started < 30
+
+
+def test_event_listener_should_reject_malformed_notification():
+    with RequestEventListener() as listener:
+        request = Request(listener.url, data=b'{not json', method='POST')
+        with pytest.raises(HTTPError):
+            urlopen(request)
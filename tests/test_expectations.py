@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from connect.devops_testing.expectations import expect, ExpectationSpec
+from connect.devops_testing.models import Request
+
+request = {
+    'id': 'PR-0000-0000-0000-000',
+    'status': 'approved',
+    'asset': {
+        'status': 'active',
+        'params': [
+            {'id': 'ID', 'type': 'text', 'value': 'value', 'value_error': 'some error'},
+            {'id': 'ID_3', 'type': 'checkbox', 'value': '', 'structured_value': {'a': True, 'b': False, 'c': True}},
+        ],
+    },
+}
+
+
+def test_expectation_spec_should_hold_on_matching_request():
+    spec = ExpectationSpec({
+        'status': 'approved',
+        'asset.status': {'==': 'active', '!=': 'suspended'},
+        'asset.params.ID.value': {'match': r'^v\w+$', 'in': 'alu'},
+        'asset.params.ID.value_error': {'in': 'error'},
+        'asset.params.ID_3.value': {'==': 'a|c'},
+    })
+
+    assert len(spec) == 7
+    assert spec.evaluate(request) == []
+    expect(request, spec)
+
+
+def test_expectation_spec_should_hold_on_matching_request_model():
+    spec = ExpectationSpec({
+        'status': 'approved',
+        'asset.params.ID.value': 'value',
+        'asset.params.ID_3.value': {'==': 'a|c'},
+    })
+
+    assert spec.evaluate(Request.from_dict(request)) == []
+    assert spec.evaluate(Request.from_dict({**request, 'status': 'pending'})) == [
+        "status 'pending' is not equal to 'approved'.",
+    ]
+
+
+def test_expectation_spec_should_report_all_failures_together():
+    spec = {
+        'status': 'failed',
+        'asset.params.ID.value': {'==': 'other'},
+        'asset.params.MISSING.value': {'match': 'x'},
+        'asset.tiers.customer.id': {'in': 'TA'},
+    }
+
+    with pytest.raises(AssertionError) as error:
+        expect(request, spec)
+
+    message = str(error.value)
+
+    assert '4 of 4 expectations failed:' in message
+    assert "status 'approved' is not equal to 'failed'." in message
+    assert "asset.params.ID.value 'value' is not equal to 'other'." in message
+    assert "asset.params.MISSING.value '' does not match 'x'." in message
+
+
+def test_expectation_spec_should_reject_unknown_operators():
+    with pytest.raises(ValueError):
+        ExpectationSpec({'status': {'~': 'approved'}})
+
+
+@pytest.mark.parametrize('name, content', [
+    ('spec.json', json.dumps({'status': {'==': 'approved'}})),
+    ('spec.yaml', 'status:\n  "==": approved\n'),
+])
+def test_expectation_spec_should_be_loaded_from_file(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+
+    assert ExpectationSpec.from_file(str(path)).evaluate(request) == []
@@ -0,0 +1,79 @@
+import pytest
+
+from connect.devops_testing import asserts
+from connect.devops_testing.harness import HarnessReport, processor_method, ProcessorHarness
+
+
+class _TaskResponse:
+    def __init__(self, status: str):
+        self.status = status
+
+
+class _Extension:
+    def __init__(self, client=None):
+        self.client = client
+
+    def process_asset_purchase_request(self, request: dict) -> _TaskResponse:
+        param = request['asset']['params'][0]
+        if param['value'] == 'boom':
+            raise RuntimeError('boom')
+        request['status'] = 'approved' if param['value'] != 'reject' else 'failed'
+        return _TaskResponse('success')
+
+    async def process_asset_change_request(self, request: dict) -> _TaskResponse:
+        request['status'] = 'approved'
+        return _TaskResponse('success')
+
+
+def _recipe(builder, number: int):
+    value = {3: 'reject', 5: 'boom'}.get(number, f'value {number}')
+    return builder.with_id(f'PR-{number:04d}').with_asset_param('PARAM_ID', value)
+
+
+def _check(request: dict, result: _TaskResponse):
+    asserts.task_response_status(result, 'success')
+    asserts.request_status(request, 'approved')
+
+
+@pytest.mark.parametrize('mode', ['thread', 'process'])
+def test_processor_harness_should_report_latency_and_failures(mode):
+    harness = ProcessorHarness(
+        extension=_Extension,
+        recipe=_recipe,
+        template={'type': 'purchase', 'asset': {'params': []}},
+        check=_check,
+        mode=mode,
+        max_workers=2,
+    )
+
+    report = harness.run(10)
+
+    assert report.count == 10
+    assert report.failures == {'AssertionError': 1, 'RuntimeError': 1}
+    assert report.throughput > 0
+    assert report.percentile(50) <= report.percentile(99)
+    assert '10 requests in' in report.format_text()
+    assert '  RuntimeError: 1' in report.format_text()
+
+
+def test_processor_harness_should_run_async_processors(tmp_path):
+    template = tmp_path / 'request.json'
+    template.write_text('{"type": "change", "asset": {"params": []}}')
+
+    harness = ProcessorHarness(_Extension, lambda builder, n: builder.build(), template=str(template), check=_check)
+    report = harness.run(3)
+
+    assert report.failed == 0
+
+
+def test_processor_harness_should_validate_the_configuration():
+    with pytest.raises(ValueError):
+        ProcessorHarness(_Extension, _recipe, mode='fiber')
+
+    with pytest.raises(ValueError):
+        processor_method({'type': 'unknown'})
+
+    report = HarnessReport([], {}, 0)
+
+    assert report.summary()['p99'] == 0.0
+    assert report.throughput == 0.0
@@ -0,0 +1,79 @@
+from unittest.mock import Mock
+
+from connect.devops_testing import cli
+from connect.devops_testing.journal import RequestJournal
+from connect.devops_testing.request import Dispatcher
+
+
+def test_request_journal_should_record_and_rewrite_requests(tmp_path):
+    journal = RequestJournal(str(tmp_path / 'journal.jsonl'))
+
+    assert journal.entries() == []
+
+    journal.record({'id': 'PR-001', 'type': 'purchase', 'status': 'pending'})
+    journal.record({'id': 'TCR-001', 'type': 'setup'})
+
+    assert journal.entries() == [{'id': 'PR-001', 'type': 'purchase'}, {'id': 'TCR-001', 'type': 'setup'}]
+
+    journal.rewrite([{'id': 'TCR-001', 'type': 'setup'}])
+    assert journal.entries() == [{'id': 'TCR-001', 'type': 'setup'}]
+
+    journal.rewrite([])
+    assert not (tmp_path / 'journal.jsonl').exists()
+
+
+def test_request_dispatcher_should_cleanup_created_requests(tmp_path, sync_client_factory, response_factory):
+    connect_client = sync_client_factory([
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'pending'}),  # create
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'inquiring'}),  # get
+        response_factory(value={'id': 'TCR-001', 'type': 'setup', 'status': 'pending'}),  # create
+        response_factory(value={'id': 'TCR-001', 'type': 'setup', 'status': 'approved'}),  # get
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'inquiring'}),  # get
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'failed'}),  # fail
+        response_factory(value={'id': 'TCR-001', 'type': 'setup', 'status': 'approved'}),  # get
+    ])
+    journal = RequestJournal(str(tmp_path / 'journal.jsonl'))
+
+    dispatcher = Dispatcher(client=connect_client, journal=journal)
+    dispatcher.provision_request({'type': 'purchase'}, timeout=0, max_attempt=0)
+    dispatcher.provision_request({'type': 'setup'}, timeout=0, max_attempt=0)
+
+    assert [r['id'] for r in dispatcher.created_requests] == ['PR-001', 'TCR-001']
+    assert len(journal.entries()) == 2
+
+    results = dispatcher.cleanup(max_workers=1)
+
+    assert results == {'PR-001': 'failed', 'TCR-001': 'approved'}
+    assert dispatcher.created_requests == []
+    assert journal.entries() == []
+
+
+def test_request_dispatcher_should_keep_requests_that_could_not_be_discarded(sync_client_factory, response_factory):
+    connect_client = sync_client_factory([
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'scheduled'}),  # create
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'scheduled'}),  # get
+        response_factory(status=500),  # get
+    ])
+
+    dispatcher = Dispatcher(client=connect_client)
+    dispatcher.provision_request({'type': 'purchase'}, timeout=0, max_attempt=0)
+
+    results = dispatcher.cleanup(max_workers=1)
+
+    assert isinstance(results['PR-001'], Exception)
+    assert dispatcher.created_requests == [{'id': 'PR-001', 'type': 'purchase'}]
+
+
+def test_cli_cleanup_should_discard_journal_requests(tmp_path, mocker, capsys):
+    journal = RequestJournal(str(tmp_path / 'journal.jsonl'))
+    journal.record({'id': 'PR-001', 'type': 'purchase'})
+    journal.record({'id': 'PR-002', 'type': 'purchase'})
+
+    dispatcher = Mock()
+    dispatcher.discard_requests.return_value = {'PR-001': 'revoking', 'PR-002': ValueError('boom')}
+    mocker.patch('connect.devops_testing.cli.make_request_dispatcher', return_value=dispatcher)
+
+    assert cli.cleanup([journal.path, '--max-workers', '2']) == 1
+
+    assert journal.entries() == [{'id': 'PR-002', 'type': 'purchase'}]
+    assert 'PR-001: revoking' in capsys.readouterr().out
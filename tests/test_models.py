@@ -0,0 +1,81 @@
+import gc
+import json
+import os
+import tracemalloc
+
+from connect.devops_testing.models import Asset, Param, Params, Request, Tier
+from connect.devops_testing.utils import find_by_id
+
+
+def _load(name: str) -> dict:
+    with open(os.path.dirname(__file__) + name) as file:
+        return json.load(file)
+
+
+def test_request_model_should_convert_from_and_to_dict_losslessly():
+    for name in ('/request_asset.json', '/request_tier_config.json'):
+        request = _load(name)
+
+        assert Request.from_dict(request).to_dict() == request
+
+
+def test_request_model_should_provide_typed_fields_and_dict_access():
+    request = Request.from_dict(_load('/request_asset.json'))
+
+    assert isinstance(request.asset, Asset)
+    assert isinstance(request.asset.params, Params)
+    assert isinstance(request.asset.tiers['customer'], Tier)
+    assert request.asset.status == 'processing'
+    assert request.get('asset').get('status') == 'processing'
+    assert request['asset']['id'] == request.asset.id
+    assert request.get('unknown', 'default') == 'default'
+    assert 'created' in request
+    assert request['created'] == '2020-05-21T08:19:37+00:00'
+    assert 'configuration' not in request
+
+
+def test_params_should_find_the_first_param_by_id():
+    params = Params.from_list([
+        {'id': 'A', 'value': '1'},
+        {'id': 'B', 'value': '2'},
+        {'id': 'A', 'value': '3'},
+    ])
+
+    assert len(params) == 3
+    assert params.find('A').value == '1'
+    assert params.find('C') is None
+    assert find_by_id(params, 'B').value == '2'
+    assert find_by_id(params, 'C', {}) == {}
+    assert [param.id for param in params] == ['A', 'B', 'A']
+
+
+def test_model_should_be_created_from_keyword_arguments():
+    param = Param(id='A', value='1', name='Some param')
+
+    assert param.type is None
+    assert param.to_dict() == {'id': 'A', 'value': '1', 'name': 'Some param'}
+    assert param == Param.from_dict({'id': 'A', 'name': 'Some param', 'value': '1'})
+    assert repr(param) == "Param(id='A')"
+
+
+def _allocated(factory) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = [factory() for _ in range(500)]
+        gc.collect()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def test_request_models_should_use_less_memory_than_dicts():
+    with open(os.path.dirname(__file__) + '/request_asset.json') as file:
+        document = file.read()
+
+    dicts = _allocated(lambda: json.loads(document))
+    models = _allocated(lambda: Request.from_dict(json.loads(document)))
+
+    assert models < dicts * 0.6
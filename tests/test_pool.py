@@ -0,0 +1,80 @@
+from unittest.mock import Mock
+
+import pytest
+
+from connect.devops_testing.pool import RequestPool
+from connect.devops_testing.request import Dispatcher
+
+TEMPLATE = {'type': 'purchase', 'status': 'pending'}
+
+
+def test_request_pool_should_fail_on_invalid_size():
+    with pytest.raises(ValueError):
+        RequestPool(dispatcher=Mock(), template=TEMPLATE, size=0)
+
+
+def test_request_pool_should_checkout_provisioned_request_and_refill():
+    dispatcher = Mock()
+    dispatcher.provision_request.side_effect = [
+        {'id': 'PR-001', 'status': 'inquiring'},
+        {'id': 'PR-002', 'status': 'inquiring'},
+    ]
+
+    pool = RequestPool(dispatcher=dispatcher, template=TEMPLATE, size=1)
+
+    assert pool.checkout(timeout=5)['id'] == 'PR-001'
+    assert pool.checkout(timeout=5)['id'] == 'PR-002'
+    pool.close()
+
+    assert pool.size == 1
+    assert dispatcher.provision_request.call_count == 3
+
+
+def test_request_pool_should_raise_on_request_in_unexpected_status():
+    dispatcher = Mock()
+    dispatcher.provision_request.return_value = {'id': 'PR-001', 'status': 'failed'}
+
+    pool = RequestPool(dispatcher=dispatcher, template=TEMPLATE, size=1)
+
+    with pytest.raises(RuntimeError):
+        pool.checkout(timeout=5)
+    pool.close()
+
+
+def test_request_pool_should_raise_timeout_when_no_request_is_ready():
+    pool = RequestPool(dispatcher=Mock(), template=TEMPLATE, size=1)
+    pool._executor = Mock()
+
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.01)
+
+
+def test_request_dispatcher_should_share_warm_pool_by_template(sync_client_factory, response_factory):
+    connect_client = sync_client_factory([
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'pending'}),
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'inquiring'}),
+    ])
+
+    dispatcher = Dispatcher(client=connect_client, timeout=0, max_attempts=1)
+    pool = dispatcher.warm_pool(TEMPLATE, size=1)
+
+    assert dispatcher.warm_pool(dict(TEMPLATE), size=1) is pool
+    assert pool.checkout(timeout=5)['status'] == 'inquiring'
+
+    dispatcher.close()
+
+
+def test_request_dispatcher_should_grow_the_shared_warm_pool(mocker):
+    provision = mocker.patch.object(Dispatcher, 'provision_request')
+    provision.return_value = {'id': 'PR-001', 'status': 'inquiring'}
+
+    dispatcher = Dispatcher(client=Mock())
+    pool = dispatcher.warm_pool(TEMPLATE, size=1)
+
+    assert dispatcher.warm_pool(TEMPLATE, size=3) is pool
+    assert dispatcher.warm_pool(TEMPLATE, size=2).size == 3
+
+    dispatcher.close()
+
+    assert pool.available == 3
+    assert provision.call_count == 3
@@ -1,8 +1,13 @@
-from connect.devops_testing.request import Builder, Dispatcher
+from connect.devops_testing.models import Request
+from connect.devops_testing.request import Builder, Dispatcher, _AssetRequestRepository
 
 import pytest
 
+import json
 import os
+import threading
+import time
+from unittest.mock import Mock
 
 TPL_REQUEST_ASSET = '/request_asset.json'
 TPL_REQUEST_TIER_CONFIG = '/request_tier_config.json'
@@ -270,6 +275,47 @@ def test_request_builder_should_build_successfully_a_valid_request_from_file_tem
     assert request['asset']['status'] == 'processing'
 
 
+def test_request_builder_should_build_from_lazy_file_template_without_changing_it():
+    template = os.path.dirname(__file__) + TPL_REQUEST_ASSET
+    with open(template) as file:
+        expected = json.load(file)
+
+    builder = Builder.from_file(template, lazy=True)
+    copied = builder.copy().with_status('approved')
+
+    request = builder.with_asset_status('active').build()
+
+    assert request['asset']['status'] == 'active'
+    assert request['asset']['id'] == 'AS-7658-9572-0778'
+    assert builder.build() == expected
+    assert copied.build()['status'] == 'approved'
+    assert builder.build() == expected
+
+
+def test_request_builder_should_release_the_lazy_file_template_on_close():
+    template = os.path.dirname(__file__) + TPL_REQUEST_ASSET
+
+    with Builder.from_file(template, lazy=True) as builder:
+        assert builder.build()['id'] == 'PR-7658-9572-0778-001'
+
+    assert builder._original.closed
+
+    with pytest.raises(ValueError):
+        builder.build()
+
+
+def test_request_builder_should_build_from_and_to_request_models():
+    template = os.path.dirname(__file__) + TPL_REQUEST_ASSET
+    model = Builder.from_file(template).build_model()
+
+    assert isinstance(model, Request)
+
+    request = Builder(model).with_asset_param('UNIQUE_PURCHASE_ORDER_IDENTIFIER', 'PO-001').build_model()
+
+    assert request.asset.params.find('UNIQUE_PURCHASE_ORDER_IDENTIFIER').value == 'PO-001'
+    assert request.id == model.id
+
+
 def test_request_dispatcher_should_create_successfully_a_asset_request(sync_client_factory, response_factory):
     template = os.path.dirname(__file__) + TPL_REQUEST_ASSET
 
@@ -445,3 +491,95 @@ def test_request_dispatcher_should_avoid_update_a_unchanged_tier_config_request(
                .provision_request(request=to_update, timeout=0, max_attempt=1))
 
     assert request['configuration']['params'][0]['value'] == '000000'
+
+
+def test_request_repository_should_share_concurrent_finds_of_the_same_request():
+    release = threading.Event()
+    repository = _AssetRequestRepository(client=None, model='asset')
+    calls = []
+
+    def _get(request_id):
+        calls.append(request_id)
+        release.wait(5)
+        return {'id': request_id, 'status': 'pending'}
+
+    repository._get = _get
+
+    results = []
+    workers = [
+        threading.Thread(target=lambda: results.append(repository.find('PR-000')))
+        for _ in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.05)
+    release.set()
+    for worker in workers:
+        worker.join()
+
+    assert calls == ['PR-000']
+    assert results == [{'id': 'PR-000', 'status': 'pending'}] * 3
+
+
+def test_request_repository_should_reuse_found_request_within_freshness_window():
+    repository = _AssetRequestRepository(client=None, model='asset', freshness=60)
+    repository._get = Mock(return_value={'id': 'PR-000', 'status': 'pending'})
+
+    assert repository.find('PR-000') == repository.find('PR-000')
+    assert repository._get.call_count == 1
+
+    repository._forget('PR-000')
+    repository.find('PR-000')
+
+    assert repository._get.call_count == 2
+
+
+def test_request_repository_should_propagate_find_errors():
+    repository = _AssetRequestRepository(client=None, model='asset', freshness=60)
+    repository._get = Mock(side_effect=[ValueError('boom'), {'id': 'PR-000'}])
+
+    with pytest.raises(ValueError):
+        repository.find('PR-000')
+
+    assert repository.find('PR-000') == {'id': 'PR-000'}
+
+
+def test_request_builder_should_upsert_params_in_batch():
+    request = (Builder()
+               .with_asset_param('PARAM_ID_001', 'old value')
+               .with_asset_params([
+                   {'param_id': 'PARAM_ID_001', 'value': 'new value'},
+                   {'param_id': 'PARAM_ID_002', 'value': {'a': True}, 'value_type': 'checkbox'},
+                   {'param_id': 'PARAM_ID_003', 'value_error': 'Some error'},
+               ])
+               .build())
+
+    params = request['asset']['params']
+
+    assert [param['id'] for param in params] == ['PARAM_ID_001', 'PARAM_ID_002', 'PARAM_ID_003']
+    assert params[0]['value'] == 'new value'
+    assert params[1]['structured_value'] == {'a': True}
+    assert params[1]['type'] == 'checkbox'
+    assert params[2]['value_error'] == 'Some error'
+
+
+def test_request_builder_should_upsert_params_into_null_containers():
+    request = (Builder({'type': 'setup', 'configuration': None})
+               .with_tier_configuration_configuration_param('PARAM_ID_001', 'value')
+               .build())
+
+    assert request['configuration']['configuration']['params'][0]['id'] == 'PARAM_ID_001'
+
+    request = Builder({'type': 'purchase', 'asset': {'params': None}}).with_asset_param('PARAM_ID_001', 'value').build()
+
+    assert request['asset']['params'][0]['value'] == 'value'
+
+
+def test_request_dispatcher_should_find_request(sync_client_factory, response_factory):
+    connect_client = sync_client_factory([
+        response_factory(value={'id': 'PR-001', 'type': 'purchase', 'status': 'inquiring'}),
+    ])
+
+    request = Dispatcher(client=connect_client).find_request({'id': 'PR-001', 'type': 'purchase'})
+
+    assert request['status'] == 'inquiring'
@@ -0,0 +1,48 @@
+import io
+
+import pytest
+
+from connect.devops_testing import serialization
+from connect.devops_testing.serialization import select_backend
+
+DOCUMENT = {'id': 'PR-001', 'note': 'café / ñ', 'params': [{'id': 'A', 'value': 1.5}], 'empty': None}
+
+
+def _backends():
+    backends = []
+    for name in serialization.BACKENDS:
+        try:
+            backends.append(select_backend(name))
+        except ImportError:
+            continue
+    return backends
+
+
+@pytest.mark.parametrize('backend', _backends(), ids=lambda backend: backend[0])
+def test_backend_should_serialize_the_same_documents(backend):
+    _, loads, dumps = backend
+
+    assert loads(dumps(DOCUMENT, False, False, None)) == DOCUMENT
+    assert loads(dumps(DOCUMENT, False, False, None).encode('utf-8')) == DOCUMENT
+    assert dumps({'b': 1, 'a': [1]}, False, True, None) == '{"a":[1],"b":1}'
+    assert dumps({'b': 1, 'a': [1]}, True, True, None) == '{\n  "a": [\n    1\n  ],\n  "b": 1\n}'
+    assert dumps({'note': 'café'}, False, False, None) == '{"note":"café"}'
+    assert dumps({'value': object}, False, False, str) == '{"value":"<class \'object\'>"}'
+
+    with pytest.raises(ValueError):
+        loads('{"id": ')
+
+
+def test_serialization_should_use_the_selected_backend():
+    file = io.StringIO()
+    serialization.dump(DOCUMENT, file, indent=True)
+    file.seek(0)
+
+    assert serialization.BACKEND in serialization.BACKENDS
+    assert serialization.load(file) == DOCUMENT
+    assert serialization.loads(serialization.dumps(DOCUMENT, sort_keys=True)) == DOCUMENT
+
+
+def test_select_backend_should_fail_on_unknown_backend():
+    with pytest.raises(ValueError):
+        select_backend('unknown')
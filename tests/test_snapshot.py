@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from connect.devops_testing import asserts
+from connect.devops_testing.snapshot import compile_rules, diff, normalize, UPDATE_SNAPSHOTS_ENV
+
+
+def _request(**changes) -> dict:
+    request = {
+        'id': 'PR-001',
+        'status': 'approved',
+        'created': '2022-01-01T00:00:00',
+        'asset': {
+            'id': 'AS-001',
+            'params': [{'id': f'PARAM_{n}', 'value': str(n), 'value_error': ''} for n in range(2000)],
+            'tiers': {'customer': {'id': 'TA-001', 'name': 'Vincent'}},
+        },
+    }
+    request.update(changes)
+    return request
+
+
+def test_normalize_should_remove_the_ignored_paths():
+    rules = compile_rules(['id', '**.created', 'asset.tiers.*.id', 'asset.params.*.value_error'])
+
+    request = normalize(_request(), rules)
+
+    assert 'id' not in request
+    assert 'created' not in request
+    assert request['asset']['id'] == 'AS-001'
+    assert request['asset']['tiers']['customer'] == {'name': 'Vincent'}
+    assert request['asset']['params'][0] == {'id': 'PARAM_0', 'value': '0'}
+
+
+def test_diff_should_report_only_the_different_paths():
+    expected = _request()
+    actual = _request(status='failed', note='new')
+    actual['asset']['params'][1500]['value'] = 'changed'
+    del actual['asset']['params'][10]
+    actual['asset']['params'].reverse()
+
+    assert diff(expected, expected) == []
+    assert sorted(diff(expected, actual)) == [
+        '+ note: "new"',
+        '- asset.params.PARAM_10: {"id": "PARAM_10", "value": "10", "value_error": ""}',
+        '~ asset.params.PARAM_1500.value: "1500" -> "changed"',
+        '~ status: "approved" -> "failed"',
+    ]
+    assert diff([1], {'a': 1}) == ['~ .: [1] -> {"a": 1}']
+
+
+def test_request_snapshot_should_compare_and_update_golden_files(tmp_path, monkeypatch):
+    golden = str(tmp_path / 'goldens' / 'purchase.json')
+    ignore = ['id', 'created']
+
+    with pytest.raises(AssertionError, match='not found'):
+        asserts.request_snapshot(_request(), golden, ignore)
+
+    monkeypatch.setenv(UPDATE_SNAPSHOTS_ENV, '1')
+    asserts.request_snapshot(_request(), golden, ignore)
+    monkeypatch.delenv(UPDATE_SNAPSHOTS_ENV)
+
+    with open(golden) as file:
+        assert 'id' not in json.load(file)
+
+    asserts.request_snapshot(_request(id='PR-002', created='2023-01-01T00:00:00'), golden, ignore)
+
+    with pytest.raises(AssertionError, match='1 differences:\n~ status: "approved" -> "failed"'):
+        asserts.request_snapshot(_request(status='failed'), golden, ignore)
@@ -0,0 +1,53 @@
+import pytest
+
+from connect.devops_testing.request import Dispatcher
+from connect.devops_testing.standin import jitter, StandInBackend, StandInClient
+
+
+def _asset_request() -> dict:
+    return {
+        'type': 'purchase',
+        'asset': {'params': [{'id': 'PARAM_ID', 'type': 'text', 'value': ''}]},
+    }
+
+
+def test_stand_in_client_should_process_requests_through_the_dispatcher():
+    client = StandInClient(pending_polls=2)
+    dispatcher = Dispatcher(client=client, timeout=0, max_attempts=5)
+
+    request = dispatcher.provision_request(_asset_request())
+
+    assert request['id'].startswith('PR-')
+    assert request['status'] == 'approved'
+    assert request['asset']['status'] == 'active'
+    assert client.backend.calls == 4
+
+    tier_config = dispatcher.provision_request({'type': 'setup', 'configuration': {}})
+
+    assert tier_config['id'].startswith('TCR-')
+    assert tier_config['configuration']['status'] == 'active'
+
+
+def test_stand_in_client_should_update_and_act_on_requests():
+    backend = StandInBackend(latency=jitter(0, 0), processor=lambda request: {**request, 'status': 'inquiring'})
+    client = StandInClient(backend=backend)
+
+    created = client.requests.create(payload=_asset_request())
+    client.requests[created['id']].get()
+    client.requests[created['id']].get()
+
+    updated = client.requests[created['id']].update(
+        payload={'asset': {'params': [{'id': 'PARAM_ID', 'value': 'new'}]}},
+    )
+    assert updated['asset']['params'][0]['value'] == 'new'
+
+    assert client.requests[created['id']].action('pend').post()['status'] == 'pending'
+    failed = client.requests[created['id']].action('fail').post(payload={'reason': 'Discarded'})
+
+    assert failed['status'] == 'failed'
+    assert failed['reason'] == 'Discarded'
+
+
+def test_stand_in_client_should_reject_unknown_namespaces():
+    with pytest.raises(ValueError):
+        StandInClient().ns('marketplace')
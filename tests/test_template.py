@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from connect.devops_testing.template import MappedObject, MappedTemplate
+
+REQUEST = {
+    'id': 'PR-001',
+    'type': 'purchase',
+    'note': 'braces { and [ with "quotes", commas: inside',
+    'asset': {
+        'id': 'AS-001',
+        'product': {'id': 'PRD-001'},
+        'params': [{'id': 'PARAM_1', 'value': '{"json": [1, 2]}'}],
+    },
+    'count': 2,
+    'empty': {},
+    'missing': None,
+}
+
+
+@pytest.fixture
+def template(tmp_path):
+    path = tmp_path / 'request.json'
+    path.write_text(json.dumps(REQUEST, indent=4))
+    template = MappedTemplate(str(path))
+    yield template
+    template.close()
+
+
+def test_mapped_template_should_provide_lazy_read_only_views(template):
+    assert list(template) == list(REQUEST)
+    assert len(template) == len(REQUEST)
+    assert template['id'] == 'PR-001'
+    assert template['note'] == REQUEST['note']
+    assert template['count'] == 2
+    assert template['missing'] is None
+    assert isinstance(template['asset'], MappedObject)
+    assert template['asset']['product']['id'] == 'PRD-001'
+    assert template['asset']['params'] == REQUEST['asset']['params']
+    assert dict(template['empty']) == {}
+    assert template.materialize() == REQUEST
+
+    assert template['asset']._index is template._index
+
+    template['asset']['params'][0]['value'] = 'changed'
+
+    assert template['asset']['params'] == REQUEST['asset']['params']
+
+    with pytest.raises(KeyError):
+        template['unknown']
+
+
+@pytest.mark.parametrize('content', ['', '  [1, 2]'])
+def test_mapped_template_should_fail_on_non_object_file(tmp_path, content):
+    path = tmp_path / 'request.json'
+    path.write_text(content)
+
+    with pytest.raises(ValueError):
+        MappedTemplate(str(path))
+
+
+def test_mapped_template_should_index_the_buffer_once(template, mocker):
+    scan = mocker.spy(template._index, '_scan')
+
+    assert template['asset']['product']['id'] == 'PRD-001'
+    assert list(template['asset']) == list(REQUEST['asset'])
+    assert len(template['empty']) == 0
+    assert scan.call_count == 1
+
+
+def test_mapped_template_should_be_released_on_close(tmp_path):
+    path = tmp_path / 'request.json'
+    path.write_text(json.dumps(REQUEST))
+
+    with MappedTemplate(str(path)) as template:
+        assert not template.closed
+
+    assert template.closed